@@ -0,0 +1,56 @@
+"""
+Compara el Simplex tabular con el método de punto interior en problemas densos
+aleatorios de distintos tamaños.
+
+Uso:
+    python -m benchmarks.bench_punto_interior [--tamanos 50 100 200] [--repeticiones 3]
+"""
+import argparse
+import time
+
+from benchmarks.generadores import lp_denso_aleatorio
+from services.simplex_service import resolver_simplex_tabular
+from services.punto_interior import resolver_punto_interior
+
+
+def _medir(funcion, problema, repeticiones, **kwargs):
+    mejor = float("inf")
+    resultado = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion(
+            problema["problem_type"],
+            problema["C"],
+            problema["LI"],
+            problema["LD"],
+            list(problema["O"]),
+            **kwargs
+        )
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[25, 50, 100, 200])
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'m x n':>11} | {'metodo':<24} | {'tiempo (s)':>10} | {'status':<22} | valor")
+    print("-" * 90)
+    for n in args.tamanos:
+        problema = lp_denso_aleatorio(n, n, semilla=args.semilla)
+        corridas = [
+            ("simplex tabular", resolver_simplex_tabular, {}),
+            ("punto interior", resolver_punto_interior, {"crossover": False}),
+            ("punto interior+crossover", resolver_punto_interior, {"crossover": True}),
+        ]
+        for nombre, funcion, kwargs in corridas:
+            tiempo, res = _medir(funcion, problema, args.repeticiones, **kwargs)
+            valor = res["solucion"]["valor_optimo"] if res.get("solucion") else None
+            print(f"{n:>5} x {n:<5}| {nombre:<24} | {tiempo:>10.4f} | {res['status']:<22} | {valor}")
+
+
+if __name__ == "__main__":
+    main()
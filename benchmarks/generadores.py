@@ -0,0 +1,84 @@
+"""Generadores reproducibles (con semilla) de problemas de Programación Lineal."""
+import numpy as np
+from typing import Dict, Any, Callable
+
+
+def _problema(problem_type: str, c: np.ndarray, A: np.ndarray, b: np.ndarray, O) -> Dict[str, Any]:
+    return {
+        "problem_type": problem_type,
+        "C": c.tolist(),
+        "LI": A.tolist(),
+        "LD": b.tolist(),
+        "O": list(O),
+    }
+
+
+def lp_denso_aleatorio(num_restricciones: int, num_vars: int, semilla: int = 0) -> Dict[str, Any]:
+    """
+    Problema de maximización denso, factible y acotado:
+        max c^T x  s.a.  A x <= b, x >= 0  con A > 0 y b > 0.
+    """
+    rng = np.random.default_rng(semilla)
+    A = rng.uniform(0.1, 1.0, (num_restricciones, num_vars))
+    b = rng.uniform(1.0, 10.0, num_restricciones)
+    c = rng.uniform(1.0, 5.0, num_vars)
+    return _problema("maximization", c, A, b, ["<="] * num_restricciones)
+
+
+def lp_disperso_aleatorio(
+    num_restricciones: int,
+    num_vars: int,
+    semilla: int = 0,
+    densidad: float = 0.1
+) -> Dict[str, Any]:
+    """
+    Como `lp_denso_aleatorio` pero con una fracción `densidad` de coeficientes no
+    nulos; cada columna conserva al menos uno para que el problema siga acotado.
+    """
+    rng = np.random.default_rng(semilla)
+    A = rng.uniform(0.1, 1.0, (num_restricciones, num_vars))
+    A *= rng.random((num_restricciones, num_vars)) < densidad
+    filas = rng.integers(0, num_restricciones, num_vars)
+    A[filas, np.arange(num_vars)] = rng.uniform(0.1, 1.0, num_vars)
+    b = rng.uniform(1.0, 10.0, num_restricciones)
+    c = rng.uniform(1.0, 5.0, num_vars)
+    return _problema("maximization", c, A, b, ["<="] * num_restricciones)
+
+
+def lp_degenerado(num_restricciones: int, num_vars: int, semilla: int = 0) -> Dict[str, Any]:
+    """
+    Coeficientes enteros pequeños y el mismo LD en todas las filas: el test de
+    razón mínima empata a menudo y aparecen pivoteos degenerados.
+    """
+    rng = np.random.default_rng(semilla)
+    A = rng.integers(1, 4, (num_restricciones, num_vars)).astype(float)
+    b = np.full(num_restricciones, 12.0)
+    c = rng.integers(1, 4, num_vars).astype(float)
+    return _problema("maximization", c, A, b, ["<="] * num_restricciones)
+
+
+def lp_infactible(num_restricciones: int, num_vars: int, semilla: int = 0) -> Dict[str, Any]:
+    """Problema denso acotado al que se agrega una fila >= inalcanzable."""
+    problema = lp_denso_aleatorio(num_restricciones - 1, num_vars, semilla)
+    # Con A >= 0.1 y b <= 10 cada variable queda por debajo de 100
+    problema["LI"].append([1.0] * num_vars)
+    problema["LD"].append(1000.0 * num_vars)
+    problema["O"].append(">=")
+    return problema
+
+
+def lp_no_acotado(num_restricciones: int, num_vars: int, semilla: int = 0) -> Dict[str, Any]:
+    """Problema denso donde la columna de x1 no tiene coeficientes positivos."""
+    problema = lp_denso_aleatorio(num_restricciones, num_vars, semilla)
+    for fila in problema["LI"]:
+        fila[0] = -abs(fila[0])
+    return problema
+
+
+GENERADORES: Dict[str, Callable[..., Dict[str, Any]]] = {
+    "denso": lp_denso_aleatorio,
+    "disperso": lp_disperso_aleatorio,
+    "degenerado": lp_degenerado,
+    "infactible": lp_infactible,
+    "no_acotado": lp_no_acotado,
+}
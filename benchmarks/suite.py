@@ -0,0 +1,303 @@
+"""
+Suite de benchmarks reproducible del solver y de los endpoints.
+
+Mide, sobre problemas generados con semilla (ver `benchmarks.generadores`):
+- `resolver_simplex_tabular` por etapas: estandarización, Fase 1, Fase 2
+  (pivoteo) y `_formatear_tableau`.
+- `generar_grafico_2d`.
+- Carga de los endpoints de FastAPI con un cliente en proceso.
+
+Uso:
+    python -m benchmarks.suite --guardar benchmarks/baseline.json
+    python -m benchmarks.suite --comparar benchmarks/baseline.json --umbral 0.25
+
+En modo comparación el proceso termina con código 1 si alguna métrica empeora
+más que el umbral relativo respecto de la línea base, o si algún caso termina
+con otro status (p. ej. deja de llegar al óptimo por el límite de iteraciones).
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Any, List, Iterator, Tuple
+
+import numpy as np
+
+from benchmarks.generadores import GENERADORES
+from services import simplex_service
+
+TAMANOS_POR_DEFECTO = [10, 40, 80]
+
+Metricas = Dict[str, float]
+
+# Status con los que la resolución terminó; el resto (límite de iteraciones)
+# mide una corrida truncada
+STATUS_FINALES = ("optimo", "infactible", "no acotado")
+
+
+@contextmanager
+def _instrumentar(tiempos: Dict[str, float]) -> Iterator[None]:
+    """
+    Reemplaza temporalmente las funciones internas del solver por versiones que
+    acumulan su tiempo en `tiempos` ('fase_0', 'fase_1', 'fase_2', 'formateo').
+    """
+    iterar_original = simplex_service._ejecutar_iteraciones_simplex
+    formatear_original = simplex_service._formatear_tableau
+
+    def iterar(*args, **kwargs):
+        inicio = time.perf_counter()
+        try:
+            return iterar_original(*args, **kwargs)
+        finally:
+            fase = kwargs.get("fase", args[3] if len(args) > 3 else 0)
+            clave = f"fase_{fase}"
+            tiempos[clave] = tiempos.get(clave, 0.0) + time.perf_counter() - inicio
+
+    def formatear(*args, **kwargs):
+        inicio = time.perf_counter()
+        try:
+            return formatear_original(*args, **kwargs)
+        finally:
+            tiempos["formateo"] = tiempos.get("formateo", 0.0) + time.perf_counter() - inicio
+
+    simplex_service._ejecutar_iteraciones_simplex = iterar
+    simplex_service._formatear_tableau = formatear
+    try:
+        yield
+    finally:
+        simplex_service._ejecutar_iteraciones_simplex = iterar_original
+        simplex_service._formatear_tableau = formatear_original
+
+
+def medir_solver(problema: Dict[str, Any], repeticiones: int = 3) -> Tuple[Metricas, str]:
+    """
+    Mejor tiempo (de `repeticiones`) de cada etapa del Simplex tabular y el
+    status de la resolución, para distinguir corridas truncadas por el límite
+    de iteraciones.
+    """
+    mejores: Metricas = {}
+    for _ in range(repeticiones):
+        tiempos: Dict[str, float] = {}
+        with _instrumentar(tiempos):
+            inicio = time.perf_counter()
+            resultado = simplex_service.resolver_simplex_tabular(
+                problema["problem_type"],
+                problema["C"],
+                problema["LI"],
+                problema["LD"],
+                list(problema["O"]),
+            )
+            total = time.perf_counter() - inicio
+
+        fases = sum(v for k, v in tiempos.items() if k.startswith("fase_"))
+        corrida = {
+            "total": total,
+            "estandarizacion": total - fases,
+            # Fase única (problemas sin artificiales) se reporta como Fase 2
+            "fase_1": tiempos.get("fase_1", 0.0),
+            "fase_2": tiempos.get("fase_2", 0.0) + tiempos.get("fase_0", 0.0),
+            "formateo": tiempos.get("formateo", 0.0),
+        }
+        corrida["pivoteo"] = corrida["fase_1"] + corrida["fase_2"] - corrida["formateo"]
+        for clave, valor in corrida.items():
+            mejores[clave] = min(valor, mejores.get(clave, float("inf")))
+    return mejores, resultado["status"]
+
+
+def medir_grafico(repeticiones: int = 3) -> Metricas:
+    """Tiempo de `generar_grafico_2d` (PNG en memoria) para un problema de 2 variables."""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        simplex_service.generar_grafico_2d(
+            [3, 5], [[1, 0], [0, 2], [3, 2]], [4, 12, 18], mark_point=(2.0, 6.0)
+        )
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return {"total": mejor}
+
+
+def medir_endpoints(
+    problema: Dict[str, Any],
+    solicitudes: int = 50,
+    concurrencia: int = 4
+) -> Dict[str, Metricas]:
+    """
+    Prueba de carga en proceso (TestClient) de los endpoints: latencias p50/p95
+    y throughput con `concurrencia` hilos clientes.
+    """
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from routers.simplex import router
+
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    endpoints = {
+        "solve_tabular": ("/simplex/solve-tabular", problema),
+        "generate_graph_html": ("/simplex/generate-graph-html", {
+            "problem_type": "maximization",
+            "C": [3, 5],
+            "LI": [[1, 0], [0, 2], [3, 2]],
+            "LD": [4, 12, 18],
+            "O": ["<=", "<=", "<="],
+        }),
+    }
+
+    resultados: Dict[str, Metricas] = {}
+    for nombre, (ruta, payload) in endpoints.items():
+        def _una_solicitud(_: int) -> float:
+            inicio = time.perf_counter()
+            respuesta = client.post(ruta, json=payload)
+            respuesta.raise_for_status()
+            return time.perf_counter() - inicio
+
+        _una_solicitud(0)  # calentamiento
+        inicio = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrencia) as pool:
+            latencias = sorted(pool.map(_una_solicitud, range(solicitudes)))
+        duracion = time.perf_counter() - inicio
+
+        resultados[nombre] = {
+            "p50": statistics.median(latencias),
+            "p95": latencias[min(len(latencias) - 1, int(0.95 * len(latencias)))],
+            # Se guarda el tiempo por solicitud para que "mayor" sea "peor"
+            "segundos_por_solicitud": duracion / solicitudes,
+        }
+    return resultados
+
+
+def ejecutar_suite(
+    tamanos: List[int] = TAMANOS_POR_DEFECTO,
+    semilla: int = 0,
+    repeticiones: int = 3,
+    solicitudes: int = 50,
+    concurrencia: int = 4
+) -> Dict[str, Any]:
+    """
+    Ejecuta toda la suite y retorna un diccionario serializable a JSON, con las
+    métricas de cada caso en 'casos' y el status de los casos del solver en
+    'estados'.
+    """
+    casos: Dict[str, Metricas] = {}
+    estados: Dict[str, str] = {}
+    for tipo, generador in GENERADORES.items():
+        for n in tamanos:
+            problema = generador(n, n, semilla=semilla)
+            caso = f"solver/{tipo}/{n}x{n}"
+            casos[caso], estados[caso] = medir_solver(problema, repeticiones)
+
+    casos["grafico/2d"] = medir_grafico(repeticiones)
+
+    problema_endpoint = GENERADORES["denso"](tamanos[0], tamanos[0], semilla=semilla)
+    for nombre, metricas in medir_endpoints(problema_endpoint, solicitudes, concurrencia).items():
+        casos[f"endpoint/{nombre}"] = metricas
+
+    return {
+        "metadata": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "plataforma": platform.platform(),
+            "semilla": semilla,
+            "tamanos": list(tamanos),
+            "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "casos": casos,
+        "estados": estados,
+    }
+
+
+def comparar(
+    actual: Dict[str, Any],
+    base: Dict[str, Any],
+    umbral: float = 0.25,
+    minimo: float = 1e-4
+) -> List[Dict[str, Any]]:
+    """
+    Compara dos ejecuciones y retorna las regresiones: casos cuyo status cambió
+    (metrica 'status', sin 'cambio') y métricas cuyo tiempo creció más que
+    `umbral` (relativo). Se ignoran tiempos base menores a `minimo` segundos,
+    dominados por ruido.
+    """
+    regresiones = []
+    for caso, status_base in base.get("estados", {}).items():
+        status = actual.get("estados", {}).get(caso)
+        if status is not None and status != status_base:
+            regresiones.append({
+                "caso": caso,
+                "metrica": "status",
+                "base": status_base,
+                "actual": status,
+                "cambio": None,
+            })
+    for caso, metricas_base in base.get("casos", {}).items():
+        metricas_actual = actual.get("casos", {}).get(caso)
+        if metricas_actual is None:
+            continue
+        for metrica, valor_base in metricas_base.items():
+            valor = metricas_actual.get(metrica)
+            if valor is None or valor_base < minimo:
+                continue
+            cambio = (valor - valor_base) / valor_base
+            if cambio > umbral:
+                regresiones.append({
+                    "caso": caso,
+                    "metrica": metrica,
+                    "base": valor_base,
+                    "actual": valor,
+                    "cambio": cambio,
+                })
+    return regresiones
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Suite de benchmarks del solver Simplex.")
+    parser.add_argument("--tamanos", type=int, nargs="+", default=TAMANOS_POR_DEFECTO)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--solicitudes", type=int, default=50)
+    parser.add_argument("--concurrencia", type=int, default=4)
+    parser.add_argument("--guardar", help="Ruta donde guardar los resultados como JSON")
+    parser.add_argument("--comparar", help="Línea base JSON contra la cual comparar")
+    parser.add_argument("--umbral", type=float, default=0.25,
+                        help="Empeoramiento relativo tolerado (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    resultados = ejecutar_suite(
+        args.tamanos, args.semilla, args.repeticiones, args.solicitudes, args.concurrencia
+    )
+
+    for caso, metricas in resultados["casos"].items():
+        detalle = ", ".join(f"{k}={v * 1000:.2f}ms" for k, v in metricas.items())
+        status = resultados["estados"].get(caso)
+        if status is not None and status not in STATUS_FINALES:
+            detalle += f" [sin terminar: {status}]"
+        print(f"{caso:<32} {detalle}")
+
+    if args.guardar:
+        with open(args.guardar, "w", encoding="utf-8") as f:
+            json.dump(resultados, f, indent=2)
+        print(f"\nResultados guardados en {args.guardar}")
+
+    if args.comparar:
+        with open(args.comparar, "r", encoding="utf-8") as f:
+            base = json.load(f)
+        regresiones = comparar(resultados, base, args.umbral)
+        if regresiones:
+            print(f"\n{len(regresiones)} regresiones (umbral {args.umbral:.0%}):")
+            for r in regresiones:
+                if r["cambio"] is None:
+                    print(f"  {r['caso']} [status]: {r['base']} -> {r['actual']}")
+                else:
+                    print(f"  {r['caso']} [{r['metrica']}]: {r['base'] * 1000:.2f}ms -> "
+                          f"{r['actual'] * 1000:.2f}ms ({r['cambio']:+.0%})")
+            sys.exit(1)
+        print("\nSin regresiones respecto de la línea base.")
+
+
+if __name__ == "__main__":
+    main()
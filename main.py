@@ -1,8 +1,10 @@
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
-from routers import router 
+from routers import router, frontend_router, perfilado_router, MiddlewarePerfilado, perfilado_habilitado
+from routers import MiddlewareLimiteCuerpo
+from routers.simplex import MAX_UPLOAD_BYTES
+import routers.simplex as rutas_simplex
+from contextlib import asynccontextmanager
 import logging
 from fastapi.exceptions import RequestValidationError
 
@@ -15,30 +17,16 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 logger.info("Iniciando aplicación FastAPI...")
 
-app = FastAPI()
 
-app.mount("/static", StaticFiles(directory="frontend/static"), name="static")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # El pool de procesos de admisión se crea bajo demanda: cerrarlo al apagar
+    # (o recargar) para no dejar procesos huérfanos
+    rutas_simplex.ADMISION.cerrar()
 
-@app.get("/", response_class=HTMLResponse)
-async def get_html():
-    try:
-        with open("frontend/templates/index.html", "r", encoding="utf-8") as f:
-            logger.info("Cargando página principal: index.html")
-            return HTMLResponse(content=f.read(), status_code=200)
-    except Exception as e:
-        logger.exception("Error cargando index.html")
-        return HTMLResponse(content=f"<h1>Error interno: {e}</h1>", status_code=500)
 
-
-@app.get("/tablas", response_class=HTMLResponse)
-async def get_tablas_html():
-    try:
-        with open("frontend/templates/tablas.html", "r", encoding="utf-8") as f:
-            logger.info("Cargando página de tablas: tablas.html")
-            return HTMLResponse(content=f.read(), status_code=200)
-    except Exception as e:
-        logger.exception("Error cargando tablas.html")
-        return HTMLResponse(content=f"<h1>Error interno: {e}</h1>", status_code=500)
+app = FastAPI(lifespan=lifespan)
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -48,5 +36,16 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         content={"detail": "Datos de entrada inválidos. Verifica el formato del JSON."},
     )
 app.include_router(router)
+# Los modelos subidos demasiado grandes se rechazan antes de recibir el cuerpo
+# (con margen para los encabezados y campos del formulario multipart)
+app.add_middleware(
+    MiddlewareLimiteCuerpo, rutas={"/simplex/upload-model"}, max_bytes=MAX_UPLOAD_BYTES + 64 * 1024
+)
+# Páginas y estáticos servidos desde memoria (precomprimidos, con ETag)
+app.include_router(frontend_router)
+# Perfilado bajo demanda: solo se registra si hay tokens en SIMPLEX_PERFIL_TOKENS
+if perfilado_habilitado():
+    app.add_middleware(MiddlewarePerfilado)
+    app.include_router(perfilado_router)
 
 logger.info("Aplicación lista. Servidor iniciado correctamente.")
\ No newline at end of file
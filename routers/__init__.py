@@ -1 +1,4 @@
-from .simplex import router
\ No newline at end of file
+from .simplex import router
+from .frontend import router as frontend_router
+from .perfilado import router as perfilado_router, MiddlewarePerfilado, perfilado_habilitado
+from .admision import MiddlewareLimiteCuerpo
@@ -0,0 +1,210 @@
+from fastapi import HTTPException, Request
+from fastapi.responses import JSONResponse
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, Iterable, List, Optional
+import asyncio
+import functools
+import logging
+import os
+import numpy as np
+
+from routers.perfilado import PERFIL_ACTIVO
+
+logger = logging.getLogger(__name__)
+
+# Pivoteos como máximo por fase en `_ejecutar_iteraciones_simplex`
+MAX_PIVOTEOS_POR_FASE = 50
+# Formatear una tabla (objetos de Python) cuesta ~10 veces más que pivotearla
+FACTOR_TABLAS = 10
+# Branch and Bound reoptimiza un tableau por nodo
+FACTOR_ENTEROS = 20
+
+
+def estimar_costo(
+    filas: int,
+    columnas: int,
+    no_ceros: int,
+    incluir_tablas: bool = True,
+    enteros: bool = False,
+    iis: bool = False
+) -> float:
+    """
+    Estimación del trabajo de una resolución, en celdas de tableau procesadas.
+
+    El tableau tiene a lo sumo filas + 2 filas y columnas + 2*filas + 1 columnas
+    (holgura/exceso y artificial por restricción); cada pivoteo recorre todas sus
+    celdas y el Simplex hace del orden de 2*filas pivoteos, con tope por fase.
+    Formatear el historial de tablas multiplica el costo por FACTOR_TABLAS.
+    Buscar un IIS agrega hasta una Fase 1 por restricción.
+    """
+    celdas = (filas + 2) * (columnas + 2 * filas + 1)
+    pivoteos = min(2 * filas + 1, 2 * MAX_PIVOTEOS_POR_FASE)
+    costo = float(pivoteos * celdas + no_ceros)
+    if incluir_tablas:
+        costo *= FACTOR_TABLAS
+    if enteros:
+        costo *= FACTOR_ENTEROS
+    if iis:
+        costo *= filas + 1
+    return costo
+
+
+def contar_no_ceros(LI: List[List[float]]) -> int:
+    return int(np.count_nonzero(np.asarray(LI, dtype=float)))
+
+
+def identificar_cliente(request: Request) -> str:
+    """
+    Cliente para las cuotas: la dirección del par de la conexión. No se usan
+    cabeceras que el cliente pueda elegir libremente; detrás de un proxy inverso,
+    uvicorn la toma de X-Forwarded-For solo si el proxy figura en
+    --forwarded-allow-ips.
+    """
+    return request.client.host if request.client else "desconocido"
+
+
+class ControlAdmision:
+    """
+    Admisión y enrutamiento de resoluciones según su costo estimado.
+
+    - costo <= costo_inline: se resuelve en el event loop (latencia mínima).
+    - costo <= costo_maximo: se envía a un pool de procesos, con a lo sumo
+      max_en_pool resoluciones pendientes (si no, 429).
+    - costo > costo_maximo: se rechaza con 413 antes de resolver.
+
+    Además cada cliente puede tener a lo sumo max_por_cliente resoluciones en
+    curso (429 con Retry-After al excederlo).
+
+    Los contadores y el pool son de cada proceso: con N workers de uvicorn los
+    límites efectivos (por cliente y en el pool) son N veces los configurados.
+    """
+
+    def __init__(
+        self,
+        costo_inline: float = 5e6,
+        costo_maximo: float = 5e10,
+        max_por_cliente: int = 4,
+        max_en_pool: int = 16,
+        workers: Optional[int] = None
+    ):
+        self.costo_inline = costo_inline
+        self.costo_maximo = costo_maximo
+        self.max_por_cliente = max_por_cliente
+        self.max_en_pool = max_en_pool
+        self.workers = workers
+        self._en_curso: Dict[str, int] = {}
+        self._en_pool = 0
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @classmethod
+    def desde_entorno(cls) -> "ControlAdmision":
+        """
+        Configuración por variables de entorno: SIMPLEX_COSTO_INLINE,
+        SIMPLEX_COSTO_MAX, SIMPLEX_MAX_POR_CLIENTE, SIMPLEX_MAX_EN_POOL y
+        SIMPLEX_POOL_WORKERS (por defecto, la cantidad de CPUs).
+        """
+        workers = os.getenv("SIMPLEX_POOL_WORKERS")
+        return cls(
+            costo_inline=float(os.getenv("SIMPLEX_COSTO_INLINE", "5e6")),
+            costo_maximo=float(os.getenv("SIMPLEX_COSTO_MAX", "5e10")),
+            max_por_cliente=int(os.getenv("SIMPLEX_MAX_POR_CLIENTE", "4")),
+            max_en_pool=int(os.getenv("SIMPLEX_MAX_EN_POOL", "16")),
+            workers=int(workers) if workers else None,
+        )
+
+    def verificar_costo(self, costo: float) -> None:
+        if costo > self.costo_maximo:
+            raise HTTPException(
+                status_code=413,
+                detail="El problema excede el tamaño máximo admitido por el servidor.",
+            )
+
+    @asynccontextmanager
+    async def cupo(self, cliente: str):
+        """Reserva una de las resoluciones concurrentes del cliente."""
+        en_curso = self._en_curso.get(cliente, 0)
+        if en_curso >= self.max_por_cliente:
+            raise HTTPException(
+                status_code=429,
+                detail="Demasiadas resoluciones en curso para este cliente. Intente nuevamente.",
+                headers={"Retry-After": "1"},
+            )
+        self._en_curso[cliente] = en_curso + 1
+        try:
+            yield
+        finally:
+            restantes = self._en_curso[cliente] - 1
+            if restantes:
+                self._en_curso[cliente] = restantes
+            else:
+                del self._en_curso[cliente]
+
+    def _obtener_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    async def ejecutar(self, costo: float, funcion: Callable[..., Any], *args: Any) -> Any:
+        """
+        Ejecuta `funcion(*args)` en línea o en el pool de procesos según `costo`.
+        Las solicitudes perfiladas se resuelven en línea para que el muestreo las vea.
+        """
+        if costo <= self.costo_inline or PERFIL_ACTIVO.get():
+            return funcion(*args)
+
+        if self._en_pool >= self.max_en_pool:
+            raise HTTPException(
+                status_code=429,
+                detail="El servidor está resolviendo demasiados problemas grandes. Intente nuevamente.",
+                headers={"Retry-After": "5"},
+            )
+        self._en_pool += 1
+        try:
+            logger.info(f"Resolución enviada al pool de procesos (costo estimado {costo:.3g})")
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._obtener_pool(), functools.partial(funcion, *args))
+        finally:
+            self._en_pool -= 1
+
+    def cerrar(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+
+class MiddlewareLimiteCuerpo:
+    """
+    Middleware ASGI que rechaza con 413 los cuerpos de más de `max_bytes` en las
+    rutas dadas antes de que Starlette los reciba y parsee: por Content-Length si
+    viene, o cortando la lectura al superarlo (cuerpos chunked).
+    """
+
+    def __init__(self, app, rutas: Iterable[str], max_bytes: int):
+        self.app = app
+        self.rutas = set(rutas)
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] not in self.rutas:
+            await self.app(scope, receive, send)
+            return
+
+        detalle = "El archivo excede el tamaño máximo admitido por el servidor."
+        for nombre, valor in scope.get("headers", ()):
+            if nombre == b"content-length" and valor.isdigit() and int(valor) > self.max_bytes:
+                await JSONResponse({"detail": detalle}, status_code=413)(scope, receive, send)
+                return
+
+        recibidos = 0
+
+        async def _recibir():
+            nonlocal recibidos
+            mensaje = await receive()
+            if mensaje["type"] == "http.request":
+                recibidos += len(mensaje.get("body", b""))
+                if recibidos > self.max_bytes:
+                    raise HTTPException(status_code=413, detail=detalle)
+            return mensaje
+
+        await self.app(scope, _recibir, send)
@@ -0,0 +1,117 @@
+from fastapi import APIRouter, Request
+from fastapi.responses import Response, HTMLResponse
+from pathlib import Path
+from typing import Dict, Any
+from routers.respuestas import codificacion_aceptada
+import gzip
+import hashlib
+import logging
+import mimetypes
+
+try:
+    import brotli
+except ImportError:  # dependencia del proyecto; sin ella solo se ofrece gzip
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["Frontend"])
+
+FRONTEND_DIR = Path(__file__).resolve().parent.parent / "frontend"
+
+PAGINAS = {
+    "/": "templates/index.html",
+    "/tablas": "templates/tablas.html",
+}
+
+
+def _precomprimir(contenido: bytes, media_type: str) -> Dict[str, Any]:
+    """Arma la entrada en memoria de un recurso con sus variantes comprimidas y su ETag."""
+    variantes = {"gzip": gzip.compress(contenido, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variantes["br"] = brotli.compress(contenido, quality=11)
+    return {
+        "contenido": contenido,
+        "variantes": variantes,
+        "media_type": media_type,
+        "etag": '"' + hashlib.sha256(contenido).hexdigest()[:32] + '"',
+    }
+
+
+def cargar_recursos(directorio: Path = FRONTEND_DIR) -> Dict[str, Dict[str, Any]]:
+    """
+    Lee una sola vez las páginas y los archivos estáticos del frontend y los deja
+    en memoria, indexados por la ruta URL con la que se sirven.
+    """
+    recursos: Dict[str, Dict[str, Any]] = {}
+    for ruta_url, archivo in PAGINAS.items():
+        try:
+            recursos[ruta_url] = _precomprimir(
+                (directorio / archivo).read_bytes(), "text/html; charset=utf-8"
+            )
+        except OSError:
+            logger.exception(f"Error cargando {archivo}")
+
+    estaticos = directorio / "static"
+    if estaticos.is_dir():
+        for archivo in sorted(estaticos.rglob("*")):
+            if archivo.is_file():
+                media_type = mimetypes.guess_type(archivo.name)[0] or "application/octet-stream"
+                if media_type.startswith("text/") or media_type.endswith("javascript"):
+                    media_type += "; charset=utf-8"
+                ruta_url = "/static/" + archivo.relative_to(estaticos).as_posix()
+                recursos[ruta_url] = _precomprimir(archivo.read_bytes(), media_type)
+
+    logger.info(f"Frontend cargado en memoria: {len(recursos)} recursos")
+    return recursos
+
+
+RECURSOS = cargar_recursos()
+
+
+def servir_recurso(request: Request, recurso: Dict[str, Any]) -> Response:
+    """Responde desde memoria con ETag (304 si no cambió) y la variante comprimida adecuada."""
+    headers = {
+        "ETag": recurso["etag"],
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+    }
+    if_none_match = request.headers.get("if-none-match", "")
+    if recurso["etag"] in [etag.strip() for etag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+
+    codificacion = codificacion_aceptada(
+        request.headers.get("accept-encoding", ""),
+        [c for c in ("br", "gzip") if c in recurso["variantes"]],
+    )
+    if codificacion is None:
+        return Response(recurso["contenido"], media_type=recurso["media_type"], headers=headers)
+    headers["Content-Encoding"] = codificacion
+    return Response(
+        recurso["variantes"][codificacion], media_type=recurso["media_type"], headers=headers
+    )
+
+
+def _pagina(ruta_url: str, request: Request) -> Response:
+    recurso = RECURSOS.get(ruta_url)
+    if recurso is None:
+        return HTMLResponse(content=f"<h1>Error interno: no se pudo cargar {PAGINAS[ruta_url]}</h1>", status_code=500)
+    return servir_recurso(request, recurso)
+
+
+@router.get("/", response_class=HTMLResponse)
+async def get_html(request: Request):
+    return _pagina("/", request)
+
+
+@router.get("/tablas", response_class=HTMLResponse)
+async def get_tablas_html(request: Request):
+    return _pagina("/tablas", request)
+
+
+@router.get("/static/{ruta:path}", include_in_schema=False)
+async def get_static(ruta: str, request: Request):
+    recurso = RECURSOS.get("/static/" + ruta)
+    if recurso is None:
+        return Response(status_code=404)
+    return servir_recurso(request, recurso)
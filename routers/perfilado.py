@@ -0,0 +1,283 @@
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import PlainTextResponse
+from collections import Counter, OrderedDict
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+import hmac
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# Tokens de administrador habilitados (separados por coma); sin tokens no hay perfilado
+TOKENS_PERFIL = {t.strip() for t in os.getenv("SIMPLEX_PERFIL_TOKENS", "").split(",") if t.strip()}
+INTERVALO_PERFIL_S = float(os.getenv("SIMPLEX_PERFIL_INTERVALO_MS", "5")) / 1000
+# Perfiles conservados para su descarga (los más antiguos se descartan)
+MAX_PERFILES = 32
+# Con SIMPLEX_STORE_DIR los perfiles se escriben en disco y cualquier worker los
+# sirve; sin él quedan en la memoria del proceso, que debe ser el único worker
+_DIR_ALMACEN = os.getenv("SIMPLEX_STORE_DIR")
+DIR_PERFILES = os.path.join(_DIR_ALMACEN, "perfiles") if _DIR_ALMACEN else None
+
+# True mientras se atiende una solicitud perfilada (p. ej. para no enviarla al pool)
+PERFIL_ACTIVO: ContextVar[bool] = ContextVar("perfil_activo", default=False)
+
+PERFILES: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+# Solicitudes HTTP en curso en este worker y, por perfil activo, cuántas otras
+# se solaparon con él (solo se modifican desde el event loop: sin locks)
+_EN_CURSO = 0
+_SOLAPADAS: Dict[str, int] = {}
+
+
+def perfilado_habilitado() -> bool:
+    return bool(TOKENS_PERFIL)
+
+
+def _token_valido(token: Optional[str]) -> bool:
+    return bool(token) and any(hmac.compare_digest(token, t) for t in TOKENS_PERFIL)
+
+
+def _ruta_perfil(id_perfil: str) -> Optional[str]:
+    # Solo ids generados por el middleware: nada de rutas arbitrarias
+    if DIR_PERFILES is None or not re.fullmatch(r"[0-9a-f]{32}", id_perfil):
+        return None
+    return os.path.join(DIR_PERFILES, f"{id_perfil}.json")
+
+
+def guardar_perfil(id_perfil: str, perfil: Dict[str, Any]) -> None:
+    """Conserva un perfil en memoria y, si hay directorio compartido, en disco."""
+    PERFILES[id_perfil] = perfil
+    while len(PERFILES) > MAX_PERFILES:
+        PERFILES.popitem(last=False)
+
+    ruta = _ruta_perfil(id_perfil)
+    if ruta is None:
+        return
+    datos = dict(perfil, pilas=[[list(map(list, pila)), cuenta] for pila, cuenta in perfil["pilas"].items()])
+    try:
+        os.makedirs(DIR_PERFILES, exist_ok=True)
+        # Escritura atómica: otro worker nunca lee un perfil a medio escribir
+        with open(ruta + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(datos, f)
+        os.replace(ruta + ".tmp", ruta)
+        archivos = sorted(
+            (os.path.join(DIR_PERFILES, a) for a in os.listdir(DIR_PERFILES) if a.endswith(".json")),
+            key=os.path.getmtime,
+        )
+        for anterior in archivos[:-MAX_PERFILES]:
+            os.remove(anterior)
+    except OSError:
+        logger.warning(f"No se pudo guardar el perfil {id_perfil} en disco", exc_info=True)
+
+
+def obtener_perfil(id_perfil: str) -> Optional[Dict[str, Any]]:
+    """Perfil de este proceso o, si no está, el escrito en disco por otro worker."""
+    perfil = PERFILES.get(id_perfil)
+    ruta = _ruta_perfil(id_perfil)
+    if perfil is not None or ruta is None:
+        return perfil
+    try:
+        with open(ruta, "r", encoding="utf-8") as f:
+            datos = json.load(f)
+    except (OSError, ValueError):
+        return None
+    datos["pilas"] = Counter({tuple(tuple(marco) for marco in pila): cuenta for pila, cuenta in datos["pilas"]})
+    return datos
+
+
+def _marco(frame) -> Tuple[str, str, int]:
+    codigo = frame.f_code
+    return codigo.co_name, codigo.co_filename, codigo.co_firstlineno
+
+
+class MuestreadorPila:
+    """
+    Perfilador por muestreo de un único hilo: cada `intervalo` segundos toma su
+    pila con `sys._current_frames()` desde un hilo aparte (sin instrumentar el
+    código perfilado) y cuenta las pilas repetidas.
+    """
+
+    def __init__(self, id_hilo: int, intervalo: float = INTERVALO_PERFIL_S):
+        self.id_hilo = id_hilo
+        self.intervalo = intervalo
+        self.pilas: Counter = Counter()
+        self._detener = threading.Event()
+        self._hilo = threading.Thread(target=self._muestrear, name="simplex-perfil", daemon=True)
+
+    def _muestrear(self) -> None:
+        while not self._detener.wait(self.intervalo):
+            frame = sys._current_frames().get(self.id_hilo)
+            pila = []
+            while frame is not None:
+                pila.append(_marco(frame))
+                frame = frame.f_back
+            if pila:
+                self.pilas[tuple(reversed(pila))] += 1
+
+    def __enter__(self) -> "MuestreadorPila":
+        self._inicio = time.perf_counter()
+        self._hilo.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._detener.set()
+        self._hilo.join()
+        self.duracion = time.perf_counter() - self._inicio
+
+
+def pilas_plegadas(pilas: Counter) -> str:
+    """Formato 'folded' (una pila por línea, marcos separados por ';' y su cuenta),
+    compatible con flamegraph.pl y speedscope."""
+    lineas = []
+    for pila, cuenta in pilas.most_common():
+        marcos = (f"{nombre} ({os.path.basename(archivo)}:{linea})" for nombre, archivo, linea in pila)
+        lineas.append(";".join(m.replace(";", ",") for m in marcos) + f" {cuenta}")
+    return "\n".join(lineas) + "\n"
+
+
+def resumen_funciones(pilas: Counter, limite: int = 50) -> List[Dict[str, Any]]:
+    """Muestras propias (en la cima de la pila) y totales (en cualquier nivel) por función."""
+    propias: Counter = Counter()
+    totales: Counter = Counter()
+    for pila, cuenta in pilas.items():
+        propias[pila[-1]] += cuenta
+        for marco in set(pila):
+            totales[marco] += cuenta
+    muestras = sum(pilas.values()) or 1
+    return [
+        {
+            "funcion": nombre,
+            "archivo": archivo,
+            "linea": linea,
+            "propias": propias[(nombre, archivo, linea)],
+            "totales": total,
+            "porcentaje_propio": round(100 * propias[(nombre, archivo, linea)] / muestras, 2),
+            "porcentaje_total": round(100 * total / muestras, 2),
+        }
+        for (nombre, archivo, linea), total in sorted(
+            totales.items(), key=lambda item: (-propias[item[0]], -item[1])
+        )[:limite]
+    ]
+
+
+class MiddlewarePerfilado:
+    """
+    Middleware ASGI que perfila las solicitudes con cabecera `X-Simplex-Perfil`
+    (o parámetro `perfilar`) igual a un token de SIMPLEX_PERFIL_TOKENS. El id del
+    perfil se devuelve en la cabecera `X-Simplex-Perfil-Id`.
+
+    Se muestrea el hilo del event loop, que es compartido: las muestras incluyen
+    también el trabajo de otras solicitudes atendidas mientras tanto en el mismo
+    worker. El perfil registra cuántas se solaparon (`solicitudes_solapadas`);
+    para un perfil limpio, tómelo sin otra carga.
+
+    Solo se registra si hay tokens configurados; el resto de las solicitudes
+    solo paga la búsqueda de la cabecera y el conteo de solicitudes en curso.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        if DIR_PERFILES is None:
+            logger.warning(
+                "Perfilado sin SIMPLEX_STORE_DIR: cada perfil solo se puede descargar "
+                "del worker que lo tomó; ejecute un único worker."
+            )
+
+    @staticmethod
+    def _token(scope) -> Optional[str]:
+        for nombre, valor in scope.get("headers", ()):
+            if nombre == b"x-simplex-perfil":
+                return valor.decode("latin-1")
+        if b"perfilar=" in scope.get("query_string", b""):
+            valores = parse_qs(scope["query_string"].decode("latin-1")).get("perfilar")
+            return valores[0] if valores else None
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        global _EN_CURSO
+        for id_activo in _SOLAPADAS:
+            _SOLAPADAS[id_activo] += 1
+        _EN_CURSO += 1
+        try:
+            if _token_valido(self._token(scope)):
+                await self._perfilar(scope, receive, send)
+            else:
+                await self.app(scope, receive, send)
+        finally:
+            _EN_CURSO -= 1
+
+    async def _perfilar(self, scope, receive, send):
+        id_perfil = uuid.uuid4().hex
+        # Las ya en curso (sin contar esta) se solapan desde el inicio
+        _SOLAPADAS[id_perfil] = _EN_CURSO - 1
+
+        async def _enviar(mensaje):
+            if mensaje["type"] == "http.response.start":
+                mensaje["headers"] = list(mensaje.get("headers", [])) + [
+                    (b"x-simplex-perfil-id", id_perfil.encode("ascii"))
+                ]
+            await send(mensaje)
+
+        # Se muestrea el hilo del event loop, donde corren validación, resolución
+        # en línea y serialización de esta solicitud (y de las que se solapen)
+        marca = PERFIL_ACTIVO.set(True)
+        try:
+            with MuestreadorPila(threading.get_ident()) as muestreador:
+                await self.app(scope, receive, _enviar)
+        finally:
+            PERFIL_ACTIVO.reset(marca)
+            guardar_perfil(id_perfil, {
+                "ruta": scope.get("path"),
+                "duracion_s": round(muestreador.duracion, 6),
+                "intervalo_ms": muestreador.intervalo * 1000,
+                "solicitudes_solapadas": _SOLAPADAS.pop(id_perfil),
+                "pilas": muestreador.pilas,
+            })
+            logger.info(f"Perfil {id_perfil} de {scope.get('path')}: {sum(muestreador.pilas.values())} muestras")
+
+
+router = APIRouter(prefix="/simplex/perfiles", tags=["Perfilado"])
+
+
+@router.get("/{id_perfil}")
+async def descargar_perfil(id_perfil: str, request: Request, formato: str = "resumen"):
+    """
+    Perfil de una solicitud: 'resumen' (JSON por función) o 'folded' (flame graph).
+    Si `solicitudes_solapadas` > 0, las muestras incluyen trabajo de esas otras
+    solicitudes del mismo worker.
+    """
+    token = request.headers.get("x-simplex-perfil") or request.query_params.get("perfilar")
+    if not _token_valido(token):
+        raise HTTPException(status_code=403, detail="Perfilado no autorizado.")
+    perfil = obtener_perfil(id_perfil)
+    if perfil is None:
+        raise HTTPException(status_code=404, detail="Perfil inexistente o descartado.")
+
+    if formato == "folded":
+        return PlainTextResponse(
+            pilas_plegadas(perfil["pilas"]),
+            headers={"Content-Disposition": f'attachment; filename="perfil-{id_perfil}.folded"'},
+        )
+    if formato != "resumen":
+        raise HTTPException(status_code=400, detail="Formato inválido: use 'resumen' o 'folded'.")
+    return {
+        "id": id_perfil,
+        "ruta": perfil["ruta"],
+        "duracion_s": perfil["duracion_s"],
+        "intervalo_ms": perfil["intervalo_ms"],
+        "muestras": sum(perfil["pilas"].values()),
+        "solicitudes_solapadas": perfil["solicitudes_solapadas"],
+        "funciones": resumen_funciones(perfil["pilas"]),
+    }
@@ -0,0 +1,85 @@
+from fastapi import Request
+from fastapi.responses import Response
+from typing import Any, Iterable, Optional
+import gzip
+import json
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # dependencia del proyecto; sin ella se usa json de la biblioteca estándar
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # dependencia del proyecto; sin ella solo se ofrece gzip
+    zstandard = None
+
+# Por debajo de este tamaño comprimir no compensa (cabe en un par de paquetes)
+UMBRAL_COMPRESION = 1024
+
+
+def codificacion_aceptada(accept_encoding: str, disponibles: Iterable[str]) -> Optional[str]:
+    """
+    Elige la primera codificación de `disponibles` (en orden de preferencia)
+    aceptada por Accept-Encoding, ignorando las de q=0.
+    """
+    aceptadas = set()
+    for parte in accept_encoding.lower().split(","):
+        nombre, _, parametros = parte.strip().partition(";")
+        if parametros.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        aceptadas.add(nombre.strip())
+    for codificacion in disponibles:
+        if codificacion in aceptadas or "*" in aceptadas:
+            return codificacion
+    return None
+
+
+def _por_defecto(valor: Any) -> Any:
+    """Convierte arreglos y escalares de NumPy que el codificador no conoce."""
+    if isinstance(valor, np.ndarray):
+        return valor.tolist()
+    if isinstance(valor, np.generic):
+        return valor.item()
+    raise TypeError(f"Tipo no serializable: {type(valor).__name__}")
+
+
+def serializar_json(contenido: Any) -> bytes:
+    """
+    Codifica a JSON sin pasar por `jsonable_encoder`. Las tablas llegan como
+    listas de Python (cada fila empieza con el nombre de la variable básica), así
+    que la ganancia viene del codificador de orjson; OPT_SERIALIZE_NUMPY solo
+    cubre los arreglos o escalares de NumPy que algún solver deje en la respuesta.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            contenido,
+            default=_por_defecto,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(
+        contenido, default=_por_defecto, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _comprimir(datos: bytes, codificacion: str) -> bytes:
+    if codificacion == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(datos)
+    return gzip.compress(datos, compresslevel=6, mtime=0)
+
+
+def respuesta_json(request: Request, contenido: Any, status_code: int = 200) -> Response:
+    """
+    Respuesta JSON serializada con `serializar_json` y, si supera
+    UMBRAL_COMPRESION, comprimida con zstd o gzip según Accept-Encoding.
+    """
+    cuerpo = serializar_json(contenido)
+    headers = {"Vary": "Accept-Encoding"}
+    if len(cuerpo) >= UMBRAL_COMPRESION:
+        disponibles = ("zstd", "gzip") if zstandard is not None else ("gzip",)
+        codificacion = codificacion_aceptada(request.headers.get("accept-encoding", ""), disponibles)
+        if codificacion is not None:
+            cuerpo = _comprimir(cuerpo, codificacion)
+            headers["Content-Encoding"] = codificacion
+    return Response(cuerpo, status_code=status_code, media_type="application/json", headers=headers)
@@ -1,16 +1,42 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi import APIRouter, HTTPException, Request, UploadFile, File
+from fastapi.responses import Response, HTMLResponse
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from typing import List, Literal
+from typing import List, Literal, Optional
 from services.simplex_service import resolver_simplex_tabular, generar_grafico_2d
-import uuid
-import tempfile
+from services.punto_interior import resolver_punto_interior
+from services.branch_and_bound import resolver_branch_and_bound
+from services.dantzig_wolfe import resolver_dantzig_wolfe
+from services.lector_modelos import leer_modelo, resolver_modelo
+from services.almacen import AlmacenResultados, clave_problema
+from routers.respuestas import respuesta_json
+from routers.admision import ControlAdmision, estimar_costo, contar_no_ceros, identificar_cliente
 import os
+import functools
 import logging
 import base64
 
 logger = logging.getLogger(__name__)
 
+# Procesos para evaluar nodos de Branch and Bound en paralelo
+BB_WORKERS = int(os.getenv("SIMPLEX_BB_WORKERS", "1"))
+# Procesos para resolver los subproblemas de Dantzig-Wolfe en paralelo
+DW_WORKERS = int(os.getenv("SIMPLEX_DW_WORKERS", "1"))
+# Procesos para probar restricciones candidatas al buscar un IIS
+IIS_WORKERS = int(os.getenv("SIMPLEX_IIS_WORKERS", "1"))
+# Tamaño máximo de un modelo subido: MiddlewareLimiteCuerpo corta el cuerpo de la
+# solicitud antes de parsear el formulario y el endpoint verifica el archivo
+MAX_UPLOAD_BYTES = int(float(os.getenv("SIMPLEX_MAX_UPLOAD_MB", "10")) * 1024 * 1024)
+
+# Almacén persistente compartido entre workers (None si SIMPLEX_STORE_DIR no está definido)
+ALMACEN = AlmacenResultados.desde_entorno()
+# Solo se almacenan resultados definitivos: un límite de iteraciones, nodos o
+# tiempo depende de la corrida y no debe servirse a solicitudes futuras
+STATUS_ALMACENABLES = ("optimo", "infactible", "no acotado")
+
+# Admisión por costo estimado: en línea, pool de procesos o rechazo (413/429)
+ADMISION = ControlAdmision.desde_entorno()
+
 router = APIRouter(
     prefix="/simplex",
     tags=["Simplex Solver"]
@@ -22,28 +48,171 @@ class SimplexRequest(BaseModel):
     LI: List[List[float]]
     LD: List[float]
     O: List[Literal['<=', '>=', '=']]
+    # Signo de cada variable; si se omite todas son >= 0
+    signos: Optional[List[Literal['>=0', '<=0', 'libre']]] = None
+    # Método de resolución: Simplex tabular, punto interior (con crossover opcional)
+    # o descomposición de Dantzig-Wolfe para problemas bloque-angulares
+    metodo: Literal['simplex', 'punto_interior', 'dantzig_wolfe'] = 'simplex'
+    crossover: bool = True
+    # Bloque de cada variable para Dantzig-Wolfe (None: del maestro); si se omite se detecta
+    bloques: Optional[List[Optional[int]]] = None
+    # Precisión del tableau Simplex (float32 usa la mitad de memoria)
+    dtype: Literal['float64', 'float32'] = 'float64'
+    # Variables enteras / binarias (Branch and Bound) y sus límites
+    enteras: Optional[List[bool]] = None
+    binarias: Optional[List[bool]] = None
+    limite_nodos: int = 10000
+    limite_tiempo: Optional[float] = None
+    # Historial de tablas intermedias en la respuesta (lo más costoso de generar)
+    incluir_tablas: bool = True
+    # Si es infactible, buscar un subconjunto irreducible de restricciones en conflicto
+    buscar_iis: bool = False
+
 
+def _clave(request: SimplexRequest) -> Optional[str]:
+    """Clave del problema en el almacén (None si no hay almacén configurado)."""
+    return clave_problema(request.model_dump()) if ALMACEN is not None else None
 
-def _cleanup_file(path: str) -> None:
+
+async def _leer_almacen(metodo: str, clave: Optional[str]):
+    """
+    Lee del almacén sin que un fallo de disco impida resolver. SQLite, el disco
+    y la descompresión corren en el pool de hilos, fuera del event loop.
+    """
+    if clave is None:
+        return None
     try:
-        if os.path.exists(path):
-            os.remove(path)
+        return await run_in_threadpool(getattr(ALMACEN, metodo), clave)
     except Exception:
-        # Silenciar errores de limpieza
-        pass
+        logger.warning("No se pudo leer el almacén de resultados", exc_info=True)
+        return None
 
-@router.post("/solve-tabular")
-async def solve_tabular(request: SimplexRequest):
+
+async def _guardar_almacen(metodo: str, clave: Optional[str], valor) -> None:
+    if clave is None:
+        return
     try:
+        await run_in_threadpool(getattr(ALMACEN, metodo), clave, valor)
+    except Exception:
+        logger.warning("No se pudo escribir en el almacén de resultados", exc_info=True)
+
+
+async def _png_grafico(request: SimplexRequest) -> bytes:
+    """Resuelve el problema (para marcar el óptimo) y renderiza el gráfico, con caché persistente."""
+    clave = _clave(request)
+    png = await _leer_almacen("obtener_grafico", clave)
+    if png is not None:
+        return png
+
+    solve = resolver_simplex_tabular(
+        problem_type=request.problem_type,
+        C=request.C,
+        LI=request.LI,
+        LD=request.LD,
+        O=request.O,
+        signos=request.signos,
+    )
+    mark = None
+    if solve.get("status") == "optimo" and solve.get("solucion"):
+        vars_ = solve["solucion"]["variables"]
+        mx = float(vars_.get("x1", 0.0))
+        my = float(vars_.get("x2", 0.0))
+        mark = (mx, my)
+
+    png = generar_grafico_2d(
+        request.C,
+        request.LI,
+        request.LD,
+        titulo="Gráfico de Restricciones y Función Objetivo",
+        mark_point=mark,
+    )
+    if not isinstance(png, (bytes, bytearray)):
+        raise HTTPException(status_code=500, detail="Error generando imagen.")
+    await _guardar_almacen("guardar_grafico", clave, bytes(png))
+    return png
+
+def _resolver_solicitud(request: SimplexRequest) -> dict:
+    """Despacha al solver que corresponde (función de módulo: se ejecuta también en el pool)."""
+    if any(request.enteras or []) or any(request.binarias or []):
+        result = resolver_branch_and_bound(
+            problem_type=request.problem_type,
+            C=request.C,
+            LI=request.LI,
+            LD=request.LD,
+            O=request.O,
+            enteras=request.enteras or [False] * len(request.C),
+            signos=request.signos,
+            binarias=request.binarias,
+            max_workers=BB_WORKERS,
+            limite_nodos=request.limite_nodos,
+            limite_tiempo=request.limite_tiempo
+        )
+    elif request.metodo == 'punto_interior':
+        result = resolver_punto_interior(
+            problem_type=request.problem_type,
+            C=request.C,
+            LI=request.LI,
+            LD=request.LD,
+            O=request.O,
+            signos=request.signos,
+            crossover=request.crossover,
+            incluir_tablas=request.incluir_tablas
+        )
+    elif request.metodo == 'dantzig_wolfe':
+        result = resolver_dantzig_wolfe(
+            problem_type=request.problem_type,
+            C=request.C,
+            LI=request.LI,
+            LD=request.LD,
+            O=request.O,
+            signos=request.signos,
+            bloques=request.bloques,
+            max_workers=DW_WORKERS
+        )
+    else:
         result = resolver_simplex_tabular(
             problem_type=request.problem_type,
             C=request.C,
             LI=request.LI,
             LD=request.LD,
-            O=request.O
+            O=request.O,
+            signos=request.signos,
+            dtype=request.dtype,
+            incluir_tablas=request.incluir_tablas,
+            buscar_iis=request.buscar_iis,
+            max_workers=IIS_WORKERS
+        )
+    if not request.incluir_tablas:
+        result.pop("tablas", None)
+    return result
+
+@router.post("/solve-tabular")
+async def solve_tabular(request: SimplexRequest, http_request: Request):
+    try:
+        costo = estimar_costo(
+            len(request.LI),
+            len(request.C),
+            contar_no_ceros(request.LI),
+            incluir_tablas=request.incluir_tablas,
+            enteros=any(request.enteras or []) or any(request.binarias or []),
+            iis=request.buscar_iis,
         )
+        ADMISION.verificar_costo(costo)
+
+        clave = _clave(request)
+        cached = await _leer_almacen("obtener_resultado", clave)
+        if cached is not None:
+            logger.info("Resultado obtenido del almacén")
+            return respuesta_json(http_request, cached)
+
+        async with ADMISION.cupo(identificar_cliente(http_request)):
+            result = await ADMISION.ejecutar(costo, _resolver_solicitud, request)
         logger.info("Resolviendo problema simplex")
-        return result
+        if result["status"] in STATUS_ALMACENABLES:
+            await _guardar_almacen("guardar_resultado", clave, result)
+        return respuesta_json(http_request, result)
+    except HTTPException:
+        raise
     except ValueError as e:
         logger.warning(f"Error de validación en /solve-tabular: {e}")
         raise HTTPException(status_code=400, detail=f"Datos inválidos: {e}")
@@ -51,43 +220,66 @@ async def solve_tabular(request: SimplexRequest):
         logger.exception("Error interno en /solve-tabular")        
         raise HTTPException(status_code=500, detail="Ocurrió un error interno al resolver el problema. Intente nuevamente.")
 
+@router.post("/upload-model")
+async def upload_model(
+    http_request: Request,
+    archivo: UploadFile = File(...),
+    formato: Optional[Literal['mps', 'lp']] = None,
+    incluir_tablas: bool = False,
+    buscar_iis: bool = False
+):
+    """Resuelve un modelo subido en formato MPS o LP (CPLEX)."""
+    if formato is None:
+        extension = os.path.splitext(archivo.filename or "")[1].lower()
+        formato = {".mps": "mps", ".lp": "lp"}.get(extension)
+    if formato is None:
+        raise HTTPException(status_code=400, detail="No se pudo deducir el formato del archivo: indique formato=mps o formato=lp.")
+
+    tamano = archivo.size
+    if tamano is None:
+        tamano = archivo.file.seek(0, os.SEEK_END)
+        archivo.file.seek(0)
+    if tamano > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail="El archivo excede el tamaño máximo admitido por el servidor.")
+
+    try:
+        # El parser es Python puro: se ejecuta fuera del event loop
+        modelo = await run_in_threadpool(leer_modelo, archivo.file, formato)
+        costo = estimar_costo(
+            len(modelo["LI"]), len(modelo["C"]), contar_no_ceros(modelo["LI"]),
+            enteros=any(modelo["enteras"]), iis=buscar_iis,
+        )
+        ADMISION.verificar_costo(costo)
+        resolver = functools.partial(resolver_modelo, buscar_iis=buscar_iis)
+        async with ADMISION.cupo(identificar_cliente(http_request)):
+            result = await ADMISION.ejecutar(costo, resolver, modelo, IIS_WORKERS)
+        if not incluir_tablas:
+            result.pop("tablas", None)
+        logger.info(f"Resolviendo modelo {formato.upper()} '{modelo['nombre']}'")
+        return respuesta_json(http_request, result)
+    except HTTPException:
+        raise
+    except ValueError as e:
+        logger.warning(f"Error de validación en /upload-model: {e}")
+        raise HTTPException(status_code=400, detail=f"Modelo inválido: {e}")
+    except Exception:
+        logger.exception("Error interno en /upload-model")
+        raise HTTPException(status_code=500, detail="Ocurrió un error interno al resolver el modelo. Intente nuevamente.")
+
 @router.post("/generate-graph")
-async def generate_graph(request: SimplexRequest, background_tasks: BackgroundTasks):
+async def generate_graph(request: SimplexRequest):
     if len(request.C) != 2:
         raise HTTPException(status_code=400, detail="El gráfico solo puede generarse para problemas con exactamente 2 variables.")
 
     try:
-        # Resolver para obtener punto óptimo
-        solve = resolver_simplex_tabular(
-            problem_type=request.problem_type,
-            C=request.C,
-            LI=request.LI,
-            LD=request.LD,
-            O=request.O,
-        )
-        mark = None
-        if solve.get("status") == "optimo" and solve.get("solucion"):
-            vars_ = solve["solucion"]["variables"]
-            mx = float(vars_.get("x1", 0.0))
-            my = float(vars_.get("x2", 0.0))
-            mark = (mx, my)
-
-        tmp_dir = tempfile.gettempdir()
-        filename = f"simplex_graph_{uuid.uuid4().hex}.png"
-        graph_path = os.path.join(tmp_dir, filename)
-        saved_path = generar_grafico_2d(
-            request.C,
-            request.LI,
-            request.LD,
-            titulo="Gráfico de Restricciones y Función Objetivo",
-            save_path=graph_path,
-            mark_point=mark,
+        png = await _png_grafico(request)
+        return Response(
+            content=png,
+            media_type="image/png",
+            headers={"Content-Disposition": 'attachment; filename="graph.png"'},
         )
-        if not saved_path or not os.path.exists(saved_path):
-            raise HTTPException(status_code=500, detail="No se pudo generar el gráfico.")
-        # Programar eliminación del archivo después de enviar
-        background_tasks.add_task(_cleanup_file, saved_path)
-        return FileResponse(saved_path, media_type="image/png", filename="graph.png")
+    except HTTPException:
+        raise
     except ValueError as e:
         logger.warning(f"Error de validación en /generate-graph: {e}")
         raise HTTPException(status_code=400, detail=f"Datos inválidos: {e}")
@@ -100,29 +292,7 @@ async def generate_graph_html(request: SimplexRequest):
     if len(request.C) != 2:
         raise HTTPException(status_code=400, detail="Solo se puede graficar con exactamente 2 variables.")
     try:
-        solve = resolver_simplex_tabular(
-            problem_type=request.problem_type,
-            C=request.C,
-            LI=request.LI,
-            LD=request.LD,
-            O=request.O,
-        )
-        mark = None
-        if solve.get("status") == "optimo" and solve.get("solucion"):
-            vars_ = solve["solucion"]["variables"]
-            mx = float(vars_.get("x1", 0.0))
-            my = float(vars_.get("x2", 0.0))
-            mark = (mx, my)
-
-        raw_png = generar_grafico_2d(
-            request.C,
-            request.LI,
-            request.LD,
-            titulo="Gráfico de Restricciones y Función Objetivo",
-            mark_point=mark,
-        )
-        if not isinstance(raw_png, (bytes, bytearray)):
-            raise HTTPException(status_code=500, detail="Error generando imagen.")
+        raw_png = await _png_grafico(request)
         b64 = base64.b64encode(raw_png).decode("ascii")
         html = f"""
         <html><head><title>Gráfico Simplex</title></head>
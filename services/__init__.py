@@ -1 +1,6 @@
-from .simplex_service import resolver_simplex_tabular, generar_grafico_2d
\ No newline at end of file
+from .simplex_service import resolver_simplex_tabular, generar_grafico_2d
+from .punto_interior import resolver_punto_interior
+from .branch_and_bound import resolver_branch_and_bound
+from .dantzig_wolfe import resolver_dantzig_wolfe
+from .lector_modelos import leer_modelo, leer_mps, leer_lp, resolver_modelo
+from .programa_lineal import LinearProgram
@@ -0,0 +1,259 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import uuid
+import zlib
+import numpy as np
+from contextlib import closing
+from typing import List, Dict, Any, Tuple, Optional
+
+
+def clave_problema(datos: Dict[str, Any]) -> str:
+    """
+    Hash canónico de un problema: el mismo problema produce la misma clave sin
+    importar el orden de las claves ni si los números llegan como int o float.
+    """
+    def _normalizar(valor):
+        if isinstance(valor, dict):
+            return {k: _normalizar(v) for k, v in valor.items()}
+        if isinstance(valor, (list, tuple)):
+            return [_normalizar(v) for v in valor]
+        if isinstance(valor, (int, float)) and not isinstance(valor, bool):
+            return float(valor)
+        return valor
+
+    canonico = json.dumps(_normalizar(datos), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonico.encode("utf-8")).hexdigest()
+
+
+def _compactar_historial(tablas: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], np.ndarray]:
+    """
+    Separa el historial de tablas en metadatos (títulos, encabezados, bases) y un
+    único arreglo float64 con todos los valores numéricos, uno tras otro.
+    """
+    meta = []
+    bloques = []
+    offset = 0
+    for tabla in tablas:
+        filas = tabla["filas"] + [tabla["fila_obj"]]
+        valores = np.array([fila[1:] for fila in filas], dtype=np.float64)
+        meta.append({
+            "titulo": tabla["titulo"],
+            "headers": tabla["headers"],
+            "bases": [fila[0] for fila in tabla["filas"]],
+            "forma": list(valores.shape),
+            "offset": offset,
+        })
+        bloques.append(valores.ravel())
+        offset += valores.size
+    datos = np.concatenate(bloques) if bloques else np.zeros(0)
+    return meta, datos
+
+
+def _expandir_historial(meta: List[Dict[str, Any]], datos: np.ndarray) -> List[Dict[str, Any]]:
+    """Inverso de `_compactar_historial` (lee vistas del arreglo, sin copiarlo)."""
+    tablas = []
+    for tabla in meta:
+        filas, columnas = tabla["forma"]
+        valores = datos[tabla["offset"]:tabla["offset"] + filas * columnas].reshape(filas, columnas)
+        tablas.append({
+            "titulo": tabla["titulo"],
+            "headers": tabla["headers"],
+            "filas": [[base] + valores[i].tolist() for i, base in enumerate(tabla["bases"])],
+            "fila_obj": ["Z"] + valores[-1].tolist(),
+        })
+    return tablas
+
+
+class AlmacenResultados:
+    """
+    Almacén persistente en disco, compartido entre workers y reinicios.
+
+    - Índice y resultados en SQLite (modo WAL: lectores concurrentes sin bloqueo).
+    - Historiales de tablas compactados en un arreglo .npy por entrada, leído con
+      memoria mapeada (sin copiar) desde cualquier proceso.
+    - Gráficos PNG ya renderizados.
+    - Desalojo LRU cuando el tamaño total supera `max_bytes`. Una lectura solo
+      actualiza el último acceso si pasaron más de `intervalo_acceso` segundos
+      desde el anterior, para que los aciertos no escriban en cada solicitud.
+    """
+
+    def __init__(
+        self,
+        directorio: str,
+        max_bytes: int = 512 * 1024 * 1024,
+        intervalo_acceso: float = 60.0
+    ):
+        self.directorio = directorio
+        self.max_bytes = max_bytes
+        self.intervalo_acceso = intervalo_acceso
+        self.dir_historiales = os.path.join(directorio, "historiales")
+        os.makedirs(self.dir_historiales, exist_ok=True)
+        self.ruta_db = os.path.join(directorio, "indice.sqlite3")
+        with closing(self._conectar()) as con, con:
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute(
+                "CREATE TABLE IF NOT EXISTS entradas ("
+                " clave TEXT PRIMARY KEY,"
+                " resultado BLOB,"
+                " historial_meta BLOB,"
+                " historial_archivo TEXT,"
+                " grafico BLOB,"
+                " bytes INTEGER NOT NULL DEFAULT 0,"
+                " ultimo_acceso REAL NOT NULL)"
+            )
+            con.execute("CREATE INDEX IF NOT EXISTS idx_acceso ON entradas (ultimo_acceso)")
+
+    @classmethod
+    def desde_entorno(cls) -> Optional["AlmacenResultados"]:
+        """
+        Crea el almacén si está configurado SIMPLEX_STORE_DIR (tamaño máximo en
+        SIMPLEX_STORE_MAX_MB, 512 por defecto); si no, retorna None.
+        """
+        directorio = os.getenv("SIMPLEX_STORE_DIR")
+        if not directorio:
+            return None
+        max_mb = float(os.getenv("SIMPLEX_STORE_MAX_MB", "512"))
+        return cls(directorio, int(max_mb * 1024 * 1024))
+
+    def _conectar(self) -> sqlite3.Connection:
+        con = sqlite3.connect(self.ruta_db, timeout=30)
+        con.execute("PRAGMA synchronous=NORMAL")
+        return con
+
+    def _ruta_historial(self, archivo: str) -> str:
+        return os.path.join(self.dir_historiales, archivo)
+
+    def guardar_resultado(self, clave: str, resultado: Dict[str, Any]) -> None:
+        """Guarda un resultado de resolución; su historial de tablas va a un .npy aparte."""
+        resultado = dict(resultado)
+        tablas = resultado.pop("tablas", None)
+        meta, datos = _compactar_historial(tablas or [])
+
+        archivo = None
+        if datos.size:
+            # Escritura atómica: otros procesos nunca ven un archivo a medio escribir
+            archivo = f"{clave}-{uuid.uuid4().hex[:8]}.npy"
+            temporal = self._ruta_historial(archivo + ".tmp")
+            with open(temporal, "wb") as f:
+                np.save(f, datos)
+            os.replace(temporal, self._ruta_historial(archivo))
+
+        blob_resultado = zlib.compress(json.dumps(resultado, default=float).encode("utf-8"))
+        blob_meta = zlib.compress(json.dumps(meta).encode("utf-8")) if tablas is not None else None
+        tamano = len(blob_resultado) + len(blob_meta or b"") + datos.nbytes
+
+        with closing(self._conectar()) as con, con:
+            anterior = con.execute(
+                "SELECT historial_archivo, grafico FROM entradas WHERE clave = ?", (clave,)
+            ).fetchone()
+            grafico = anterior[1] if anterior else None
+            con.execute(
+                "INSERT OR REPLACE INTO entradas VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (clave, blob_resultado, blob_meta, archivo, grafico,
+                 tamano + (len(grafico) if grafico else 0), time.time()),
+            )
+        if anterior and anterior[0]:
+            self._borrar_archivo(anterior[0])
+        self._desalojar()
+
+    def guardar_grafico(self, clave: str, png: bytes) -> None:
+        """Guarda el gráfico renderizado de un problema."""
+        with closing(self._conectar()) as con, con:
+            cur = con.execute(
+                "UPDATE entradas SET grafico = ?, bytes = bytes - COALESCE(LENGTH(grafico), 0) + ?,"
+                " ultimo_acceso = ? WHERE clave = ?",
+                (png, len(png), time.time(), clave),
+            )
+            if cur.rowcount == 0:
+                con.execute(
+                    "INSERT INTO entradas (clave, grafico, bytes, ultimo_acceso) VALUES (?, ?, ?, ?)",
+                    (clave, png, len(png), time.time()),
+                )
+        self._desalojar()
+
+    def obtener_historial(self, clave: str) -> Optional[Tuple[List[Dict[str, Any]], np.ndarray]]:
+        """
+        Metadatos del historial y arreglo con todos sus valores, mapeado en memoria
+        (solo lectura, sin copia). None si no hay historial guardado.
+        """
+        with closing(self._conectar()) as con:
+            fila = con.execute(
+                "SELECT historial_meta, historial_archivo FROM entradas WHERE clave = ?", (clave,)
+            ).fetchone()
+        if fila is None or fila[0] is None:
+            return None
+        meta = json.loads(zlib.decompress(fila[0]))
+        if fila[1] is None:
+            return meta, np.zeros(0)
+        try:
+            return meta, np.load(self._ruta_historial(fila[1]), mmap_mode="r")
+        except FileNotFoundError:
+            # Otro worker la desalojó entre la consulta y la lectura
+            return None
+
+    def _registrar_acceso(self, con: sqlite3.Connection, clave: str, ultimo_acceso: float) -> None:
+        ahora = time.time()
+        if ahora - ultimo_acceso > self.intervalo_acceso:
+            con.execute("UPDATE entradas SET ultimo_acceso = ? WHERE clave = ?", (ahora, clave))
+
+    def obtener_resultado(self, clave: str) -> Optional[Dict[str, Any]]:
+        """Resultado completo (con tablas) o None si no está almacenado."""
+        with closing(self._conectar()) as con, con:
+            fila = con.execute(
+                "SELECT resultado, historial_meta IS NOT NULL, ultimo_acceso FROM entradas WHERE clave = ?",
+                (clave,)
+            ).fetchone()
+            if fila is None or fila[0] is None:
+                return None
+            self._registrar_acceso(con, clave, fila[2])
+            tiene_historial = fila[1]
+        resultado = json.loads(zlib.decompress(fila[0]))
+        if tiene_historial:
+            historial = self.obtener_historial(clave)
+            if historial is None:
+                return None
+            resultado["tablas"] = _expandir_historial(*historial)
+        return resultado
+
+    def obtener_grafico(self, clave: str) -> Optional[bytes]:
+        with closing(self._conectar()) as con, con:
+            fila = con.execute(
+                "SELECT grafico, ultimo_acceso FROM entradas WHERE clave = ?", (clave,)
+            ).fetchone()
+            if fila is None or fila[0] is None:
+                return None
+            self._registrar_acceso(con, clave, fila[1])
+        return bytes(fila[0])
+
+    def tamano_total(self) -> int:
+        with closing(self._conectar()) as con:
+            return con.execute("SELECT COALESCE(SUM(bytes), 0) FROM entradas").fetchone()[0]
+
+    def _borrar_archivo(self, archivo: str) -> None:
+        try:
+            os.remove(self._ruta_historial(archivo))
+        except OSError:
+            pass
+
+    def _desalojar(self) -> None:
+        """Elimina las entradas menos usadas hasta quedar en el 90% de `max_bytes`."""
+        if self.tamano_total() <= self.max_bytes:
+            return
+        objetivo = int(self.max_bytes * 0.9)
+        archivos = []
+        with closing(self._conectar()) as con, con:
+            total = con.execute("SELECT COALESCE(SUM(bytes), 0) FROM entradas").fetchone()[0]
+            for clave, tamano, archivo in con.execute(
+                "SELECT clave, bytes, historial_archivo FROM entradas ORDER BY ultimo_acceso"
+            ).fetchall():
+                if total <= objetivo:
+                    break
+                con.execute("DELETE FROM entradas WHERE clave = ?", (clave,))
+                total -= tamano
+                if archivo:
+                    archivos.append(archivo)
+        for archivo in archivos:
+            self._borrar_archivo(archivo)
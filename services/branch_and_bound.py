@@ -0,0 +1,273 @@
+import heapq
+import itertools
+import math
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Tuple, Literal, Optional, Set
+
+from .simplex_service import (
+    _resolver_tableau,
+    _ejecutar_dual_simplex,
+    _obtener_solucion_final,
+)
+
+TOL_ENTERO = 1e-6
+
+
+def _agregar_cota(
+    tableau: np.ndarray,
+    var_names: List[str],
+    basic_vars: List[str],
+    variable: str,
+    cota: float,
+    sentido: Literal["<=", ">="],
+    nombre_holgura: str
+) -> Tuple[np.ndarray, List[str], List[str]]:
+    """
+    Agrega la restricción `variable <= cota` (o `>=`) a un tableau óptimo,
+    expresada en términos de la base actual, con una nueva holgura básica.
+    El RHS de la nueva fila queda negativo: se reoptimiza con Simplex Dual.
+    """
+    fila_var = tableau[basic_vars.index(variable), :]
+
+    # x + t = cota  ->  t - (parte no básica de x) = cota - valor
+    # -x + t = -cota ->  t + (parte no básica de x) = valor - cota
+    nueva_fila = -fila_var if sentido == "<=" else fila_var.copy()
+    nueva_fila[-1] += cota if sentido == "<=" else -cota
+
+    m, n = tableau.shape
+    nuevo = np.zeros((m + 1, n + 1))
+    nuevo[:m - 1, :n - 1] = tableau[:-1, :-1]
+    nuevo[:m - 1, -1] = tableau[:-1, -1]
+    nuevo[m - 1, :n - 1] = nueva_fila[:-1]
+    nuevo[m - 1, n - 1] = 1.0
+    nuevo[m - 1, -1] = nueva_fila[-1]
+    nuevo[-1, :n - 1] = tableau[-1, :-1]
+    nuevo[-1, -1] = tableau[-1, -1]
+
+    return nuevo, var_names + [nombre_holgura], basic_vars + [nombre_holgura]
+
+
+def _evaluar_nodo(
+    tableau: np.ndarray,
+    var_names: List[str],
+    basic_vars: List[str],
+    variables_libres: Set[str],
+    variable: str,
+    cota: float,
+    sentido: Literal["<=", ">="],
+    nombre_holgura: str
+) -> Tuple[str, np.ndarray, List[str], List[str]]:
+    """Evalúa un nodo hijo partiendo (warm start) del tableau final del padre."""
+    tableau_h, var_names_h, basic_vars_h = _agregar_cota(
+        tableau, var_names, basic_vars, variable, cota, sentido, nombre_holgura
+    )
+    status, tableau_h, basic_vars_h = _ejecutar_dual_simplex(
+        tableau_h, var_names_h, basic_vars_h, variables_libres
+    )
+    return status, tableau_h, var_names_h, basic_vars_h
+
+
+def _variable_fraccionaria(
+    tableau: np.ndarray,
+    basic_vars: List[str],
+    enteras: Set[str]
+) -> Optional[Tuple[str, float]]:
+    """Variable entera básica con valor más fraccionario (None si no hay)."""
+    mejor = None
+    mejor_frac = TOL_ENTERO
+    for i, var in enumerate(basic_vars):
+        if var in enteras:
+            valor = tableau[i, -1]
+            frac = abs(valor - round(valor))
+            if frac > mejor_frac:
+                mejor, mejor_frac = (var, valor), frac
+    return mejor
+
+
+def resolver_branch_and_bound(
+    problem_type: Literal['minimization', 'maximization'],
+    C: List[float],
+    LI: List[List[float]],
+    LD: List[float],
+    O: List[Literal["<=", ">=", "="]],
+    enteras: List[bool],
+    signos: Optional[List[Literal[">=0", "<=0", "libre"]]] = None,
+    binarias: Optional[List[bool]] = None,
+    max_workers: int = 1,
+    limite_nodos: int = 10000,
+    limite_tiempo: Optional[float] = None,
+    gap_relativo: float = 1e-9
+) -> Dict[str, Any]:
+    """
+    Resuelve un problema de Programación Lineal Entera Mixta por Branch and Bound,
+    usando el Simplex tabular como relajación.
+
+    - La relajación raíz se resuelve con `resolver_simplex_tabular` (sus tablas
+      quedan en `tablas`); cada nodo hijo parte del tableau final de su padre y
+      se reoptimiza con Simplex Dual.
+    - Los nodos se eligen por mejor cota y se evalúan en lotes sobre un pool de
+      `max_workers` procesos (1 = en el mismo proceso).
+    - `binarias` marca variables enteras acotadas entre 0 y 1.
+
+    Retorna el mismo formato que `resolver_simplex_tabular` más la clave
+    'branch_and_bound' con nodos explorados, incumbente, cota y gap. Si se
+    alcanza un límite, status es 'limite_nodos' o 'limite_tiempo' y `solucion`
+    es la mejor solución entera encontrada (o None). Si algún nodo no se pudo
+    reoptimizar (límite de iteraciones del Simplex Dual), su subárbol queda sin
+    explorar y status es 'limite_iteraciones', también con la mejor solución.
+    """
+    num_vars = len(C)
+    if len(enteras) != num_vars:
+        raise ValueError("La cantidad de indicadores de variables enteras debe coincidir con la cantidad de variables.")
+    if binarias is not None and len(binarias) != num_vars:
+        raise ValueError("La cantidad de indicadores de variables binarias debe coincidir con la cantidad de variables.")
+
+    LI = [list(fila) for fila in LI]
+    LD = list(LD)
+    O = list(O)
+    num_restricciones = len(LI)
+    enteras = list(enteras)
+
+    # Las binarias son enteras con cota superior 1
+    if binarias is not None:
+        for j, es_binaria in enumerate(binarias):
+            if es_binaria:
+                fila = [0.0] * num_vars
+                fila[j] = 1.0
+                LI.append(fila)
+                LD.append(1.0)
+                O.append("<=")
+                enteras[j] = True
+
+    nombres_enteras = {f'x{j+1}' for j, es_entera in enumerate(enteras) if es_entera}
+    holguras_extra = {f's{i+1}' for i in range(num_restricciones, len(LI))}
+
+    inicio = time.perf_counter()
+    resultado_raiz, estado_raiz = _resolver_tableau(problem_type, C, LI, LD, O, signos)
+    tablas = resultado_raiz["tablas"]
+
+    def _resultado(status, incumbente, cota, nodos):
+        solucion = None
+        if incumbente is not None:
+            tableau, var_names, basic_vars = incumbente
+            solucion = _obtener_solucion_final(
+                tableau, var_names, basic_vars, num_vars, problem_type, signos
+            )
+            # Ocultar holguras de cotas agregadas por el algoritmo
+            for var in list(solucion["variables"]):
+                if var.startswith('b') or var in holguras_extra:
+                    del solucion["variables"][var]
+                else:
+                    solucion["variables"][var] += 0.0  # evita -0.0
+        signo = -1.0 if problem_type == 'minimization' else 1.0
+        valor_inc = float(signo * incumbente[0][-1, -1]) if incumbente is not None else None
+        valor_cota = float(signo * cota) if cota is not None and math.isfinite(cota) else None
+        gap = None
+        if valor_inc is not None and valor_cota is not None:
+            gap = abs(valor_cota - valor_inc) / max(1.0, abs(valor_inc))
+        return {
+            "status": status,
+            "tablas": tablas,
+            "solucion": solucion,
+            "branch_and_bound": {
+                "nodos": nodos,
+                "incumbente": valor_inc,
+                "cota": valor_cota,
+                "gap": gap,
+            },
+        }
+
+    if estado_raiz is None:
+        return _resultado(resultado_raiz["status"], None, None, 1)
+
+    libres = estado_raiz["variables_libres"]
+    raiz = (estado_raiz["tableau"], estado_raiz["var_names"], estado_raiz["basic_vars"])
+
+    # Los valores se comparan en sentido de maximización (fila Z del tableau)
+    incumbente = None
+    valor_incumbente = -math.inf
+    nodos = 1
+    contador = itertools.count()
+    pendientes: List[Tuple[float, int, Any]] = []
+
+    def _umbral() -> float:
+        """Cota mínima que debe superar un nodo para no ser podado."""
+        if incumbente is None:
+            return -math.inf
+        return valor_incumbente + gap_relativo * max(1.0, abs(valor_incumbente))
+
+    def _procesar(tableau, var_names, basic_vars):
+        nonlocal incumbente, valor_incumbente
+        valor = tableau[-1, -1]
+        if valor <= _umbral():
+            return
+        fraccionaria = _variable_fraccionaria(tableau, basic_vars, nombres_enteras)
+        if fraccionaria is None:
+            incumbente = (tableau, var_names, basic_vars)
+            valor_incumbente = valor
+            return
+        variable, valor_var = fraccionaria
+        for sentido, cota in (("<=", math.floor(valor_var)), (">=", math.ceil(valor_var))):
+            heapq.heappush(
+                pendientes,
+                (-valor, next(contador), (tableau, var_names, basic_vars, variable, float(cota), sentido))
+            )
+
+    _procesar(*raiz)
+
+    pool = ProcessPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+    status_final = "optimo"
+    # Mayor cota de los nodos que el Simplex Dual no pudo resolver
+    cota_sin_resolver = -math.inf
+    try:
+        while pendientes:
+            if nodos >= limite_nodos:
+                status_final = "limite_nodos"
+                break
+            if limite_tiempo is not None and time.perf_counter() - inicio > limite_tiempo:
+                status_final = "limite_tiempo"
+                break
+
+            # Lote de nodos con mejor cota; se descartan los ya dominados
+            lote = []
+            while pendientes and len(lote) < max(1, max_workers):
+                cota_neg, _, nodo = heapq.heappop(pendientes)
+                if -cota_neg > _umbral():
+                    lote.append((-cota_neg, nodo))
+            if not lote:
+                break
+
+            argumentos = []
+            for _, (tableau, var_names, basic_vars, variable, cota, sentido) in lote:
+                nodos += 1
+                argumentos.append(
+                    (tableau, var_names, basic_vars, libres, variable, cota, sentido, f'b{nodos}')
+                )
+
+            if pool is not None:
+                evaluados = list(pool.map(_evaluar_nodo, *zip(*argumentos)))
+            else:
+                evaluados = [_evaluar_nodo(*args) for args in argumentos]
+
+            for (cota_padre, _), (status, tableau, var_names, basic_vars) in zip(lote, evaluados):
+                if status == "optimo":
+                    _procesar(tableau, var_names, basic_vars)
+                elif status != "infactible":
+                    # Sin resolver: el subárbol no se poda, queda acotado por su padre
+                    cota_sin_resolver = max(cota_sin_resolver, cota_padre)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    if status_final == "optimo" and cota_sin_resolver > _umbral():
+        status_final = "limite_iteraciones"
+    if status_final == "optimo":
+        cota = valor_incumbente
+        if incumbente is None:
+            status_final = "infactible"
+    else:
+        cota = max([-c for c, _, _ in pendientes] + [valor_incumbente, cota_sin_resolver])
+
+    return _resultado(status_final, incumbente, cota, nodos)
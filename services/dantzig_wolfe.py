@@ -0,0 +1,358 @@
+import logging
+import math
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Tuple, Literal, Optional
+
+from .simplex_service import (
+    _resolver_tableau,
+    _ejecutar_iteraciones_simplex,
+    resolver_simplex_tabular,
+)
+
+logger = logging.getLogger(__name__)
+
+TOL = 1e-9
+# Rondas de 50 pivoteos (límite de `_ejecutar_iteraciones_simplex`) por maestro
+MAX_RONDAS_MAESTRO = 40
+
+
+def detectar_bloques(
+    LI: List[List[float]],
+    max_fraccion_enlace: float = 0.25
+) -> Optional[Tuple[List[Optional[int]], List[int]]]:
+    """
+    Busca una estructura bloque-angular: quita las filas con más coeficientes no
+    nulos (candidatas a restricciones de enlace) hasta que las restantes se
+    separen en al menos dos bloques de variables independientes.
+
+    Retorna (etiqueta de bloque por variable, filas de enlace) o None si no hay
+    estructura usando como mucho `max_fraccion_enlace` de las filas como enlace.
+    Las variables que solo aparecen en filas de enlace quedan con etiqueta None.
+    """
+    A = np.asarray(LI, dtype=float)
+    if A.ndim != 2 or A.shape[0] < 2:
+        return None
+    m, n = A.shape
+    no_nulos = A != 0
+    orden = np.argsort(-no_nulos.sum(axis=1), kind="stable")
+
+    for k in range(math.ceil(max_fraccion_enlace * m) + 1):
+        filas_bloque = orden[k:]
+        padre = list(range(n))
+
+        def _raiz(j):
+            while padre[j] != j:
+                padre[j] = padre[padre[j]]
+                j = padre[j]
+            return j
+
+        for i in filas_bloque:
+            columnas = np.flatnonzero(no_nulos[i])
+            for j in columnas[1:]:
+                padre[_raiz(j)] = _raiz(columnas[0])
+
+        usadas = np.flatnonzero(no_nulos[filas_bloque].any(axis=0))
+        raices = sorted({_raiz(j) for j in usadas})
+        if len(raices) >= 2:
+            etiqueta = {r: b for b, r in enumerate(raices)}
+            bloques = [None] * n
+            for j in usadas:
+                bloques[j] = etiqueta[_raiz(j)]
+            return bloques, sorted(int(i) for i in orden[:k])
+    return None
+
+
+def _resolver_subproblema(
+    C: List[float],
+    LI: List[List[float]],
+    LD: List[float],
+    O: List[str],
+    signos: Optional[List[str]]
+) -> Tuple[str, Optional[np.ndarray]]:
+    """Maximiza C·x sobre un bloque; retorna (status, punto extremo sin redondear)."""
+    resultado, estado = _resolver_tableau(
+        'maximization', C, LI, LD, O, signos, incluir_tablas=False
+    )
+    if estado is None:
+        return resultado["status"], None
+    x = np.zeros(len(C))
+    for i, var in enumerate(estado["basic_vars"]):
+        if var.startswith('x'):
+            x[int(var[1:]) - 1] = estado["tableau"][i, -1]
+    return "optimo", x
+
+
+def _resolver_maestro(
+    c_max: np.ndarray,
+    A: np.ndarray,
+    b: np.ndarray,
+    base: List[int]
+) -> Tuple[str, List[int], np.ndarray, np.ndarray]:
+    """
+    Maximiza c_max·z con A z = b, z >= 0, partiendo de la base factible `base`.
+    Retorna (status, base final, valores de z, duales y con B^T y = c_B).
+    """
+    m = A.shape[0]
+    cuerpo = np.linalg.solve(A[:, base], np.hstack([A, b.reshape(-1, 1)]))
+    cuerpo[:, base] = np.eye(m)
+    fila_obj = np.concatenate([-c_max, [0.0]])
+    fila_obj -= fila_obj[base] @ cuerpo
+    tableau = np.vstack([cuerpo, fila_obj])
+
+    nombres = [str(j) for j in range(A.shape[1])]
+    basic_vars = [nombres[j] for j in base]
+    for _ in range(MAX_RONDAS_MAESTRO):
+        status, tableau, _, basic_vars = _ejecutar_iteraciones_simplex(
+            tableau, nombres, basic_vars, fase=2, registrar_tablas=False
+        )
+        if status != "max_iterations_reached":
+            break
+
+    base = [int(v) for v in basic_vars]
+    z = np.zeros(A.shape[1])
+    z[base] = tableau[:-1, -1]
+    y = np.linalg.solve(A[:, base].T, c_max[base])
+    return status, base, z, y
+
+
+def resolver_dantzig_wolfe(
+    problem_type: Literal['minimization', 'maximization'],
+    C: List[float],
+    LI: List[List[float]],
+    LD: List[float],
+    O: List[Literal["<=", ">=", "="]],
+    signos: Optional[List[Literal[">=0", "<=0", "libre"]]] = None,
+    bloques: Optional[List[Optional[int]]] = None,
+    max_workers: int = 1,
+    max_iteraciones: int = 200
+) -> Dict[str, Any]:
+    """
+    Resuelve un problema bloque-angular por descomposición de Dantzig-Wolfe.
+
+    - `bloques` asigna a cada variable la etiqueta de su bloque (None: variable
+      del maestro); si se omite, la estructura se detecta con `detectar_bloques`.
+      Una fila que involucra variables de más de un bloque, o del maestro, es de
+      enlace; el resto pertenece a su bloque.
+    - El maestro restringido (filas de enlace y de convexidad) tiene una
+      artificial con penalización big-M por fila, así siempre es factible.
+    - Los subproblemas de precios se resuelven con el Simplex tabular en lotes
+      sobre `max_workers` procesos (1 = en el mismo proceso).
+
+    Retorna el mismo formato que `resolver_simplex_tabular` (sin tablas) más la
+    clave 'dantzig_wolfe' con bloques, filas de enlace, iteraciones y columnas
+    generadas. Sin estructura de bloques, o si algún bloque no es acotado, el
+    problema se resuelve directamente con el Simplex tabular y esa clave es None.
+
+    Si se alcanzan `max_iteraciones` sin converger, status es
+    'max_iterations_reached' y `solucion` es None, como en el Simplex tabular; el
+    punto del último maestro, factible pero sin optimalidad probada, queda en
+    'solucion_parcial' (None si aún usa artificiales).
+    """
+    num_vars = len(C)
+    num_restricciones = len(LI)
+    if signos is not None and len(signos) != num_vars:
+        raise ValueError("La cantidad de signos debe coincidir con la cantidad de variables.")
+    if bloques is not None and len(bloques) != num_vars:
+        raise ValueError("La cantidad de etiquetas de bloque debe coincidir con la cantidad de variables.")
+
+    def _directo() -> Dict[str, Any]:
+        logger.info("Sin estructura de bloques aprovechable: se resuelve con el Simplex tabular")
+        resultado = resolver_simplex_tabular(
+            problem_type, C, LI, LD, O, signos, incluir_tablas=False
+        )
+        resultado["dantzig_wolfe"] = None
+        return resultado
+
+    A = np.array(LI, dtype=float).reshape(num_restricciones, num_vars)
+    b = np.array(LD, dtype=float)
+    c = np.array(C, dtype=float)
+
+    # Variables no positivas: x = -x' (se revierte al armar la solución)
+    negadas = np.array([s == '<=0' for s in (signos or [])] or [False] * num_vars)
+    A[:, negadas] *= -1
+    c[negadas] *= -1
+    libres = np.array([s == 'libre' for s in (signos or [])] or [False] * num_vars)
+    c_max = -c if problem_type == 'minimization' else c
+
+    if bloques is None:
+        detectados = detectar_bloques(A)
+        if detectados is None:
+            return _directo()
+        bloques = detectados[0]
+
+    # Filas de bloque / de enlace; los bloques sin filas propias pasan al maestro
+    etiquetas = sorted({e for e in bloques if e is not None})
+    filas_de = {e: [] for e in etiquetas}
+    enlace = []
+    for i in range(num_restricciones):
+        tocadas = {bloques[j] for j in np.flatnonzero(A[i])}
+        if len(tocadas) == 1 and None not in tocadas:
+            filas_de[tocadas.pop()].append(i)
+        else:
+            enlace.append(i)
+    bloques = [e if e is not None and filas_de[e] else None for e in bloques]
+    etiquetas = [e for e in etiquetas if filas_de[e]]
+    if len(etiquetas) < 2:
+        return _directo()
+
+    vars_de = {e: [j for j in range(num_vars) if bloques[j] == e] for e in etiquetas}
+    directas = [j for j in range(num_vars) if bloques[j] is None]
+
+    def _subproblema(e: int, costos: np.ndarray) -> tuple:
+        vs, fs = vars_de[e], filas_de[e]
+        return (
+            costos[vs].tolist(),
+            A[np.ix_(fs, vs)].tolist(),
+            b[fs].tolist(),
+            [O[i] for i in fs],
+            ['libre' if libres[j] else '>=0' for j in vs],
+        )
+
+    pool = ProcessPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+
+    def _resolver_lote(costos_por_bloque: Dict[int, np.ndarray]) -> Dict[int, Tuple[str, Any]]:
+        argumentos = [_subproblema(e, costos) for e, costos in costos_por_bloque.items()]
+        if pool is not None:
+            evaluados = list(pool.map(_resolver_subproblema, *zip(*argumentos)))
+        else:
+            evaluados = [_resolver_subproblema(*args) for args in argumentos]
+        return dict(zip(costos_por_bloque, evaluados))
+
+    # Maestro: filas de enlace + una fila de convexidad por bloque
+    m0, K = len(enlace), len(etiquetas)
+    indice_bloque = {e: k for k, e in enumerate(etiquetas)}
+    A0 = A[enlace]
+    b_m = np.concatenate([b[enlace], np.ones(K)])
+    ops = [O[i] for i in enlace] + ["="] * K
+    invertidas = b_m < 0
+    b_m[invertidas] *= -1
+    ops = [{"<=": ">=", ">=": "<="}.get(op, op) if inv else op for op, inv in zip(ops, invertidas)]
+    signo_fila = np.where(invertidas, -1.0, 1.0)
+    M = 1e6 * (1.0 + np.abs(c_max).max(initial=0.0) * (1.0 + np.abs(b).max(initial=0.0)))
+
+    # Columnas estructurales del maestro: (coeficientes, costo, aporte a x)
+    columnas: List[Tuple[np.ndarray, float, np.ndarray]] = []
+
+    def _agregar_columna(aporte: np.ndarray, bloque: Optional[int]) -> None:
+        coef = np.zeros(m0 + K)
+        coef[:m0] = A0 @ aporte
+        if bloque is not None:
+            coef[m0 + indice_bloque[bloque]] = 1.0
+        columnas.append((coef * signo_fila, float(c_max @ aporte), aporte))
+
+    def _punto(e: int, x_bloque: np.ndarray) -> np.ndarray:
+        xk = np.zeros(num_vars)
+        xk[vars_de[e]] = x_bloque
+        return xk
+
+    def _info(iteraciones: int) -> Dict[str, Any]:
+        return {
+            "bloques": [[f"x{j+1}" for j in vars_de[e]] for e in etiquetas],
+            "filas_enlace": [i + 1 for i in enlace],
+            "iteraciones": iteraciones,
+            "columnas": len(columnas),
+        }
+
+    # Variables del maestro: columna unitaria (dos, con signos opuestos, si es libre)
+    for j in directas:
+        for signo in ((1.0, -1.0) if libres[j] else (1.0,)):
+            _agregar_columna(signo * np.eye(num_vars)[j], None)
+
+    try:
+        # Columnas iniciales: un punto extremo de cada bloque
+        for e, (status, x) in _resolver_lote({e: c_max for e in etiquetas}).items():
+            if status == "infactible":
+                return {"status": "infactible", "tablas": [], "solucion": None, "dantzig_wolfe": _info(0)}
+            if status != "optimo":
+                return _directo()
+            _agregar_columna(_punto(e, x), e)
+
+        # Columnas auxiliares por fila: holgura (<=), exceso (>=) y artificial big-M
+        auxiliares = []
+        for i, op in enumerate(ops):
+            if op == "<=":
+                auxiliares.append((('s', i), i, 1.0, 0.0))
+            else:
+                if op == ">=":
+                    auxiliares.append((('e', i), i, -1.0, 0.0))
+                auxiliares.append((('a', i), i, 1.0, -M))
+
+        base_ids = [('s', i) if op == "<=" else ('a', i) for i, op in enumerate(ops)]
+        iteraciones = 0
+        while True:
+            iteraciones += 1
+            identidades = [('c', j) for j in range(len(columnas))] + [aux[0] for aux in auxiliares]
+            A_m = np.zeros((m0 + K, len(identidades)))
+            for j, col in enumerate(columnas):
+                A_m[:, j] = col[0]
+            for j, (_, fila, valor, _) in enumerate(auxiliares, start=len(columnas)):
+                A_m[fila, j] = valor
+            c_m = np.array([col[1] for col in columnas] + [aux[3] for aux in auxiliares])
+            posicion = {v: j for j, v in enumerate(identidades)}
+
+            status_m, base, z, y = _resolver_maestro(c_m, A_m, b_m, [posicion[v] for v in base_ids])
+            base_ids = [identidades[j] for j in base]
+            if status_m != "optimo":
+                return {"status": status_m, "tablas": [], "solucion": None, "dantzig_wolfe": _info(iteraciones)}
+
+            # Precios: costos reducidos de cada bloque con los duales de enlace
+            y = y * signo_fila
+            y_enlace, y_convexidad = y[:m0], y[m0:]
+            costos_precio = c_max - A0.T @ y_enlace
+            propuestas = _resolver_lote({e: costos_precio for e in etiquetas})
+
+            nuevas = 0
+            for e, (status, x) in propuestas.items():
+                if status != "optimo":
+                    return _directo()
+                xk = _punto(e, x)
+                reducido = costos_precio @ xk - y_convexidad[indice_bloque[e]]
+                if reducido > TOL * (1.0 + abs(c_m @ z)):
+                    _agregar_columna(xk, e)
+                    nuevas += 1
+            if nuevas == 0 or iteraciones >= max_iteraciones:
+                break
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    info = _info(iteraciones)
+    convergido = nuevas == 0
+    artificiales = [j for j, v in enumerate(identidades) if v[0] == 'a']
+    if np.any(z[artificiales] > 1e-7):
+        # Solo con el maestro convergido las artificiales prueban infactibilidad
+        if convergido:
+            return {"status": "infactible", "tablas": [], "solucion": None, "dantzig_wolfe": info}
+        return {
+            "status": "max_iterations_reached",
+            "tablas": [],
+            "solucion": None,
+            "solucion_parcial": None,
+            "dantzig_wolfe": info,
+        }
+
+    # Solución original: combinación de los puntos extremos (y variables del maestro)
+    x = sum((z[j] * aporte for j, (_, _, aporte) in enumerate(columnas)), np.zeros(num_vars))
+    x_original = np.where(negadas, -x, x)
+    valor = float(np.dot(C, x_original))
+    variables = {f"x{j+1}": round(float(v), 6) + 0.0 for j, v in enumerate(x_original)}
+
+    # Holguras y excesos con los nombres de `resolver_simplex_tabular`
+    actividad = A @ x
+    for i in range(num_restricciones):
+        holgura = b[i] - actividad[i] if O[i] == "<=" else actividad[i] - b[i]
+        nombre = {"<=": "s", ">=": "e"}.get(O[i] if LD[i] >= 0 else {"<=": ">=", ">=": "<="}.get(O[i]))
+        if nombre is not None:
+            variables[f"{nombre}{i+1}"] = round(float(holgura), 6) + 0.0
+
+    solucion = {"variables": variables, "valor_optimo": valor}
+    if not convergido:
+        return {
+            "status": "max_iterations_reached",
+            "tablas": [],
+            "solucion": None,
+            "solucion_parcial": solucion,
+            "dantzig_wolfe": info,
+        }
+    return {"status": "optimo", "tablas": [], "solucion": solucion, "dantzig_wolfe": info}
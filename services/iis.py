@@ -0,0 +1,134 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Tuple, Optional
+
+from .simplex_service import _resolver_tableau
+
+
+def soporte_farkas(diagnostico: Dict[str, Any], num_restricciones: int) -> List[int]:
+    """
+    Restricciones con dual no nulo en el tableau final de una Fase 1 infactible.
+
+    Los duales y de la Fase 1 forman un certificado de Farkas (y·A >= 0 con
+    y·b < 0 en la forma estándar): las filas con y_i != 0 ya son, por sí solas,
+    un subconjunto infactible. El dual de la fila i se lee en la fila Z de la
+    Fase 1, bajo la artificial a_i (costo 1: y_i = 1 - z) o la holgura s_i
+    (costo 0: y_i = -z).
+    """
+    fila_z1 = diagnostico["tableau"][-1, :-1]
+    columna = {nombre: j for j, nombre in enumerate(diagnostico["var_names"])}
+    soporte = []
+    for i in range(num_restricciones):
+        if f"a{i+1}" in columna:
+            dual = 1.0 - fila_z1[columna[f"a{i+1}"]]
+        else:
+            dual = -fila_z1[columna[f"s{i+1}"]]
+        if abs(dual) > diagnostico["tol"]:
+            soporte.append(i)
+    return soporte
+
+
+def _probar_filas(
+    num_vars: int,
+    LI: List[List[float]],
+    LD: List[float],
+    O: List[str],
+    signos: Optional[List[str]]
+) -> Tuple[str, Optional[List[int]]]:
+    """
+    Fase 1 sobre un subconjunto de restricciones (objetivo nulo). Retorna
+    ('infactible', soporte de Farkas en índices locales), ('optimo', None) si es
+    factible, o el status que haya impedido decidir.
+    """
+    if not LI:
+        # Sin restricciones: factible (los signos de las variables admiten x = 0)
+        return "optimo", None
+    diagnostico: Dict[str, Any] = {}
+    resultado, _ = _resolver_tableau(
+        'maximization', [0.0] * num_vars, LI, LD, O, signos,
+        incluir_tablas=False, diagnostico=diagnostico
+    )
+    if resultado["status"] != "infactible":
+        return resultado["status"], None
+    if not diagnostico:
+        # Infactible sin Fase 1 (no ocurre con restricciones lineales): sin certificado
+        return "infactible", list(range(len(LI)))
+    return "infactible", soporte_farkas(diagnostico, len(LI))
+
+
+def buscar_iis(
+    num_vars: int,
+    LI: List[List[float]],
+    LD: List[float],
+    O: List[str],
+    signos: Optional[List[str]] = None,
+    soporte: Optional[List[int]] = None,
+    max_workers: int = 1
+) -> Tuple[List[int], bool]:
+    """
+    Subconjunto irreducible infactible (IIS) de restricciones, en índices desde 0,
+    y si su irreducibilidad quedó certificada.
+
+    Parte del soporte de Farkas de la Fase 1 (si se omite, de todas las filas) y
+    aplica un filtro de eliminación: se prueba quitar cada candidata; si el resto
+    sigue siendo infactible, el conjunto se reduce de una vez al soporte de Farkas
+    de esa prueba (que descarta además todas las filas con dual nulo). Si al
+    quitarla el resto es factible, la fila es necesaria y lo sigue siendo en
+    cualquier subconjunto, así que no se vuelve a probar.
+
+    Si alguna prueba no se puede decidir (p. ej. se alcanza el límite de
+    iteraciones), la fila se conserva y el resultado sigue siendo infactible,
+    pero puede no ser irreducible: el segundo valor retornado es False.
+
+    Las candidatas se prueban en lotes de `max_workers` procesos (1 = en el mismo
+    proceso). Los signos de las variables se consideran siempre activos.
+    """
+    def _argumentos(filas: List[int]) -> tuple:
+        return (
+            num_vars,
+            [LI[i] for i in filas],
+            [LD[i] for i in filas],
+            [O[i] for i in filas],
+            signos,
+        )
+
+    actual = sorted(soporte) if soporte else list(range(len(LI)))
+    # El soporte debe ser infactible por sí solo; si no (errores numéricos), se
+    # parte del problema completo
+    status, local = _probar_filas(*_argumentos(actual))
+    if status != "infactible":
+        actual = list(range(len(LI)))
+    else:
+        actual = [actual[k] for k in local]
+
+    necesarias = set()
+    irreducible = True
+    pool = ProcessPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+    try:
+        while True:
+            candidatas = [i for i in actual if i not in necesarias]
+            if not candidatas:
+                break
+            lote = candidatas[:max(1, max_workers)]
+            argumentos = [_argumentos([j for j in actual if j != i]) for i in lote]
+            if pool is not None:
+                evaluados = list(pool.map(_probar_filas, *zip(*argumentos)))
+            else:
+                evaluados = [_probar_filas(*args) for args in argumentos]
+
+            reducido = None
+            for i, (status, local) in zip(lote, evaluados):
+                if status != "infactible":
+                    # Factible sin ella (o indeterminado): se conserva
+                    necesarias.add(i)
+                    if status != "optimo":
+                        irreducible = False
+                elif reducido is None:
+                    filas = [j for j in actual if j != i]
+                    reducido = {filas[k] for k in local}
+            if reducido is not None:
+                actual = sorted(reducido | (necesarias & set(actual)))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return actual, irreducible
@@ -0,0 +1,557 @@
+import io
+import math
+import os
+import re
+import numpy as np
+from typing import List, Dict, Any, Tuple, Optional, Iterator, Union, IO
+
+from .simplex_service import resolver_simplex_tabular
+from .branch_and_bound import resolver_branch_and_bound
+
+Archivo = Union[str, os.PathLike, IO[str], IO[bytes]]
+
+
+class _Constructor:
+    """
+    Acumula el modelo mientras se lee el archivo (coeficientes en formato
+    coordenado) y al final arma directamente los arreglos que usa el solver.
+    """
+
+    def __init__(self) -> None:
+        self.nombre = ""
+        self.problem_type = "minimization"
+        self.variables: Dict[str, int] = {}
+        self.restricciones: Dict[str, int] = {}
+        self.operadores: List[str] = []
+        self.rhs: Dict[int, float] = {}
+        self.costos: Dict[int, float] = {}
+        self.constante_objetivo = 0.0
+        self.filas: List[int] = []
+        self.columnas: List[int] = []
+        self.valores: List[float] = []
+        self.cota_inf: Dict[int, float] = {}
+        self.cota_sup: Dict[int, float] = {}
+        self.enteras: set = set()
+
+    def variable(self, nombre: str) -> int:
+        indice = self.variables.get(nombre)
+        if indice is None:
+            indice = self.variables[nombre] = len(self.variables)
+        return indice
+
+    def restriccion(self, nombre: str, operador: str) -> int:
+        if nombre in self.restricciones:
+            raise ValueError(f"Restricción duplicada: {nombre}")
+        indice = self.restricciones[nombre] = len(self.operadores)
+        self.operadores.append(operador)
+        return indice
+
+    def coeficiente(self, fila: int, columna: int, valor: float) -> None:
+        self.filas.append(fila)
+        self.columnas.append(columna)
+        self.valores.append(valor)
+
+    def construir(self) -> Dict[str, Any]:
+        """
+        Arma el modelo final. Las cotas de variables se traducen a la declaración
+        de signo ('>=0', '<=0', 'libre') y, si hace falta, a filas adicionales.
+        """
+        nombres_restricciones = list(self.restricciones)
+        operadores = list(self.operadores)
+        rhs = [self.rhs.get(i, 0.0) for i in range(len(operadores))]
+        filas, columnas, valores = list(self.filas), list(self.columnas), list(self.valores)
+        nombres_variables = list(self.variables)
+        signos = []
+
+        def _fila_cota(j: int, operador: str, valor: float, sufijo: str) -> None:
+            fila = len(operadores)
+            nombres_restricciones.append(f"{nombres_variables[j]}.{sufijo}")
+            operadores.append(operador)
+            rhs.append(valor)
+            filas.append(fila)
+            columnas.append(j)
+            valores.append(1.0)
+
+        for j in range(len(nombres_variables)):
+            inf = self.cota_inf.get(j, 0.0)
+            sup = self.cota_sup.get(j, math.inf)
+            if inf > sup:
+                raise ValueError(f"Cotas inconsistentes para {nombres_variables[j]}")
+            if inf == sup:
+                signos.append('>=0' if inf >= 0 else '<=0')
+                if inf != 0:
+                    _fila_cota(j, "=", inf, "fx")
+                continue
+            if inf >= 0:
+                signos.append('>=0')
+                if inf > 0:
+                    _fila_cota(j, ">=", inf, "lo")
+                if math.isfinite(sup):
+                    _fila_cota(j, "<=", sup, "up")
+            elif inf == -math.inf and sup <= 0:
+                signos.append('<=0')
+                if sup < 0:
+                    _fila_cota(j, "<=", sup, "up")
+            else:
+                signos.append('libre')
+                if math.isfinite(inf):
+                    _fila_cota(j, ">=", inf, "lo")
+                if math.isfinite(sup):
+                    _fila_cota(j, "<=", sup, "up")
+
+        A = np.zeros((len(operadores), len(nombres_variables)))
+        # np.add.at suma coeficientes repetidos de una misma variable en una fila
+        np.add.at(
+            A,
+            (np.asarray(filas, dtype=np.intp), np.asarray(columnas, dtype=np.intp)),
+            np.asarray(valores, dtype=float),
+        )
+        C = np.zeros(len(nombres_variables))
+        for j, valor in self.costos.items():
+            C[j] = valor
+
+        return {
+            "nombre": self.nombre,
+            "problem_type": self.problem_type,
+            "C": C,
+            "LI": A,
+            "LD": np.asarray(rhs, dtype=float),
+            "O": operadores,
+            "signos": signos,
+            "enteras": [j in self.enteras for j in range(len(nombres_variables))],
+            "nombres_variables": nombres_variables,
+            "nombres_restricciones": nombres_restricciones,
+            "constante_objetivo": self.constante_objetivo,
+        }
+
+
+def _lineas(archivo: Archivo) -> Iterator[str]:
+    """Itera las líneas de una ruta o de un archivo abierto (texto o binario)."""
+    if isinstance(archivo, (str, os.PathLike)):
+        with open(archivo, "r", encoding="utf-8") as f:
+            yield from f
+        return
+    if isinstance(archivo, io.TextIOBase):
+        yield from archivo
+        return
+    # Archivos binarios (p. ej. UploadFile.file): decodificar sin leer todo
+    yield from io.TextIOWrapper(archivo, encoding="utf-8", errors="replace")
+
+
+# MPS
+
+_OPERADORES_MPS = {"L": "<=", "G": ">=", "E": "="}
+
+
+def leer_mps(archivo: Archivo) -> Dict[str, Any]:
+    """
+    Lee un modelo en formato MPS (libre o fijo sin espacios en los nombres)
+    línea por línea, sin cargar el texto completo en memoria.
+
+    Soporta las secciones NAME, OBJSENSE, ROWS, COLUMNS (con marcadores
+    INTORG/INTEND), RHS, RANGES, BOUNDS y ENDATA.
+    """
+    modelo = _Constructor()
+    objetivo: Optional[str] = None
+    filas_n: set = set()
+    rangos: Dict[int, float] = {}
+    seccion = None
+    en_enteras = False
+
+    for numero, linea in enumerate(_lineas(archivo), start=1):
+        if not linea.strip() or linea.startswith("*"):
+            continue
+        tokens = linea.split()
+
+        if not linea[0].isspace():
+            seccion = tokens[0].upper()
+            if seccion == "NAME":
+                modelo.nombre = tokens[1] if len(tokens) > 1 else ""
+            elif seccion == "OBJSENSE" and len(tokens) > 1:
+                modelo.problem_type = "maximization" if tokens[1].upper().startswith("MAX") else "minimization"
+            elif seccion == "ENDATA":
+                break
+            elif seccion not in ("ROWS", "COLUMNS", "RHS", "RANGES", "BOUNDS", "OBJSENSE"):
+                raise ValueError(f"Línea {numero}: sección MPS desconocida '{tokens[0]}'")
+            continue
+
+        try:
+            if seccion == "OBJSENSE":
+                modelo.problem_type = "maximization" if tokens[0].upper().startswith("MAX") else "minimization"
+
+            elif seccion == "ROWS":
+                tipo, nombre = tokens[0].upper(), tokens[1]
+                if tipo == "N":
+                    if objetivo is None:
+                        objetivo = nombre
+                    filas_n.add(nombre)
+                else:
+                    modelo.restriccion(nombre, _OPERADORES_MPS[tipo])
+
+            elif seccion == "COLUMNS":
+                if len(tokens) >= 3 and tokens[1].strip("'\"").upper() == "MARKER":
+                    marcador = tokens[2].strip("'\"").upper()
+                    en_enteras = marcador == "INTORG"
+                    continue
+                columna = modelo.variable(tokens[0])
+                if en_enteras:
+                    modelo.enteras.add(columna)
+                for fila, valor in zip(tokens[1::2], tokens[2::2]):
+                    if fila == objetivo:
+                        modelo.costos[columna] = float(valor)
+                    elif fila not in filas_n:
+                        modelo.coeficiente(modelo.restricciones[fila], columna, float(valor))
+
+            elif seccion in ("RHS", "RANGES"):
+                # El nombre del conjunto es opcional
+                pares = tokens[1:] if len(tokens) % 2 else tokens
+                for fila, valor in zip(pares[0::2], pares[1::2]):
+                    if seccion == "RHS" and fila == objetivo:
+                        modelo.constante_objetivo = -float(valor)
+                    elif fila in filas_n:
+                        continue
+                    elif seccion == "RHS":
+                        modelo.rhs[modelo.restricciones[fila]] = float(valor)
+                    else:
+                        rangos[modelo.restricciones[fila]] = float(valor)
+
+            elif seccion == "BOUNDS":
+                tipo = tokens[0].upper()
+                if tipo in ("FR", "MI", "PL", "BV") and len(tokens) == 2:
+                    nombre, valor = tokens[1], None
+                elif tipo in ("FR", "MI", "PL", "BV"):
+                    nombre, valor = tokens[2], (float(tokens[3]) if len(tokens) > 3 else None)
+                elif len(tokens) == 3:
+                    nombre, valor = tokens[1], float(tokens[2])
+                else:
+                    nombre, valor = tokens[2], float(tokens[3])
+                j = modelo.variable(nombre)
+                if tipo in ("UP", "UI"):
+                    modelo.cota_sup[j] = valor
+                    if valor < 0 and j not in modelo.cota_inf:
+                        modelo.cota_inf[j] = -math.inf
+                elif tipo in ("LO", "LI"):
+                    modelo.cota_inf[j] = valor
+                elif tipo == "FX":
+                    modelo.cota_inf[j] = modelo.cota_sup[j] = valor
+                elif tipo == "FR":
+                    modelo.cota_inf[j], modelo.cota_sup[j] = -math.inf, math.inf
+                elif tipo == "MI":
+                    modelo.cota_inf[j] = -math.inf
+                elif tipo == "PL":
+                    modelo.cota_sup[j] = math.inf
+                elif tipo == "BV":
+                    modelo.cota_inf[j], modelo.cota_sup[j] = 0.0, 1.0
+                else:
+                    raise ValueError(f"tipo de cota desconocido '{tipo}'")
+                if tipo in ("BV", "LI", "UI"):
+                    modelo.enteras.add(j)
+        except (KeyError, IndexError, ValueError) as e:
+            raise ValueError(f"Línea {numero}: entrada MPS inválida ({e})") from None
+
+    # RANGES: cada fila con rango se complementa con la cota opuesta
+    nombres = list(modelo.restricciones)
+    filas_rango: Dict[int, int] = {}
+    for i, rango in rangos.items():
+        operador = modelo.operadores[i]
+        rhs = modelo.rhs.get(i, 0.0)
+        if operador == "<=":
+            extra = (">=", rhs - abs(rango))
+        elif operador == ">=":
+            extra = ("<=", rhs + abs(rango))
+        else:
+            modelo.operadores[i] = ">=" if rango > 0 else "<="
+            extra = ("<=" if rango > 0 else ">=", rhs + rango)
+        k = modelo.restriccion(f"{nombres[i]}.rango", extra[0])
+        modelo.rhs[k] = extra[1]
+        filas_rango[i] = k
+    if filas_rango:
+        for fila, columna, valor in list(zip(modelo.filas, modelo.columnas, modelo.valores)):
+            if fila in filas_rango:
+                modelo.coeficiente(filas_rango[fila], columna, valor)
+
+    return modelo.construir()
+
+
+# LP (formato CPLEX)
+
+_SECCIONES_LP = [
+    (re.compile(r"^(maximize|maximise|maximum|max)$"), "max"),
+    (re.compile(r"^(minimize|minimise|minimum|min)$"), "min"),
+    (re.compile(r"^(subject\s+to|such\s+that|st|s\.t\.)$"), "st"),
+    (re.compile(r"^bounds?$"), "bounds"),
+    (re.compile(r"^(generals?|gen|integers?)$"), "general"),
+    (re.compile(r"^(binary|binaries|bin)$"), "binary"),
+    (re.compile(r"^end$"), "end"),
+]
+
+_TOKEN_LP = re.compile(
+    r"\s*(?:"
+    r"(?P<op><=|>=|=<|=>|<|>|=)"
+    r"|(?P<num>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|inf(?:inity)?\b)"
+    r"|(?P<signo>[+-])"
+    r"|(?P<dos_puntos>:)"
+    r"|(?P<nombre>[A-Za-z_!\"#$%&()/,.;?@`'{}|~][\w!\"#$%&()/,.;?@`'{}|~\[\]^]*)"
+    r")",
+    re.IGNORECASE,
+)
+
+_OPERADORES_LP = {"<=": "<=", "=<": "<=", "<": "<=", ">=": ">=", "=>": ">=", ">": ">=", "=": "="}
+
+
+def _tokenizar_lp(texto: str, numero: int) -> List[Tuple[str, str]]:
+    tokens = []
+    pos = 0
+    texto = texto.rstrip()
+    while pos < len(texto):
+        m = _TOKEN_LP.match(texto, pos)
+        if not m or m.end() == pos:
+            raise ValueError(f"Línea {numero}: símbolo inesperado '{texto[pos:].strip()[:20]}'")
+        tipo = m.lastgroup
+        tokens.append((tipo, m.group(tipo)))
+        pos = m.end()
+    return tokens
+
+
+def _numero_lp(texto: str) -> float:
+    return math.inf if texto.lower().startswith("inf") else float(texto)
+
+
+def _expresion_lineal(
+    tokens: List[Tuple[str, str]],
+    numero: int
+) -> Tuple[List[Tuple[str, float]], float]:
+    """Convierte una secuencia de tokens en términos (variable, coeficiente) y una constante."""
+    terminos: List[Tuple[str, float]] = []
+    constante = 0.0
+    signo, coef = 1.0, None
+    for tipo, valor in tokens:
+        if tipo == "signo":
+            signo = signo * (-1.0 if valor == "-" else 1.0)
+        elif tipo == "num":
+            coef = (coef or 1.0) * _numero_lp(valor)
+        elif tipo == "nombre":
+            terminos.append((valor, signo * (1.0 if coef is None else coef)))
+            signo, coef = 1.0, None
+        else:
+            raise ValueError(f"Línea {numero}: expresión inválida cerca de '{valor}'")
+    if coef is not None:
+        constante += signo * coef
+    return terminos, constante
+
+
+def leer_lp(archivo: Archivo) -> Dict[str, Any]:
+    """
+    Lee un modelo en formato LP de CPLEX línea por línea (sin cargar el texto
+    completo en memoria).
+
+    Soporta objetivo (maximize/minimize), restricciones con nombre opcional que
+    pueden ocupar varias líneas, bounds (incluye 'free' y rangos
+    'l <= x <= u'), generals/integers, binaries y comentarios con '\\'.
+    Los encabezados de sección deben ir en su propia línea.
+    """
+    modelo = _Constructor()
+    seccion = None
+    pendiente: List[Tuple[str, str]] = []
+    contador_filas = 0
+
+    def _cerrar_objetivo(numero: int) -> None:
+        tokens = pendiente
+        if len(tokens) >= 2 and tokens[0][0] == "nombre" and tokens[1][0] == "dos_puntos":
+            tokens = tokens[2:]
+        terminos, constante = _expresion_lineal(tokens, numero)
+        for nombre, coef in terminos:
+            j = modelo.variable(nombre)
+            modelo.costos[j] = modelo.costos.get(j, 0.0) + coef
+        modelo.constante_objetivo += constante
+        pendiente.clear()
+
+    def _cerrar_restriccion(numero: int) -> None:
+        nonlocal contador_filas
+        tokens = pendiente
+        contador_filas += 1
+        nombre = f"R{contador_filas}"
+        if len(tokens) >= 2 and tokens[0][0] == "nombre" and tokens[1][0] == "dos_puntos":
+            nombre = tokens[0][1]
+            tokens = tokens[2:]
+        posicion_op = next(i for i, (tipo, _) in enumerate(tokens) if tipo == "op")
+        terminos, constante = _expresion_lineal(tokens[:posicion_op], numero)
+        _, rhs = _expresion_lineal(tokens[posicion_op + 1:], numero)
+        i = modelo.restriccion(nombre, _OPERADORES_LP[tokens[posicion_op][1]])
+        modelo.rhs[i] = rhs - constante
+        for variable, coef in terminos:
+            modelo.coeficiente(i, modelo.variable(variable), coef)
+        pendiente.clear()
+
+    def _restriccion_completa() -> bool:
+        # Completa cuando después del operador hay un número
+        for k, (tipo, _) in enumerate(pendiente):
+            if tipo == "op":
+                return any(t == "num" for t, _ in pendiente[k + 1:])
+        return False
+
+    def _cota(tokens: List[Tuple[str, str]], numero: int) -> None:
+        if len(tokens) == 2 and tokens[0][0] == "nombre" and tokens[1][1].lower() == "free":
+            j = modelo.variable(tokens[0][1])
+            modelo.cota_inf[j], modelo.cota_sup[j] = -math.inf, math.inf
+            return
+        # Separar en lados por operadores: [a op] x op b
+        lados: List[List[Tuple[str, str]]] = [[]]
+        ops: List[str] = []
+        for tipo, valor in tokens:
+            if tipo == "op":
+                ops.append(_OPERADORES_LP[valor])
+                lados.append([])
+            else:
+                lados[-1].append((tipo, valor))
+
+        def _valor(lado):
+            signo = -1.0 if lado and lado[0] == ("signo", "-") else 1.0
+            return signo * _numero_lp(lado[-1][1])
+
+        es_variable = [len(lado) == 1 and lado[0][0] == "nombre" for lado in lados]
+        if len(lados) == 3 and es_variable[1]:
+            j = modelo.variable(lados[1][0][1])
+            izquierda, derecha = _valor(lados[0]), _valor(lados[2])
+            if ops == ["<=", "<="]:
+                modelo.cota_inf[j], modelo.cota_sup[j] = izquierda, derecha
+            elif ops == [">=", ">="]:
+                modelo.cota_inf[j], modelo.cota_sup[j] = derecha, izquierda
+            else:
+                raise ValueError(f"Línea {numero}: cota inválida")
+        elif len(lados) == 2 and (es_variable[0] or es_variable[1]):
+            if es_variable[0]:
+                j, op, valor = modelo.variable(lados[0][0][1]), ops[0], _valor(lados[1])
+            else:
+                j, valor = modelo.variable(lados[1][0][1]), _valor(lados[0])
+                op = {"<=": ">=", ">=": "<=", "=": "="}[ops[0]]
+            if op == "<=":
+                modelo.cota_sup[j] = valor
+            elif op == ">=":
+                modelo.cota_inf[j] = valor
+            else:
+                modelo.cota_inf[j] = modelo.cota_sup[j] = valor
+        else:
+            raise ValueError(f"Línea {numero}: cota inválida")
+
+    numero = 0
+    for numero, linea in enumerate(_lineas(archivo), start=1):
+        linea = linea.split("\\", 1)[0].strip()
+        if not linea:
+            continue
+
+        nueva_seccion = None
+        normalizada = " ".join(linea.lower().split())
+        for patron, nombre_seccion in _SECCIONES_LP:
+            if patron.match(normalizada):
+                nueva_seccion = nombre_seccion
+                break
+
+        if nueva_seccion is not None:
+            if seccion in ("max", "min"):
+                _cerrar_objetivo(numero)
+            elif seccion == "st" and pendiente:
+                raise ValueError(f"Línea {numero}: restricción incompleta")
+            seccion = nueva_seccion
+            if seccion in ("max", "min"):
+                modelo.problem_type = "maximization" if seccion == "max" else "minimization"
+            if seccion == "end":
+                break
+            continue
+
+        if seccion in ("max", "min"):
+            pendiente.extend(_tokenizar_lp(linea, numero))
+        elif seccion == "st":
+            pendiente.extend(_tokenizar_lp(linea, numero))
+            if _restriccion_completa():
+                _cerrar_restriccion(numero)
+        elif seccion == "bounds":
+            _cota(_tokenizar_lp(linea, numero), numero)
+        elif seccion in ("general", "binary"):
+            for nombre in linea.split():
+                j = modelo.variable(nombre)
+                modelo.enteras.add(j)
+                if seccion == "binary":
+                    modelo.cota_inf[j], modelo.cota_sup[j] = 0.0, 1.0
+        else:
+            raise ValueError(f"Línea {numero}: contenido fuera de una sección LP")
+
+    if seccion in ("max", "min"):
+        _cerrar_objetivo(numero)
+    if pendiente:
+        raise ValueError("Restricción incompleta al final del archivo")
+
+    return modelo.construir()
+
+
+def leer_modelo(archivo: Archivo, formato: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Lee un modelo MPS o LP. Si no se indica `formato`, se deduce de la
+    extensión de la ruta ('.mps' / '.lp').
+    """
+    if formato is None:
+        nombre = str(archivo) if isinstance(archivo, (str, os.PathLike)) else getattr(archivo, "name", "")
+        extension = os.path.splitext(str(nombre))[1].lower()
+        formato = {".mps": "mps", ".lp": "lp"}.get(extension)
+    if formato == "mps":
+        return leer_mps(archivo)
+    if formato == "lp":
+        return leer_lp(archivo)
+    raise ValueError("Formato de modelo no reconocido: use 'mps' o 'lp'.")
+
+
+def _nombrar_solucion(modelo: Dict[str, Any], solucion: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Traduce la solución del solver a los nombres del modelo: 'variables' usa los
+    nombres de las columnas y 'restricciones' la holgura/exceso de cada fila.
+    """
+    if solucion is None:
+        return None
+    valores = solucion["variables"]
+    nombres_restricciones = modelo["nombres_restricciones"]
+    restricciones = {}
+    for i, nombre in enumerate(nombres_restricciones):
+        for prefijo in ("s", "e"):
+            clave = f"{prefijo}{i+1}"
+            if clave in valores:
+                restricciones[nombre] = valores[clave]
+    return {
+        "valor_optimo": solucion["valor_optimo"] + modelo["constante_objetivo"],
+        "variables": {
+            nombre: valores.get(f"x{j+1}", 0.0)
+            for j, nombre in enumerate(modelo["nombres_variables"])
+        },
+        "restricciones": restricciones,
+    }
+
+
+def resolver_modelo(
+    modelo: Dict[str, Any],
+    iis_workers: int = 1,
+    buscar_iis: bool = False,
+    **kwargs: Any
+) -> Dict[str, Any]:
+    """
+    Resuelve un modelo leído con `leer_modelo` pasando sus arreglos directamente
+    al solver (Branch and Bound si tiene variables enteras) y devuelve la
+    solución con los nombres originales de variables y restricciones.
+
+    Con `buscar_iis=True`, si un modelo continuo es infactible, 'iis' lista los
+    nombres de un subconjunto irreducible de restricciones en conflicto (los
+    modelos enteros no lo buscan).
+    """
+    argumentos = (modelo["problem_type"], modelo["C"], modelo["LI"], modelo["LD"], list(modelo["O"]))
+    if any(modelo["enteras"]):
+        resultado = resolver_branch_and_bound(
+            *argumentos, enteras=modelo["enteras"], signos=modelo["signos"], **kwargs
+        )
+    else:
+        resultado = resolver_simplex_tabular(
+            *argumentos, signos=modelo["signos"], buscar_iis=buscar_iis,
+            max_workers=iis_workers, **kwargs
+        )
+    resultado["solucion"] = _nombrar_solucion(modelo, resultado["solucion"])
+    if "iis" in resultado:
+        resultado["iis"] = [modelo["nombres_restricciones"][i - 1] for i in resultado["iis"]]
+    resultado["modelo"] = modelo["nombre"]
+    return resultado
@@ -0,0 +1,340 @@
+import numpy as np
+from typing import List, Dict, Any, Tuple, Literal, Optional, Hashable
+
+from .simplex_service import (
+    _resolver_tableau,
+    _ejecutar_iteraciones_simplex,
+    _ejecutar_dual_simplex,
+    _obtener_solucion_final,
+)
+from .punto_interior import _forma_estandar
+
+TOL = 1e-9
+# Reoptimizaciones sobre el mismo tableau antes de refactorizarlo desde la base
+# (acota la acumulación de errores de redondeo de las actualizaciones)
+REFACTORIZAR_CADA = 50
+
+
+class LinearProgram:
+    """
+    Problema de Programación Lineal modificable in situ, pensado para resolver
+    muchas variantes de un mismo modelo dentro del proceso.
+
+    Conserva la forma estándar (columnas x, holguras y excesos, con LD >= 0), la
+    base óptima de la última resolución y su tableau final. Cada modificación
+    actualiza ese tableau en O(filas x columnas), sin refactorizar la base:
+
+    - `set_objective`: recalcula la fila Z; la base sigue siendo primal factible
+      y se reoptimiza con Simplex primal.
+    - `set_rhs`: suma al LD la columna de B^-1 de la fila (la de su holgura o
+      exceso); la base sigue siendo dual factible y se reoptimiza con Simplex Dual.
+    - `add_constraint`: agrega la fila expresada en la base actual, con su holgura
+      (o exceso) como nueva variable básica.
+    - `remove_constraint`: la base pierde la variable asociada a la fila quitada
+      y el tableau se refactoriza desde esa base.
+
+    Si la base guardada no sirve como punto de partida (restricción de igualdad
+    nueva, base singular, ni primal ni dual factible), se resuelve desde cero con
+    el Simplex de dos fases. `solve` retorna el mismo formato que
+    `resolver_simplex_tabular`, más la clave 'reoptimizado'.
+
+    Las restricciones se identifican con el entero que retorna `add_constraint`,
+    estable aunque se quiten otras; los nombres s{i}/e{i} de la solución siguen la
+    posición actual de cada restricción, como en `resolver_simplex_tabular`.
+    """
+
+    def __init__(
+        self,
+        problem_type: Literal['minimization', 'maximization'],
+        C: List[float],
+        signos: Optional[List[Literal[">=0", "<=0", "libre"]]] = None
+    ):
+        if signos is not None and len(signos) != len(C):
+            raise ValueError("La cantidad de signos debe coincidir con la cantidad de variables.")
+        self.problem_type = problem_type
+        self.C = [float(c) for c in C]
+        self.signos = list(signos) if signos is not None else None
+
+        self._LI: List[List[float]] = []
+        self._LD: List[float] = []
+        self._O: List[str] = []
+        self._ids: List[int] = []
+        self._siguiente_id = 0
+
+        # Forma estándar en caché: (c_max, A, b, var_names, libres) y la identidad
+        # estable de cada columna: ('x', j) o ('h', id de la restricción)
+        self._estandar: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, List[str], List[str]]] = None
+        self._identidades: List[Hashable] = []
+        self._columna: Dict[Hashable, int] = {}
+        # Base óptima de la última resolución, como conjunto de identidades, y su
+        # tableau final (columnas en el orden de `_identidades`), si sigue vigente
+        self._base: Optional[List[Hashable]] = None
+        self._tableau: Optional[np.ndarray] = None
+        self._reoptimizaciones = 0
+
+    @classmethod
+    def desde_listas(
+        cls,
+        problem_type: Literal['minimization', 'maximization'],
+        C: List[float],
+        LI: List[List[float]],
+        LD: List[float],
+        O: List[Literal["<=", ">=", "="]],
+        signos: Optional[List[Literal[">=0", "<=0", "libre"]]] = None
+    ) -> "LinearProgram":
+        """Crea el problema con los mismos argumentos que `resolver_simplex_tabular`."""
+        programa = cls(problem_type, C, signos)
+        for fila, ld, op in zip(LI, LD, O):
+            programa.add_constraint(fila, op, ld)
+        return programa
+
+    @property
+    def restricciones(self) -> List[int]:
+        """Identificadores de las restricciones, en su orden actual."""
+        return list(self._ids)
+
+    def _posicion(self, id_restriccion: int) -> int:
+        try:
+            return self._ids.index(id_restriccion)
+        except ValueError:
+            raise ValueError(f"No existe la restricción {id_restriccion}.") from None
+
+    def add_constraint(
+        self,
+        coeficientes: List[float],
+        operador: Literal["<=", ">=", "="],
+        ld: float
+    ) -> int:
+        """Agrega una restricción y retorna su identificador."""
+        if len(coeficientes) != len(self.C):
+            raise ValueError("La cantidad de coeficientes debe coincidir con la cantidad de variables.")
+        if operador not in ("<=", ">=", "="):
+            raise ValueError(f"Operador inválido: {operador}")
+
+        id_restriccion = self._siguiente_id
+        self._siguiente_id += 1
+        self._LI.append([float(a) for a in coeficientes])
+        self._LD.append(float(ld))
+        self._O.append(operador)
+        self._ids.append(id_restriccion)
+        self._estandar = None
+        anterior, identidades = self._tableau, self._identidades
+        self._tableau = None
+
+        # La holgura/exceso de la nueva fila completa la base; una igualdad no
+        # tiene variable propia y obliga a resolver desde cero
+        if self._base is not None:
+            self._base = self._base + [('h', id_restriccion)] if operador != "=" else None
+        if anterior is not None and self._base is not None:
+            self._tableau = self._extender_tableau(anterior, identidades)
+        return id_restriccion
+
+    def _extender_tableau(self, anterior: np.ndarray, identidades: List[Hashable]) -> np.ndarray:
+        """Tableau vigente más la última fila, expresada en la base actual."""
+        c_max, A, b, _, _ = self._forma()
+        m = anterior.shape[0] - 1
+        tableau = np.zeros((m + 2, A.shape[1] + 1))
+        # Las columnas se reubican por identidad (la nueva holgura puede quedar en medio)
+        columnas = [self._columna[v] for v in identidades]
+        tableau[:m, columnas] = anterior[:-1, :-1]
+        tableau[:m, -1] = anterior[:-1, -1]
+
+        fila = np.concatenate([A[-1], b[-1:]])
+        base = [self._columna[v] for v in self._base[:-1]]
+        fila -= fila[base] @ tableau[:m]
+        # Con exceso (coeficiente -1) se niega la fila para que la básica tenga 1
+        tableau[m] = fila / fila[self._columna[self._base[-1]]]
+        self._recalcular_fila_objetivo(tableau)
+        return tableau
+
+    def _recalcular_fila_objetivo(self, tableau: np.ndarray) -> None:
+        """Fila Z de `tableau` para los costos actuales y la base guardada."""
+        c_max = self._forma()[0]
+        base = [self._columna[v] for v in self._base]
+        fila_obj = np.concatenate([-c_max, [0.0]])
+        fila_obj -= fila_obj[base] @ tableau[:-1]
+        tableau[-1] = fila_obj
+
+    def remove_constraint(self, id_restriccion: int) -> None:
+        """Quita una restricción."""
+        i = self._posicion(id_restriccion)
+        if self._base is not None:
+            propia = ('h', id_restriccion)
+            if propia in self._base:
+                self._base = [v for v in self._base if v != propia]
+            else:
+                self._base = self._base_sin_fila(i)
+
+        for lista in (self._LI, self._LD, self._O, self._ids):
+            del lista[i]
+        self._estandar = None
+        self._tableau = None
+
+    def _base_sin_fila(self, i: int) -> Optional[List[Hashable]]:
+        """
+        Base para el problema sin la fila i: sale la variable básica k con mayor
+        |B^-1[k, i]|, lo que mantiene no singular la base reducida.
+        """
+        _, A, _, _, _ = self._forma()
+        if len(self._base) != A.shape[0] or any(v not in self._columna for v in self._base):
+            return None
+        B = A[:, [self._columna[v] for v in self._base]]
+        try:
+            columna_i = np.linalg.solve(B, np.eye(A.shape[0])[:, i])
+        except np.linalg.LinAlgError:
+            return None
+        k = int(np.argmax(np.abs(columna_i)))
+        return self._base[:k] + self._base[k + 1:]
+
+    def set_objective(
+        self,
+        C: List[float],
+        problem_type: Optional[Literal['minimization', 'maximization']] = None
+    ) -> None:
+        """Reemplaza los coeficientes de la función objetivo (y opcionalmente el sentido)."""
+        if len(C) != len(self.C):
+            raise ValueError("La cantidad de coeficientes debe coincidir con la cantidad de variables.")
+        self.C = [float(c) for c in C]
+        if problem_type is not None:
+            self.problem_type = problem_type
+
+        if self._estandar is not None:
+            c_max = self._estandar[0]
+            c_max[:len(self.C)] = self.C
+            if self.signos is not None:
+                c_max[[j for j, s in enumerate(self.signos) if s == '<=0']] *= -1
+            if self.problem_type == 'minimization':
+                c_max[:len(self.C)] *= -1
+            if self._tableau is not None:
+                self._recalcular_fila_objetivo(self._tableau)
+
+    def set_rhs(self, id_restriccion: int, ld: float) -> None:
+        """Reemplaza el lado derecho de una restricción."""
+        i = self._posicion(id_restriccion)
+        anterior, self._LD[i] = self._LD[i], float(ld)
+        if self._estandar is None:
+            return
+        if (anterior < 0) == (ld < 0):
+            self._estandar[2][i] = abs(ld)
+            if self._tableau is None:
+                return
+            if self._O[i] == "=":
+                # Sin holgura no hay columna de B^-1 a mano: se refactoriza
+                self._tableau = None
+                return
+            # B^-1 e_i es la columna de la holgura (o exceso, negada) de la fila i
+            j = self._columna[('h', id_restriccion)]
+            delta = (abs(ld) - abs(anterior)) / self._estandar[1][i, j]
+            self._tableau[:, -1] += delta * self._tableau[:, j]
+        else:
+            # Cambia el signo del LD: la fila se niega y s/e intercambian nombre
+            self._estandar = None
+            self._tableau = None
+
+    def _forma(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str], List[str]]:
+        """Forma estándar en caché (se reconstruye solo tras cambios estructurales)."""
+        if self._estandar is None:
+            n = len(self.C)
+            LI = self._LI if self._LI else np.zeros((0, n))
+            self._estandar = _forma_estandar(
+                self.problem_type, self.C, LI, self._LD, self._O, self.signos
+            )
+            self._identidades = [
+                ('x', j) if j < n else ('h', self._ids[int(nombre[1:]) - 1])
+                for j, nombre in enumerate(self._estandar[3])
+            ]
+            self._columna = {v: j for j, v in enumerate(self._identidades)}
+        return self._estandar
+
+    def _resolver_desde_cero(self, incluir_tablas: bool) -> Dict[str, Any]:
+        resultado, estado = _resolver_tableau(
+            self.problem_type, self.C, self._LI, self._LD, self._O, self.signos,
+            incluir_tablas=incluir_tablas
+        )
+        self._base = None
+        self._tableau = None
+        if estado is not None:
+            _, _, _, var_names, _ = self._forma()
+            # Puede quedar una artificial básica en nivel cero: sin base reutilizable
+            if all(v in var_names for v in estado["basic_vars"]):
+                self._base = [self._identidades[var_names.index(v)] for v in estado["basic_vars"]]
+        resultado["reoptimizado"] = False
+        return resultado
+
+    def _tableau_desde_base(self) -> Optional[Tuple[np.ndarray, List[str]]]:
+        """Tableau canónico para la base guardada (None si no es utilizable)."""
+        c_max, A, b, var_names, _ = self._forma()
+        m = A.shape[0]
+        if self._base is None or len(self._base) != m or len(set(self._base)) != m:
+            return None
+        if any(v not in self._columna for v in self._base):
+            return None
+
+        base = [self._columna[v] for v in self._base]
+        try:
+            cuerpo = np.linalg.solve(A[:, base], np.hstack([A, b.reshape(-1, 1)]))
+        except np.linalg.LinAlgError:
+            return None
+        cuerpo[np.abs(cuerpo) < 1e-11] = 0.0
+        cuerpo[:, base] = np.eye(m)
+
+        tableau = np.vstack([cuerpo, np.zeros(cuerpo.shape[1])])
+        self._recalcular_fila_objetivo(tableau)
+        return tableau, [var_names[j] for j in base]
+
+    def solve(self, incluir_tablas: bool = False) -> Dict[str, Any]:
+        """
+        Resuelve el problema partiendo de la última base óptima si es posible.
+        Con `incluir_tablas=False` (por defecto) no se formatean las tablas
+        intermedias y `tablas` queda vacía.
+        """
+        c_max, A, b, var_names, libres = self._forma()
+        if A.shape[0] == 0:
+            return self._resolver_desde_cero(incluir_tablas)
+
+        if self._tableau is not None and self._reoptimizaciones < REFACTORIZAR_CADA:
+            tableau = self._tableau
+            basic_vars = [var_names[self._columna[v]] for v in self._base]
+            self._reoptimizaciones += 1
+        else:
+            inicial = self._tableau_desde_base()
+            if inicial is None:
+                return self._resolver_desde_cero(incluir_tablas)
+            tableau, basic_vars = inicial
+            self._reoptimizaciones = 0
+        self._tableau = None
+
+        # Primal infactible (p. ej. tras set_rhs o add_constraint): Simplex Dual,
+        # siempre que la base sea dual factible
+        filas_no_libres = np.array([v not in libres for v in basic_vars])
+        if np.any(tableau[:-1, -1][filas_no_libres] < -TOL):
+            no_basicas = np.array([v not in basic_vars for v in var_names])
+            es_libre = np.array([v in libres for v in var_names])
+            costos = tableau[-1, :-1]
+            if np.any(costos[no_basicas & ~es_libre] < -TOL) or \
+                    np.any(np.abs(costos[no_basicas & es_libre]) > TOL):
+                return self._resolver_desde_cero(incluir_tablas)
+
+            status, tableau, basic_vars = _ejecutar_dual_simplex(
+                tableau, var_names, basic_vars, set(libres)
+            )
+            if status == "infactible":
+                self._base = None
+                return {"status": "infactible", "tablas": [], "solucion": None, "reoptimizado": True}
+            if status != "optimo":
+                return self._resolver_desde_cero(incluir_tablas)
+
+        status, tableau, tablas, basic_vars = _ejecutar_iteraciones_simplex(
+            tableau, var_names, basic_vars, fase=0,
+            variables_libres=set(libres), registrar_tablas=incluir_tablas
+        )
+        if status != "optimo":
+            self._base = None
+            return {"status": status, "tablas": tablas, "solucion": None, "reoptimizado": True}
+
+        self._base = [self._identidades[var_names.index(v)] for v in basic_vars]
+        self._tableau = tableau
+        solucion = _obtener_solucion_final(
+            tableau, var_names, basic_vars, len(self.C), self.problem_type, self.signos
+        )
+        return {"status": "optimo", "tablas": tablas, "solucion": solucion, "reoptimizado": True}
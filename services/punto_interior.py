@@ -0,0 +1,338 @@
+import logging
+import numpy as np
+from typing import List, Dict, Any, Tuple, Literal, Optional
+
+from .simplex_service import (
+    resolver_simplex_tabular,
+    _ejecutar_iteraciones_simplex,
+    _obtener_solucion_final,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _forma_estandar(
+    problem_type: str,
+    C: List[float],
+    LI: List[List[float]],
+    LD: List[float],
+    O: List[str],
+    signos: Optional[List[str]] = None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str], List[str]]:
+    """
+    Lleva el problema a la misma forma estándar que el tableau (sin artificiales):
+    columnas x, holguras s y excesos e, con LD >= 0 y variables '<=0' negadas.
+
+    Retorna (c_max, A, b, var_names, libres) donde c_max es el vector de costos en
+    sentido de maximización, tal como lo usa la fila Z del tableau.
+    """
+    num_vars = len(C)
+    num_restricciones = len(LI)
+
+    if signos is not None and len(signos) != num_vars:
+        raise ValueError("La cantidad de signos debe coincidir con la cantidad de variables.")
+
+    c_max = np.array(C, dtype=float)
+    A = np.array(LI, dtype=float).reshape(num_restricciones, num_vars)
+    b = np.array(LD, dtype=float)
+    ops = list(O)
+
+    negativas = b < 0
+    b[negativas] *= -1
+    A[negativas, :] *= -1
+    for i in np.flatnonzero(negativas):
+        if ops[i] == "<=":
+            ops[i] = ">="
+        elif ops[i] == ">=":
+            ops[i] = "<="
+
+    libres = []
+    if signos is not None:
+        for j, signo in enumerate(signos):
+            if signo == '<=0':
+                c_max[j] *= -1
+                A[:, j] *= -1
+            elif signo == 'libre':
+                libres.append(f'x{j+1}')
+
+    if problem_type == 'minimization':
+        c_max = -c_max
+
+    var_names = [f'x{i+1}' for i in range(num_vars)]
+    filas_s = [i for i, op in enumerate(ops) if op == "<="]
+    filas_e = [i for i, op in enumerate(ops) if op == ">="]
+
+    bloque_s = np.zeros((num_restricciones, len(filas_s)))
+    bloque_s[filas_s, np.arange(len(filas_s))] = 1.0
+    bloque_e = np.zeros((num_restricciones, len(filas_e)))
+    bloque_e[filas_e, np.arange(len(filas_e))] = -1.0
+
+    var_names += [f's{i+1}' for i in filas_s] + [f'e{i+1}' for i in filas_e]
+    A_std = np.hstack([A, bloque_s, bloque_e])
+    c_std = np.concatenate([c_max, np.zeros(len(filas_s) + len(filas_e))])
+
+    return c_std, A_std, b, var_names, libres
+
+
+def _resolver_ecuaciones_normales(M: np.ndarray, r: np.ndarray) -> np.ndarray:
+    """Resuelve M y = r (M simétrica semidefinida) con Cholesky regularizado."""
+    try:
+        L = np.linalg.cholesky(M)
+    except np.linalg.LinAlgError:
+        # Filas redundantes o mal condicionamiento: regularizar la diagonal
+        reg = 1e-10 * max(1.0, float(np.max(np.abs(np.diag(M)))))
+        try:
+            L = np.linalg.cholesky(M + reg * np.eye(M.shape[0]))
+        except np.linalg.LinAlgError:
+            return np.linalg.lstsq(M, r, rcond=None)[0]
+    return np.linalg.solve(L.T, np.linalg.solve(L, r))
+
+
+def _paso_maximo(v: np.ndarray, dv: np.ndarray) -> float:
+    """Mayor alfa en [0, 1] tal que v + alfa * dv >= 0."""
+    negativos = dv < 0
+    if not np.any(negativos):
+        return 1.0
+    return float(min(1.0, np.min(-v[negativos] / dv[negativos])))
+
+
+def _mehrotra(
+    c: np.ndarray,
+    A: np.ndarray,
+    b: np.ndarray,
+    tol: float = 1e-8,
+    max_iter: int = 100
+) -> Tuple[str, np.ndarray, np.ndarray, int]:
+    """
+    Método primal-dual predictor-corrector de Mehrotra para
+        min c^T x  s.a.  A x = b, x >= 0.
+
+    Retorna (status, x, y, iteraciones) con status 'optimo' o 'no_converge'.
+    """
+    m, n = A.shape
+    if m == 0:
+        return "no_converge", np.zeros(n), np.zeros(0), 0
+
+    # Punto inicial de Mehrotra
+    AAt = A @ A.T
+    x = A.T @ _resolver_ecuaciones_normales(AAt, b)
+    y = _resolver_ecuaciones_normales(AAt, A @ c)
+    z = c - A.T @ y
+    x += max(-1.5 * np.min(x), 0.0)
+    z += max(-1.5 * np.min(z), 0.0)
+    xz = float(x @ z)
+    x += 0.5 * xz / max(np.sum(z), 1e-12)
+    z += 0.5 * xz / max(np.sum(x), 1e-12)
+    x = np.maximum(x, 1e-8)
+    z = np.maximum(z, 1e-8)
+
+    norma_b = 1.0 + np.linalg.norm(b)
+    norma_c = 1.0 + np.linalg.norm(c)
+
+    for iteracion in range(1, max_iter + 1):
+        rb = A @ x - b
+        rc = A.T @ y + z - c
+        mu = float(x @ z) / n
+        brecha = abs(c @ x - b @ y) / (1.0 + abs(c @ x))
+
+        if (np.linalg.norm(rb) / norma_b < tol
+                and np.linalg.norm(rc) / norma_c < tol
+                and brecha < tol):
+            return "optimo", x, y, iteracion
+
+        # Divergencia: típicamente problema infactible o no acotado
+        if not np.isfinite(mu) or np.max(np.abs(x)) > 1e12 or np.max(np.abs(y)) > 1e12:
+            return "no_converge", x, y, iteracion
+
+        D = x / z
+        M = (A * D) @ A.T
+
+        def _direccion(rxz: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+            rhs = -rb + A @ (rxz / z - D * rc)
+            dy = _resolver_ecuaciones_normales(M, rhs)
+            dz = -rc - A.T @ dy
+            dx = -rxz / z - D * dz
+            return dx, dy, dz
+
+        # Predictor (dirección afín)
+        dx_a, dy_a, dz_a = _direccion(x * z)
+        alfa_p = _paso_maximo(x, dx_a)
+        alfa_d = _paso_maximo(z, dz_a)
+        mu_afin = float((x + alfa_p * dx_a) @ (z + alfa_d * dz_a)) / n
+        sigma = (mu_afin / mu) ** 3
+
+        # Corrector
+        dx, dy, dz = _direccion(x * z + dx_a * dz_a - sigma * mu)
+        alfa_p = min(1.0, 0.99 * _paso_maximo(x, dx))
+        alfa_d = min(1.0, 0.99 * _paso_maximo(z, dz))
+
+        x = x + alfa_p * dx
+        y = y + alfa_d * dy
+        z = z + alfa_d * dz
+
+    return "no_converge", x, y, max_iter
+
+
+def _elegir_base(
+    A: np.ndarray,
+    x: np.ndarray,
+    prioridad: np.ndarray,
+    tol: float = 1e-9
+) -> Optional[List[int]]:
+    """
+    Elige m columnas linealmente independientes de A, priorizando las de mayor
+    valor en `prioridad` (ortogonalización incremental de Gram-Schmidt).
+    """
+    m = A.shape[0]
+    orden = np.lexsort((-np.abs(x), -prioridad))
+    Q = np.zeros((m, m))
+    base: List[int] = []
+
+    for j in orden:
+        col = A[:, j]
+        norma = np.linalg.norm(col)
+        if norma <= tol:
+            continue
+        residuo = col - Q[:, :len(base)] @ (Q[:, :len(base)].T @ col)
+        norma_res = np.linalg.norm(residuo)
+        if norma_res > 1e-7 * norma:
+            Q[:, len(base)] = residuo / norma_res
+            base.append(int(j))
+            if len(base) == m:
+                return base
+    return None
+
+
+def _crossover(
+    c_max: np.ndarray,
+    A: np.ndarray,
+    b: np.ndarray,
+    var_names: List[str],
+    libres: List[str],
+    x: np.ndarray,
+    incluir_tablas: bool = True
+) -> Optional[Tuple[str, np.ndarray, List[Dict[str, Any]], List[str]]]:
+    """
+    Construye un tableau a partir de una base sugerida por la solución interior y
+    termina con iteraciones Simplex hasta un vértice óptimo. Con
+    `incluir_tablas=False` no se formatean las tablas de cada pivoteo.
+
+    Retorna None si la base obtenida no es primal factible.
+    """
+    tol = 1e-7
+    m = A.shape[0]
+    es_libre = np.array([v in libres for v in var_names], dtype=float)
+    base = _elegir_base(A, x, prioridad=es_libre + (np.abs(x) > tol))
+    if base is None:
+        return None
+
+    B = A[:, base]
+    try:
+        cuerpo = np.linalg.solve(B, np.hstack([A, b.reshape(-1, 1)]))
+    except np.linalg.LinAlgError:
+        return None
+
+    # Limpieza numérica de la base: identidad exacta en columnas básicas
+    cuerpo[np.abs(cuerpo) < 1e-11] = 0.0
+    cuerpo[:, base] = np.eye(m)
+
+    rhs = cuerpo[:, -1]
+    filas_no_libres = np.array([var_names[j] not in libres for j in base])
+    if np.any(rhs[filas_no_libres] < -tol):
+        return None
+    rhs[filas_no_libres & (rhs < 0)] = 0.0
+
+    fila_obj = np.concatenate([-c_max, [0.0]])
+    fila_obj -= fila_obj[base] @ cuerpo
+    tableau = np.vstack([cuerpo, fila_obj])
+
+    basic_vars = [var_names[j] for j in base]
+    return _ejecutar_iteraciones_simplex(
+        tableau, var_names, basic_vars, fase=2, variables_libres=set(libres),
+        registrar_tablas=incluir_tablas
+    )
+
+
+def resolver_punto_interior(
+    problem_type: Literal['minimization', 'maximization'],
+    C: List[float],
+    LI: List[List[float]],
+    LD: List[float],
+    O: List[Literal["<=", ">=", "="]],
+    signos: Optional[List[Literal[">=0", "<=0", "libre"]]] = None,
+    crossover: bool = True,
+    tol: float = 1e-8,
+    max_iter: int = 100,
+    incluir_tablas: bool = True
+) -> Dict[str, Any]:
+    """
+    Resuelve un problema de Programación Lineal con un método de punto interior
+    primal-dual (predictor-corrector de Mehrotra) sobre álgebra lineal de NumPy.
+
+    Con `crossover=True` la solución interior se lleva a una solución básica
+    mediante iteraciones Simplex, de modo que `solucion` tiene el mismo formato
+    que en `resolver_simplex_tabular`; las tablas del crossover quedan en `tablas`
+    (vacía con `incluir_tablas=False`).
+    La clave 'crossover' indica si la solución es básica: es False si no se pidió
+    o si el crossover falló y se retorna el punto interior.
+
+    Si el método no converge (problemas infactibles o no acotados), el problema se
+    resuelve con el Simplex tabular para obtener un diagnóstico exacto.
+    """
+    c_max, A, b, var_names, libres = _forma_estandar(problem_type, C, LI, LD, O, signos)
+    num_vars_originales = len(C)
+
+    # Las variables libres se desdoblan solo dentro del método interior
+    indices_libres = [var_names.index(v) for v in libres]
+    A_ip = np.hstack([A, -A[:, indices_libres]])
+    c_ip = np.concatenate([-c_max, c_max[indices_libres]])
+
+    status_ip, x_ip, _, iteraciones = _mehrotra(c_ip, A_ip, b, tol=tol, max_iter=max_iter)
+
+    if status_ip != "optimo":
+        resultado = resolver_simplex_tabular(
+            problem_type, C, LI, LD, list(O), signos, incluir_tablas=incluir_tablas
+        )
+        resultado["iteraciones_punto_interior"] = iteraciones
+        return resultado
+
+    x = x_ip[:A.shape[1]].copy()
+    x[indices_libres] -= x_ip[A.shape[1]:]
+
+    if crossover:
+        cruce = _crossover(c_max, A, b, var_names, libres, x, incluir_tablas=incluir_tablas)
+        if cruce is not None:
+            status, tableau, tablas, basic_vars = cruce
+            if status == "optimo":
+                solucion = _obtener_solucion_final(
+                    tableau, var_names, basic_vars, num_vars_originales, problem_type, signos
+                )
+                return {
+                    "status": "optimo",
+                    "tablas": tablas,
+                    "solucion": solucion,
+                    "crossover": True,
+                    "iteraciones_punto_interior": iteraciones,
+                }
+        logger.warning("El crossover no obtuvo una solución básica; se retorna el punto interior")
+
+    # Solución interior directa (o crossover fallido)
+    x[np.abs(x) < tol] = 0.0
+    valor = float(c_max @ x)
+    solucion = {
+        "variables": {},
+        "valor_optimo": -valor if problem_type == 'minimization' else valor,
+    }
+    for j, nombre in enumerate(var_names):
+        valor_j = float(x[j])
+        if j < num_vars_originales and signos is not None and signos[j] == '<=0':
+            valor_j = -valor_j
+        solucion["variables"][nombre] = round(valor_j, 6) if valor_j else 0.0
+
+    return {
+        "status": "optimo",
+        "tablas": [],
+        "solucion": solucion,
+        "crossover": False,
+        "iteraciones_punto_interior": iteraciones,
+    }
@@ -1,10 +1,6 @@
 import numpy as np
-from typing import List, Dict, Any, Tuple, Literal, Optional
+from typing import List, Dict, Any, Tuple, Literal, Optional, Set
 from io import BytesIO
-import matplotlib
-# Use a non-interactive backend suitable for servers and tests
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
 
 def _formatear_tableau(
     tableau: np.ndarray, 
@@ -16,18 +12,19 @@ def _formatear_tableau(
     
     # Encabezados de las columnas
     headers = ["Base"] + var_names + ["LD (RHS)"]
-    
+
+    # Redondeo vectorizado y conversión a float de Python en un solo paso
+    # (los tableaus float32 se formatean como float64, serializables a JSON)
+    valores = np.round(np.asarray(tableau, dtype=float), 6).tolist()
+
     # Fila de la Función Objetivo (Fila Z)
-    fila_obj_vals = [round(val, 6) for val in tableau[-1, :]]
-    fila_obj = ["Z"] + list(fila_obj_vals)
-    
+    fila_obj = ["Z"] + valores[-1]
+
     # Filas de las restricciones
-    filas_restricciones = []
-    for i, var_basica in enumerate(basic_vars):
-        fila_vals = [round(val, 6) for val in tableau[i, :]]
-        fila = [var_basica] + list(fila_vals)
-        filas_restricciones.append(fila)
-        
+    filas_restricciones = [
+        [var_basica] + valores[i] for i, var_basica in enumerate(basic_vars)
+    ]
+
     return {
         "titulo": titulo,
         "headers": headers,
@@ -40,13 +37,14 @@ def _obtener_solucion_final(
     var_names: List[str], 
     basic_vars: List[str], 
     num_vars_originales: int,
-    problem_type: str
+    problem_type: str,
+    signos: Optional[List[str]] = None
 ) -> Dict[str, Any]:
     """Extrae los valores finales del último tableau."""
     
     solucion = {"variables": {}, "valor_optimo": 0.0}
     
-    valor_optimo_raw = tableau[-1, -1]
+    valor_optimo_raw = float(tableau[-1, -1])
     
     # Se revierte el signo en caso de problema de minimización
     if problem_type == 'minimization':
@@ -66,7 +64,14 @@ def _obtener_solucion_final(
     # Sobrescribir con los valores de las variables básicas
     for i, var_basica in enumerate(basic_vars):
         if var_basica in solucion["variables"]:
-            solucion["variables"][var_basica] = round(tableau[i, -1], 6)
+            solucion["variables"][var_basica] = round(float(tableau[i, -1]), 6)
+
+    # Las variables no positivas se resolvieron como x' = -x: se revierte el signo
+    if signos:
+        for i, signo in enumerate(signos):
+            if signo == '<=0':
+                valor = solucion["variables"][f"x{i+1}"]
+                solucion["variables"][f"x{i+1}"] = -valor if valor else 0.0
             
     return solucion
 
@@ -75,56 +80,88 @@ def _ejecutar_iteraciones_simplex(
     var_names: List[str], 
     basic_vars: List[str],
     fase: int,
-    iter_offset: int = 0
+    iter_offset: int = 0,
+    variables_libres: Optional[Set[str]] = None,
+    tol: float = 1e-9,
+    registrar_tablas: bool = True
 ) -> Tuple[str, np.ndarray, List[Dict[str, Any]], List[str]]:
     """
     Ejecuta el bucle de iteraciones del Simplex sobre un tableau dado.
     Retorna (status, tableau_final, historial_tablas, basic_vars_finales)
+
+    Las primeras len(basic_vars) filas son restricciones y la última es la fila Z;
+    las filas intermedias (p. ej. la fila Z de la Fase 2 durante la Fase 1) se
+    actualizan en cada pivoteo pero no participan del test de razón.
+
+    Las variables en `variables_libres` (signo no restringido) entran a la base
+    con prioridad, en cualquier sentido, y una vez básicas nunca salen de ella.
+
+    Con `registrar_tablas=False` no se formatea ninguna tabla (historial vacío).
     """
     
     historial_tablas = []
-    num_restricciones = tableau.shape[0] - 1
+    num_restricciones = len(basic_vars)
     
     # Copiamos las variables básicas para no modificar la lista original en el scope superior
     current_basic_vars = list(basic_vars)
 
+    libres = variables_libres or set()
+    indices_libres = [j for j, nombre in enumerate(var_names) if nombre in libres]
+
     # Límite de iteraciones para evitar bucles infinitos (degeneración)
     for iteracion in range(1, 51):
-        titulo = f"Fase {fase} - Iteración {iteracion + iter_offset}"
-        historial_tablas.append(
-            _formatear_tableau(tableau, var_names, current_basic_vars, titulo)
-        )
+        if registrar_tablas:
+            titulo = f"Fase {fase} - Iteración {iteracion + iter_offset}"
+            historial_tablas.append(
+                _formatear_tableau(tableau, var_names, current_basic_vars, titulo)
+            )
 
         # 1. Comprobar optimalidad:
         # Fila Z (última fila), sin incluir la columna RHS (última columna)
         fila_obj = tableau[-1, :-1]
         
         # Tolerancia para comparaciones de punto flotante
-        TOL = -1e-9
+        TOL = -tol
         
-        if np.all(fila_obj >= TOL):
+        # Variables libres no básicas con costo reducido no nulo: entran primero.
+        # Si su costo reducido es positivo, conviene que la variable decrezca.
+        entrantes_libres = [
+            j for j in indices_libres
+            if var_names[j] not in current_basic_vars and abs(fila_obj[j]) > -TOL
+        ]
+
+        if entrantes_libres:
+            pivot_col = max(entrantes_libres, key=lambda j: abs(fila_obj[j]))
+            direccion = 1.0 if fila_obj[pivot_col] < 0 else -1.0
+        elif np.all(fila_obj >= TOL):
             # ÓPTIMO ENCONTRADO
             return "optimo", tableau, historial_tablas, current_basic_vars
+        else:
+            # 2. Encontrar Columna Pivote (variable entrante)
+            # La columna con el valor más negativo en la fila Z
+            pivot_col = np.argmin(fila_obj)
+            direccion = 1.0
 
-        # 2. Encontrar Columna Pivote (variable entrante)
-        # La columna con el valor más negativo en la fila Z
-        pivot_col = np.argmin(fila_obj)
-        columna_pivote_vals = tableau[:-1, pivot_col] # Valores de la columna, sin fila Z
+        # Valores de la columna, sin fila Z (orientados según el sentido de entrada)
+        columna_pivote_vals = direccion * tableau[:num_restricciones, pivot_col]
+
+        # Las filas cuya variable básica es libre no limitan el paso
+        filas_validas = columna_pivote_vals > tol
+        if libres:
+            filas_validas &= np.array([v not in libres for v in current_basic_vars])
 
         # 3. Comprobar si es No Acotado 
-        if np.all(columna_pivote_vals <= 1e-9):
+        if not np.any(filas_validas):
             # Todos los coeficientes en la columna pivote son <= 0
             return "no acotado", tableau, historial_tablas, current_basic_vars
 
         # 4. Encontrar Fila Pivote (Test de Razón Mínima)
-        rhs = tableau[:-1, -1] # Lado derecho (RHS)
+        rhs = tableau[:num_restricciones, -1] # Lado derecho (RHS)
         
         # Ignorar filas donde el elemento de la columna pivote es <= 0
         # Usamos np.inf para valores no válidos
         ratios = np.full(num_restricciones, np.inf)
-        for i in range(num_restricciones):
-            if columna_pivote_vals[i] > 1e-9:
-                ratios[i] = rhs[i] / columna_pivote_vals[i]
+        ratios[filas_validas] = rhs[filas_validas] / columna_pivote_vals[filas_validas]
 
         pivot_row = np.argmin(ratios)
         
@@ -139,207 +176,229 @@ def _ejecutar_iteraciones_simplex(
         tableau[pivot_row, :] = tableau[pivot_row, :] / pivot_element
         
         # b) Hacer cero los otros elementos de la columna pivote
-        for i in range(tableau.shape[0]): # Incluye la fila Z
+        for i in range(tableau.shape[0]): # Incluye la(s) fila(s) Z
             if i != pivot_row:
                 factor = tableau[i, pivot_col]
-                tableau[i, :] = tableau[i, :] - factor * tableau[pivot_row, :]
+                if factor != 0:
+                    tableau[i, :] -= factor * tableau[pivot_row, :]
 
     # Si llega aquí, excedió el límite de iteraciones
     return "max_iterations_reached", tableau, historial_tablas, current_basic_vars
 
-def resolver_simplex_tabular(
+def _ejecutar_dual_simplex(
+    tableau: np.ndarray,
+    var_names: List[str],
+    basic_vars: List[str],
+    variables_libres: Optional[Set[str]] = None,
+    max_iter: int = 500
+) -> Tuple[str, np.ndarray, List[str]]:
+    """
+    Ejecuta el Simplex Dual sobre un tableau dual factible (fila Z >= 0) cuyo
+    RHS puede tener valores negativos, p. ej. después de agregar una restricción
+    a un tableau óptimo. No registra tablas intermedias.
+    Retorna (status, tableau_final, basic_vars_finales) con status 'optimo',
+    'infactible' o 'max_iterations_reached'.
+    """
+    TOL = 1e-9
+    current_basic_vars = list(basic_vars)
+    libres = variables_libres or set()
+    es_libre = np.array([v in libres for v in var_names])
+
+    for _ in range(max_iter):
+        rhs = tableau[:-1, -1].copy()
+        # Las variables básicas libres pueden tomar valores negativos
+        if libres:
+            rhs[[v in libres for v in current_basic_vars]] = 0.0
+
+        pivot_row = int(np.argmin(rhs))
+        if rhs[pivot_row] >= -TOL:
+            return "optimo", tableau, current_basic_vars
+
+        fila = tableau[pivot_row, :-1]
+        fila_obj = tableau[-1, :-1]
+        no_basicas = np.array([v not in current_basic_vars for v in var_names])
+
+        # Una variable libre no básica (costo reducido nulo) entra de inmediato
+        candidatas_libres = np.flatnonzero(no_basicas & es_libre & (np.abs(fila) > TOL))
+        if candidatas_libres.size:
+            pivot_col = int(candidatas_libres[0])
+        else:
+            candidatas = no_basicas & ~es_libre & (fila < -TOL)
+            if not np.any(candidatas):
+                return "infactible", tableau, current_basic_vars
+            ratios = np.full(fila.shape, np.inf)
+            ratios[candidatas] = np.maximum(fila_obj[candidatas], 0.0) / -fila[candidatas]
+            pivot_col = int(np.argmin(ratios))
+
+        current_basic_vars[pivot_row] = var_names[pivot_col]
+        tableau[pivot_row, :] /= tableau[pivot_row, pivot_col]
+        factores = tableau[:, pivot_col].copy()
+        factores[pivot_row] = 0.0
+        tableau -= np.outer(factores, tableau[pivot_row, :])
+
+    return "max_iterations_reached", tableau, current_basic_vars
+
+def _tolerancia(dtype: np.dtype) -> float:
+    """Tolerancia de comparación acorde a la precisión del tableau."""
+    return max(1e-9, 100 * float(np.finfo(dtype).eps))
+
+def _resolver_tableau(
     problem_type: Literal['minimization', 'maximization'],
     C: List[float],
     LI: List[List[float]],
     LD: List[float],
-    O: List[Literal["<=", ">=", "="]]
-) -> Dict[str, Any]:
+    O: List[Literal["<=", ">=", "="]],
+    signos: Optional[List[Literal[">=0", "<=0", "libre"]]] = None,
+    dtype: Any = np.float64,
+    incluir_tablas: bool = True,
+    diagnostico: Optional[Dict[str, Any]] = None
+) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
     """
-    Resuelve un problema de Programación Lineal usando el Método Simplex Tabular
-    (Dos Fases si es necesario).
+    Núcleo de `resolver_simplex_tabular`. Además del resultado, retorna el estado
+    final de la Fase 2 (tableau, nombres de columnas, base y variables libres)
+    cuando el problema es óptimo, para poder reoptimizar desde él.
 
-    Retorna un diccionario con:
-    - status: 'optimo', 'infactible', 'no acotado'
-    - tablas: Una lista de todas las tablas intermedias y finales.
-    - solucion: (si es óptimo) Un diccionario con 'valor_optimo' y 'variables'.
+    Si se pasa `diagnostico` (un dict) y la Fase 1 termina con artificiales no
+    nulas, se completa con el tableau final de la Fase 1 y sus nombres de columnas.
+
+    Todo el Simplex trabaja sobre un único espacio de trabajo preasignado:
+
+        columnas: [ artificiales | x | holguras | excesos | LD ]
+        filas:    [ restricciones | Z Fase 2 | Z Fase 1 ]
+
+    La Fase 1 usa el espacio completo; la Fase 2 es la vista W[:-1, n_art:]
+    (sin copiar), cuya fila Z se mantiene canónica durante los pivoteos de la
+    Fase 1 por ser una fila más del tableau.
     """
 
     num_vars_originales = len(C)
     num_restricciones = len(LI)
-    
-    # Estandarización del problema
-    
-    C_interno = np.array(C, dtype=float)
-    A_matrix = np.array(LI, dtype=float)
-    LD_vector = np.array(LD, dtype=float).reshape(-1, 1) # Vector columna
-    
+    dtype = np.dtype(dtype)
+    tol = _tolerancia(dtype)
+
+    if signos is not None and len(signos) != num_vars_originales:
+        raise ValueError("La cantidad de signos debe coincidir con la cantidad de variables.")
+
+    # Filas con LD negativo: se invierte la desigualdad (la fila se niega más abajo).
+    # Se trabaja sobre una copia para no modificar la lista del llamador.
+    O = list(O)
     for i in range(num_restricciones):
-        if LD_vector[i] < 0:
-            LD_vector[i] *= -1
-            A_matrix[i, :] *= -1
+        if LD[i] < 0:
             if O[i] == "<=":
                 O[i] = ">="
             elif O[i] == ">=":
                 O[i] = "<="
-                
-    if problem_type == 'minimization':
-        C_interno = -C_interno
-    
-    # Nombres de las variables
-    var_names = [f'x{i+1}' for i in range(num_vars_originales)]
-    basic_vars_por_fila = [None] * num_restricciones 
-    
-    # Listas para almacenar columnas y sus nombres
-    slack_cols_list = []
-    surplus_cols_list = []
-    artificial_cols_list = []
-    
-    slack_names = []
-    surplus_names = []
-    artificial_names = []
-    
-    necesita_fase_1 = False
 
+    # Nombres de las variables, en el orden de columnas del espacio de trabajo
+    slack_names = [f's{i+1}' for i, op in enumerate(O) if op == "<="]
+    surplus_names = [f'e{i+1}' for i, op in enumerate(O) if op == ">="]
+    artificial_names = [f'a{i+1}' for i, op in enumerate(O) if op in (">=", "=")]
+    necesita_fase_1 = bool(artificial_names)
+
+    num_art = len(artificial_names)
+    num_cols = num_art + num_vars_originales + len(slack_names) + len(surplus_names) + 1
+    num_filas = num_restricciones + (2 if necesita_fase_1 else 1)
+
+    # Estandarización del problema, escrita directamente en el espacio de trabajo
+
+    W = np.zeros((num_filas, num_cols), dtype=dtype)
+    inicio_x = num_art
+    fin_x = num_art + num_vars_originales
+    A_matrix = W[:num_restricciones, inicio_x:fin_x]
+    A_matrix[:] = LI
+    LD_vector = W[:num_restricciones, -1]
+    LD_vector[:] = LD
+    fila_z2 = W[num_restricciones, :]
+    fila_z2[inicio_x:fin_x] = C
+
+    # Variables no positivas: se sustituye x = -x' (x' >= 0)
+    variables_libres = set()
+    if signos is not None:
+        for j, signo in enumerate(signos):
+            if signo == '<=0':
+                fila_z2[inicio_x + j] *= -1
+                A_matrix[:, j] *= -1
+            elif signo == 'libre':
+                variables_libres.add(f'x{j+1}')
+
+    # Filas con LD negativo: se multiplican por -1
+    negativas = LD_vector < 0
+    LD_vector[negativas] *= -1
+    A_matrix[negativas, :] *= -1
+
+    # Fila Z de la Fase 2: -C para maximizar (C ya negado si se minimiza)
+    if problem_type == 'maximization':
+        fila_z2[inicio_x:fin_x] *= -1
+
+    # Columnas identidad de holguras, excesos y artificiales
+    basic_vars_fase1 = [None] * num_restricciones
+    col_s = fin_x
+    col_e = col_s + len(slack_names)
+    col_a = 0
     for i, op in enumerate(O):
         if op == "<=":
             # Añadir variable de Holgura
-            var_name = f's{i+1}'
-            slack_names.append(var_name)
-            basic_vars_por_fila[i] = var_name # Asignar por índice
-            
-            col = np.zeros(num_restricciones)
-            col[i] = 1
-            slack_cols_list.append(col)
-            
+            W[i, col_s] = 1
+            basic_vars_fase1[i] = f's{i+1}'
+            col_s += 1
         elif op == ">=":
             # Añadir variable de Exceso (surplus) y Artificial
-            necesita_fase_1 = True
-            
-            var_name_e = f'e{i+1}'
-            surplus_names.append(var_name_e)
-            col_e = np.zeros(num_restricciones)
-            col_e[i] = -1
-            surplus_cols_list.append(col_e)
-            
-            var_name_a = f'a{i+1}'
-            artificial_names.append(var_name_a)
-            basic_vars_por_fila[i] = var_name_a # Asignar por índice
-            col_a = np.zeros(num_restricciones)
-            col_a[i] = 1
-            artificial_cols_list.append(col_a)
-            
-        elif op == "=":
-            # Añadir variable Artificial
-            necesita_fase_1 = True
-            var_name_a = f'a{i+1}'
-            artificial_names.append(var_name_a)
-            basic_vars_por_fila[i] = var_name_a # Asignar por índice
-            
-            col_a = np.zeros(num_restricciones)
-            col_a[i] = 1
-            artificial_cols_list.append(col_a)
+            W[i, col_e] = -1
+            col_e += 1
+        if op in (">=", "="):
+            W[i, col_a] = 1
+            basic_vars_fase1[i] = f'a{i+1}'
+            col_a += 1
 
-    # Ensamblar la matriz de restricciones y var_names EN EL MISMO ORDEN
-    partes_A = [A_matrix]
-    
-    if slack_cols_list:
-        partes_A.append(np.stack(slack_cols_list, axis=1))
-        var_names.extend(slack_names)
-        
-    if surplus_cols_list:
-        partes_A.append(np.stack(surplus_cols_list, axis=1))
-        var_names.extend(surplus_names)
-
-    if artificial_cols_list:
-        partes_A.append(np.stack(artificial_cols_list, axis=1))
-        var_names.extend(artificial_names)
-    
-    # Matriz A completa (cuerpo del tableau)
-    tableau_cuerpo = np.hstack(partes_A)
-    
-    # Ahora filtramos los None 
-    basic_vars_fase1 = [v for v in basic_vars_por_fila if v is not None]
+    var_names = artificial_names + [f'x{i+1}' for i in range(num_vars_originales)] \
+        + slack_names + surplus_names
 
     historial_tablas_completo = []
     
     # FASE 1 (Si es necesaria) 
     
     if necesita_fase_1:
-        
-        fila_obj_fase1 = np.zeros(tableau_cuerpo.shape[1] + 1)
-        indices_a = [i for i, nombre in enumerate(var_names) if nombre.startswith('a')]
-        fila_obj_fase1[indices_a] = 1.0
-        
-        tableau_fase1 = np.vstack([
-            np.hstack([tableau_cuerpo, LD_vector]), 
-            fila_obj_fase1                        
-        ])
-        
-        # Poner Fila Z en forma canónica
-        for i, var_basica in enumerate(basic_vars_fase1): # Usar la lista limpia
+
+        # Fila Z de la Fase 1 (suma de artificiales) en forma canónica
+        fila_z1 = W[-1, :]
+        fila_z1[:num_art] = 1.0
+        for i, var_basica in enumerate(basic_vars_fase1):
             if var_basica.startswith('a'):
-                tableau_fase1[-1, :] -= tableau_fase1[i, :]
+                fila_z1 -= W[i, :]
         
-        # Ejecutar Simplex Fase 1
-        status_f1, tableau_f1_final, tablas_f1, basic_vars_f1 = \
+        # Ejecutar Simplex Fase 1 (la fila Z de la Fase 2 se actualiza en cada pivoteo)
+        status_f1, _, tablas_f1, basic_vars_f1 = \
             _ejecutar_iteraciones_simplex(
-                tableau_fase1, var_names, basic_vars_fase1, fase=1 # Usar la lista limpia
+                W, var_names, basic_vars_fase1, fase=1,
+                variables_libres=variables_libres,
+                tol=tol,
+                registrar_tablas=incluir_tablas
             )
         
         historial_tablas_completo.extend(tablas_f1)
         
         if status_f1 != 'optimo':
-            return {"status": status_f1, "tablas": historial_tablas_completo, "solucion": None}
+            return {"status": status_f1, "tablas": historial_tablas_completo, "solucion": None}, None
 
-        if abs(tableau_f1_final[-1, -1]) > 1e-9:
-            return {"status": "infactible", "tablas": historial_tablas_completo, "solucion": None}
+        if abs(W[-1, -1]) > tol:
+            if diagnostico is not None:
+                diagnostico.update(tableau=W, var_names=var_names, tol=tol)
+            return {"status": "infactible", "tablas": historial_tablas_completo, "solucion": None}, None
 
-        # Preparación FASE 2 ---
-
-        indices_a = [i for i, nombre in enumerate(var_names) if nombre.startswith('a')]
-        
-        tableau_cuerpo_f2 = np.delete(tableau_f1_final[:-1, :], indices_a, axis=1)
-        var_names_f2 = [v for v in var_names if not v.startswith('a')]
-        
-        fila_obj_f2 = np.zeros(len(var_names_f2) + 1) 
-        fila_obj_f2[:num_vars_originales] = -C_interno
-        
-        tableau_fase2 = np.vstack([
-            tableau_cuerpo_f2,
-            fila_obj_f2
-        ])
-        
-        for i, var_basica in enumerate(basic_vars_f1):
-            if var_basica in var_names_f2:
-                col_basica_idx = var_names_f2.index(var_basica)
-                coef_en_obj = tableau_fase2[-1, col_basica_idx]
-                
-                if abs(coef_en_obj) > 1e-9:
-                    tableau_fase2[-1, :] -= coef_en_obj * tableau_fase2[i, :]
-        
-        tableau_para_iterar = tableau_fase2
-        var_names_para_iterar = var_names_f2
+        # Preparación FASE 2: vista sin artificiales ni fila Z de Fase 1
         basic_vars_para_iterar = basic_vars_f1
         fase_actual = 2
-        iter_offset = len(historial_tablas_completo)
+        iter_offset = len(tablas_f1)
 
     else:
         # Problema Estándar (Sin Fase 1) 
-        
-        fila_obj_f_std = np.zeros(tableau_cuerpo.shape[1] + 1)
-        fila_obj_f_std[:num_vars_originales] = -C_interno
-        
-        tableau_std = np.vstack([
-            np.hstack([tableau_cuerpo, LD_vector]), 
-            fila_obj_f_std                        
-        ])
-        
-        tableau_para_iterar = tableau_std
-        var_names_para_iterar = var_names
-        basic_vars_para_iterar = basic_vars_fase1 # Usar la lista limpia
+        basic_vars_para_iterar = basic_vars_fase1
         fase_actual = 0 
         iter_offset = 0
 
+    tableau_para_iterar = W[:num_restricciones + 1, num_art:]
+    var_names_para_iterar = var_names[num_art:]
+
     # FASE 2 (o Fase Única) 
     
     status_f2, tableau_f2_final, tablas_f2, basic_vars_f2 = \
@@ -348,7 +407,10 @@ def resolver_simplex_tabular(
             var_names_para_iterar, 
             basic_vars_para_iterar, 
             fase=fase_actual,
-            iter_offset=iter_offset
+            iter_offset=iter_offset,
+            variables_libres=variables_libres,
+            tol=tol,
+            registrar_tablas=incluir_tablas
         )
 
     historial_tablas_completo.extend(tablas_f2)
@@ -356,21 +418,85 @@ def resolver_simplex_tabular(
     # Preparar Resultados Finales 
     
     if status_f2 != 'optimo':
-        return {"status": status_f2, "tablas": historial_tablas_completo, "solucion": None}
+        return {"status": status_f2, "tablas": historial_tablas_completo, "solucion": None}, None
 
     solucion_final = _obtener_solucion_final(
         tableau_f2_final,
         var_names_para_iterar,
         basic_vars_f2,
         num_vars_originales,
-        problem_type
+        problem_type,
+        signos
     )
     
-    return {
+    resultado = {
         "status": "optimo",
         "tablas": historial_tablas_completo,
         "solucion": solucion_final
     }
+    estado = {
+        "tableau": tableau_f2_final,
+        "var_names": var_names_para_iterar,
+        "basic_vars": basic_vars_f2,
+        "variables_libres": variables_libres,
+    }
+    return resultado, estado
+
+def resolver_simplex_tabular(
+    problem_type: Literal['minimization', 'maximization'],
+    C: List[float],
+    LI: List[List[float]],
+    LD: List[float],
+    O: List[Literal["<=", ">=", "="]],
+    signos: Optional[List[Literal[">=0", "<=0", "libre"]]] = None,
+    dtype: Literal['float64', 'float32'] = 'float64',
+    incluir_tablas: bool = True,
+    buscar_iis: bool = False,
+    max_workers: int = 1
+) -> Dict[str, Any]:
+    """
+    Resuelve un problema de Programación Lineal usando el Método Simplex Tabular
+    (Dos Fases si es necesario).
+
+    `signos` declara el signo de cada variable: '>=0' (por defecto), '<=0' o
+    'libre'. Las variables libres se manejan sin desdoblarlas en x+ - x-.
+    `dtype` elige la precisión del tableau ('float32' usa la mitad de memoria).
+    Con `incluir_tablas=False` no se formatean las tablas intermedias.
+    Con `buscar_iis=True`, un problema infactible incluye en 'iis' un subconjunto
+    irreducible de restricciones en conflicto (índices desde 1), buscado con
+    `max_workers` procesos (ver `services.iis`), e 'iis_irreducible' en False si
+    alguna prueba no se pudo decidir y el subconjunto podría no ser mínimo.
+
+    Retorna un diccionario con:
+    - status: 'optimo', 'infactible', 'no acotado'
+    - tablas: Una lista de todas las tablas intermedias y finales.
+    - solucion: (si es óptimo) Un diccionario con 'valor_optimo' y 'variables'.
+    """
+    diagnostico = {} if buscar_iis else None
+    resultado, _ = _resolver_tableau(
+        problem_type, C, LI, LD, O, signos, dtype, incluir_tablas, diagnostico
+    )
+    if diagnostico:
+        from .iis import buscar_iis as _buscar_iis, soporte_farkas
+        iis, irreducible = _buscar_iis(
+            len(C), LI, LD, O, signos,
+            soporte=soporte_farkas(diagnostico, len(LI)),
+            max_workers=max_workers
+        )
+        resultado["iis"] = [i + 1 for i in iis]
+        resultado["iis_irreducible"] = irreducible
+    return resultado
+
+def _pyplot():
+    """
+    Importa pyplot recién en el primer gráfico: matplotlib es la dependencia más
+    pesada del servicio y no debe retrasar el arranque ni las resoluciones.
+    """
+    import matplotlib
+    # Use a non-interactive backend suitable for servers and tests
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
 
 def generar_grafico_2d(
     C,
@@ -463,6 +589,7 @@ def generar_grafico_2d(
 
     x = np.linspace(x_min, x_max, 400)  # Rango de valores para x1
 
+    plt = _pyplot()
     plt.figure(figsize=(10, 6))
 
     # Graficar restricciones
@@ -0,0 +1,120 @@
+import asyncio
+import pytest
+from fastapi import FastAPI, File, HTTPException, UploadFile
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+from main import app
+import routers.simplex as rs
+from routers.admision import ControlAdmision, MiddlewareLimiteCuerpo, estimar_costo, identificar_cliente
+
+PROBLEMA = {
+    "problem_type": "maximization",
+    "C": [3, 5],
+    "LI": [[1, 0], [0, 2], [3, 2]],
+    "LD": [4, 12, 18],
+    "O": ["<=", "<=", "<="],
+}
+
+
+def test_estimacion_separa_problemas_chicos_de_grandes():
+    control = ControlAdmision()
+    aula = estimar_costo(3, 3, 9)
+    grande = estimar_costo(3000, 3000, 90000)
+    assert aula <= control.costo_inline < grande
+    assert estimar_costo(30, 30, 900, incluir_tablas=False) < estimar_costo(30, 30, 900)
+    assert estimar_costo(30, 30, 900, enteros=True) > estimar_costo(30, 30, 900)
+    assert estimar_costo(30, 30, 900, iis=True) > estimar_costo(30, 30, 900)
+
+
+def test_rechazo_413_antes_de_resolver(monkeypatch):
+    monkeypatch.setattr(rs, "ADMISION", ControlAdmision(costo_maximo=10))
+    r = TestClient(app).post("/simplex/solve-tabular", json=PROBLEMA)
+    assert r.status_code == 413
+
+
+def test_cuota_por_cliente():
+    control = ControlAdmision(max_por_cliente=1)
+
+    async def _escenario():
+        async with control.cupo("a"):
+            with pytest.raises(HTTPException) as exc:
+                async with control.cupo("a"):
+                    pass
+            assert exc.value.status_code == 429
+            async with control.cupo("b"):
+                pass
+        async with control.cupo("a"):
+            pass
+
+    asyncio.run(_escenario())
+    assert control._en_curso == {}
+
+
+def test_problema_grande_se_resuelve_en_pool(monkeypatch):
+    control = ControlAdmision(costo_inline=0, workers=1)
+    monkeypatch.setattr(rs, "ADMISION", control)
+    try:
+        r = TestClient(app).post("/simplex/solve-tabular", json=PROBLEMA)
+    finally:
+        control.cerrar()
+    assert r.status_code == 200
+    assert r.json()["solucion"]["valor_optimo"] == pytest.approx(36)
+
+
+def test_pool_lleno_responde_429(monkeypatch):
+    control = ControlAdmision(costo_inline=0, max_en_pool=0)
+    monkeypatch.setattr(rs, "ADMISION", control)
+    r = TestClient(app).post("/simplex/solve-tabular", json=PROBLEMA)
+    assert r.status_code == 429
+    assert r.headers["retry-after"] == "5"
+
+
+def test_sin_tablas():
+    r = TestClient(app).post("/simplex/solve-tabular", json={**PROBLEMA, "incluir_tablas": False})
+    assert "tablas" not in r.json()
+    assert r.json()["solucion"]["valor_optimo"] == pytest.approx(36)
+
+
+def test_cliente_es_la_direccion_de_la_conexion():
+    request = Request({
+        "type": "http",
+        "headers": [(b"x-client-id", b"otro")],
+        "client": ("10.0.0.7", 5000),
+    })
+    assert identificar_cliente(request) == "10.0.0.7"
+
+
+def test_filas_de_distinto_largo_son_400():
+    problema = dict(PROBLEMA, LI=[[1, 0], [0], [3, 2]])
+    r = TestClient(app).post("/simplex/solve-tabular", json=problema)
+    assert r.status_code == 400
+
+
+def test_limite_de_cuerpo_antes_de_parsear():
+    parseados = []
+    prueba = FastAPI()
+
+    @prueba.post("/subir")
+    async def subir(archivo: UploadFile = File(...)):
+        parseados.append(archivo.filename)
+        return {}
+
+    prueba.add_middleware(MiddlewareLimiteCuerpo, rutas={"/subir"}, max_bytes=1000)
+    client = TestClient(prueba)
+    archivo = {"archivo": ("m.lp", b"x" * 5000, "text/plain")}
+    assert client.post("/subir", files=archivo).status_code == 413
+    # Sin Content-Length (chunked): se corta al superar el límite mientras se recibe
+    cuerpo = iter([b"x" * 800, b"x" * 800])
+    r = client.post("/subir", content=cuerpo, headers={"Content-Type": "multipart/form-data; boundary=b"})
+    assert r.status_code == 413
+    assert parseados == []
+    assert client.post("/subir", files={"archivo": ("m.lp", b"x" * 10, "text/plain")}).status_code == 200
+
+
+def test_apagado_cierra_el_pool(monkeypatch):
+    control = ControlAdmision(costo_inline=0, workers=1)
+    monkeypatch.setattr(rs, "ADMISION", control)
+    with TestClient(app) as client:
+        assert client.post("/simplex/solve-tabular", json=PROBLEMA).status_code == 200
+        assert control._pool is not None
+    assert control._pool is None
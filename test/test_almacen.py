@@ -0,0 +1,130 @@
+import asyncio
+import numpy as np
+from fastapi.testclient import TestClient
+from main import app
+import routers.simplex as rs
+from services.almacen import AlmacenResultados, clave_problema
+from services.simplex_service import resolver_simplex_tabular
+
+PROBLEMA = {
+    "problem_type": "maximization",
+    "C": [3, 5],
+    "LI": [[1, 0], [0, 2], [3, 2]],
+    "LD": [4, 12, 18],
+    "O": ["<=", "<=", "<="],
+}
+
+
+def _resolver():
+    return resolver_simplex_tabular(
+        PROBLEMA["problem_type"], PROBLEMA["C"], PROBLEMA["LI"], PROBLEMA["LD"], list(PROBLEMA["O"])
+    )
+
+
+def test_clave_independiente_de_orden_y_tipo_numerico():
+    otro = dict(reversed(list(PROBLEMA.items())))
+    otro["C"] = [3.0, 5.0]
+    assert clave_problema(otro) == clave_problema(PROBLEMA)
+    assert clave_problema({**PROBLEMA, "LD": [4, 12, 19]}) != clave_problema(PROBLEMA)
+
+
+def test_resultado_persiste_entre_instancias(tmp_path):
+    resultado = _resolver()
+    clave = clave_problema(PROBLEMA)
+    AlmacenResultados(str(tmp_path)).guardar_resultado(clave, resultado)
+
+    # Otra instancia (otro worker o un reinicio) lee lo mismo
+    leido = AlmacenResultados(str(tmp_path)).obtener_resultado(clave)
+    assert leido["solucion"] == resultado["solucion"]
+    assert leido["tablas"] == resultado["tablas"]
+
+
+def test_historial_mapeado_en_memoria(tmp_path):
+    almacen = AlmacenResultados(str(tmp_path))
+    almacen.guardar_resultado("k", _resolver())
+    meta, datos = almacen.obtener_historial("k")
+    assert isinstance(datos, np.memmap)
+    assert not datos.flags.writeable
+    assert len(meta) == len(_resolver()["tablas"])
+
+
+def test_resultado_sin_tablas_no_las_agrega(tmp_path):
+    almacen = AlmacenResultados(str(tmp_path))
+    almacen.guardar_resultado("k", {"status": "infactible", "solucion": None})
+    assert almacen.obtener_resultado("k") == {"status": "infactible", "solucion": None}
+
+
+def test_desalojo_lru(tmp_path):
+    almacen = AlmacenResultados(str(tmp_path), max_bytes=2500, intervalo_acceso=0)
+    for i in range(3):
+        almacen.guardar_grafico(f"g{i}", bytes(1000))
+        if i == 1:
+            almacen.obtener_grafico("g0")  # g0 pasa a ser el más reciente
+    assert almacen.tamano_total() <= 2500
+    assert almacen.obtener_grafico("g1") is None
+    assert almacen.obtener_grafico("g0") is not None
+    assert almacen.obtener_grafico("g2") is not None
+
+
+def test_lecturas_seguidas_no_escriben(tmp_path):
+    almacen = AlmacenResultados(str(tmp_path))
+    almacen.guardar_resultado("k", _resolver())
+    escrituras = []
+    conectar = almacen._conectar
+
+    def _conectar_registrando():
+        con = conectar()
+        con.set_trace_callback(lambda sql: escrituras.append(sql) if sql.startswith("UPDATE") else None)
+        return con
+
+    almacen._conectar = _conectar_registrando
+    for _ in range(3):
+        assert almacen.obtener_resultado("k") is not None
+    assert escrituras == []
+
+
+def test_router_usa_almacen(tmp_path, monkeypatch):
+    monkeypatch.setattr(rs, "ALMACEN", AlmacenResultados(str(tmp_path)))
+    client = TestClient(app)
+    primera = client.post("/simplex/solve-tabular", json=PROBLEMA).json()
+
+    llamadas = []
+    monkeypatch.setattr(rs, "resolver_simplex_tabular", lambda **kw: llamadas.append(kw))
+    segunda = client.post("/simplex/solve-tabular", json=PROBLEMA).json()
+    assert segunda == primera
+    assert llamadas == []
+
+
+def test_router_no_almacena_resultados_truncados(tmp_path, monkeypatch):
+    monkeypatch.setattr(rs, "ALMACEN", AlmacenResultados(str(tmp_path)))
+    llamadas = []
+
+    def _resolver_truncado(**kw):
+        llamadas.append(kw)
+        return {"status": "max_iterations_reached", "tablas": [], "solucion": None}
+
+    monkeypatch.setattr(rs, "resolver_simplex_tabular", _resolver_truncado)
+    client = TestClient(app)
+    for _ in range(2):
+        assert client.post("/simplex/solve-tabular", json=PROBLEMA).json()["status"] == "max_iterations_reached"
+    assert len(llamadas) == 2
+
+
+def test_router_usa_almacen_fuera_del_event_loop(tmp_path, monkeypatch):
+    en_event_loop = []
+
+    class AlmacenRegistrado(AlmacenResultados):
+        def _conectar(self):
+            try:
+                asyncio.get_running_loop()
+                en_event_loop.append(True)
+            except RuntimeError:
+                en_event_loop.append(False)
+            return super()._conectar()
+
+    monkeypatch.setattr(rs, "ALMACEN", AlmacenRegistrado(str(tmp_path)))
+    client = TestClient(app)
+    for _ in range(2):
+        assert client.post("/simplex/solve-tabular", json=PROBLEMA).status_code == 200
+        assert client.post("/simplex/generate-graph", json=PROBLEMA).status_code == 200
+    assert en_event_loop and not any(en_event_loop)
@@ -0,0 +1,57 @@
+from benchmarks.generadores import GENERADORES
+from benchmarks.suite import medir_solver, comparar
+from services import resolver_simplex_tabular
+
+
+def test_generadores_reproducibles_y_con_status_esperado():
+    esperados = {
+        "denso": "optimo",
+        "disperso": "optimo",
+        "degenerado": "optimo",
+        "infactible": "infactible",
+        "no_acotado": "no acotado",
+    }
+    for tipo, generador in GENERADORES.items():
+        problema = generador(8, 8, semilla=1)
+        assert problema == generador(8, 8, semilla=1)
+        res = resolver_simplex_tabular(
+            problema["problem_type"], problema["C"], problema["LI"], problema["LD"], problema["O"]
+        )
+        assert res["status"] == esperados[tipo], tipo
+
+
+def test_medir_solver_reporta_etapas():
+    problema = GENERADORES["infactible"](6, 6, semilla=0)
+    metricas, status = medir_solver(problema, repeticiones=1)
+    assert status == "infactible"
+    for clave in ("total", "estandarizacion", "fase_1", "fase_2", "formateo", "pivoteo"):
+        assert clave in metricas
+    assert metricas["fase_1"] > 0
+    assert metricas["total"] >= metricas["fase_1"]
+
+
+def test_comparar_detecta_regresiones():
+    base = {"casos": {"solver/denso/10x10": {"total": 0.010, "formateo": 0.00001}}}
+    actual = {"casos": {"solver/denso/10x10": {"total": 0.020, "formateo": 0.001}}}
+    regresiones = comparar(actual, base, umbral=0.5)
+    # El formateo base está por debajo del mínimo medible y se ignora
+    assert [(r["caso"], r["metrica"]) for r in regresiones] == [("solver/denso/10x10", "total")]
+    assert comparar(base, base) == []
+
+
+def test_medir_solver_marca_corridas_truncadas():
+    # El generador degenerado de 40x40 alcanza el límite de pivoteos por fase
+    _, status = medir_solver(GENERADORES["degenerado"](40, 40, semilla=0), repeticiones=1)
+    assert status == "max_iterations_reached"
+
+
+def test_comparar_falla_si_cambia_el_status():
+    base = {"casos": {"solver/disperso/80x80": {"total": 0.010}},
+            "estados": {"solver/disperso/80x80": "optimo"}}
+    actual = {"casos": {"solver/disperso/80x80": {"total": 0.005}},
+              "estados": {"solver/disperso/80x80": "max_iterations_reached"}}
+    regresiones = comparar(actual, base)
+    assert regresiones == [{
+        "caso": "solver/disperso/80x80", "metrica": "status",
+        "base": "optimo", "actual": "max_iterations_reached", "cambio": None,
+    }]
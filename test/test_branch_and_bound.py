@@ -0,0 +1,127 @@
+import itertools
+import unittest
+from unittest import mock
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from services import resolver_branch_and_bound
+import services.branch_and_bound as bb
+from routers.simplex import router
+
+
+class TestBranchAndBound(unittest.TestCase):
+
+    def test_entero_basico(self):
+        """
+        Max Z = 5x1 + 4x2
+            6x1 + 4x2 <= 24
+            1x1 + 2x2 <= 6
+            x1, x2 enteras
+            Relajación: x1=3, x2=1.5, Z=21. Entero: x1=4, x2=0, Z=20
+        """
+        res = resolver_branch_and_bound(
+            "maximization",
+            [5, 4],
+            [[6, 4], [1, 2]],
+            [24, 6],
+            ["<=", "<="],
+            enteras=[True, True]
+        )
+        self.assertEqual(res["status"], "optimo")
+        self.assertAlmostEqual(res["solucion"]["valor_optimo"], 20, places=6)
+        self.assertAlmostEqual(res["solucion"]["variables"]["x1"], 4, places=6)
+        self.assertAlmostEqual(res["solucion"]["variables"]["x2"], 0, places=6)
+        self.assertEqual(res["branch_and_bound"]["gap"], 0.0)
+        # Las tablas son las de la relajación raíz
+        self.assertTrue(res["tablas"])
+
+    def test_binarias(self):
+        res = resolver_branch_and_bound(
+            "maximization",
+            [5, 4, 3],
+            [[2, 3, 1], [4, 1, 2]],
+            [5, 11],
+            ["<=", "<="],
+            enteras=[False, False, False],
+            binarias=[True, True, True]
+        )
+        self.assertEqual(res["status"], "optimo")
+        self.assertAlmostEqual(res["solucion"]["valor_optimo"], 9, places=6)
+        # Las restricciones x <= 1 agregadas no aparecen en la solución
+        self.assertNotIn("s3", res["solucion"]["variables"])
+
+    def test_coincide_con_fuerza_bruta(self):
+        rng = np.random.default_rng(3)
+        for _ in range(10):
+            A = rng.integers(1, 10, (3, 3))
+            b = rng.integers(10, 30, 3)
+            c = rng.integers(1, 10, 3)
+            cotas = [int(min(b[i] / A[i, j] for i in range(3))) for j in range(3)]
+            mejor = max(
+                c @ np.array(x)
+                for x in itertools.product(*[range(u + 1) for u in cotas])
+                if np.all(A @ np.array(x) <= b)
+            )
+            for workers in (1, 2):
+                res = resolver_branch_and_bound(
+                    "maximization", c.tolist(), A.tolist(), b.tolist(), ["<="] * 3,
+                    enteras=[True] * 3, max_workers=workers
+                )
+                self.assertAlmostEqual(res["solucion"]["valor_optimo"], mejor, places=6)
+
+    def test_infactible_entero(self):
+        """2x1 = 1 no tiene solución entera."""
+        res = resolver_branch_and_bound("minimization", [1], [[2]], [1], ["="], enteras=[True])
+        self.assertEqual(res["status"], "infactible")
+        self.assertIsNone(res["solucion"])
+
+    def test_limite_nodos(self):
+        res = resolver_branch_and_bound(
+            "maximization", [1, 1], [[2, 2]], [3], ["<="], enteras=[True, True], limite_nodos=1
+        )
+        self.assertEqual(res["status"], "limite_nodos")
+        self.assertAlmostEqual(res["branch_and_bound"]["cota"], 1.5, places=6)
+
+    def test_nodo_sin_resolver_no_se_descarta(self):
+        """Si el Simplex Dual no resuelve un hijo, el resultado no se declara óptimo."""
+        evaluar = bb._evaluar_nodo
+
+        def _evaluar_con_limite(tableau, var_names, basic_vars, libres, variable, cota, sentido, nombre):
+            if sentido == ">=":
+                return "max_iterations_reached", tableau, var_names, basic_vars
+            return evaluar(tableau, var_names, basic_vars, libres, variable, cota, sentido, nombre)
+
+        with mock.patch.object(bb, "_evaluar_nodo", _evaluar_con_limite):
+            res = resolver_branch_and_bound(
+                "maximization", [5, 4], [[6, 4], [1, 2]], [24, 6], ["<=", "<="], enteras=[True, True]
+            )
+        # El óptimo entero (x1=4, Z=20) queda en una rama ">=" sin resolver
+        self.assertEqual(res["status"], "limite_iteraciones")
+        self.assertAlmostEqual(res["solucion"]["valor_optimo"], 19, places=6)
+        self.assertAlmostEqual(res["branch_and_bound"]["cota"], 21, places=6)
+
+
+class TestBranchAndBoundRoutes(unittest.TestCase):
+
+    def test_solve_tabular_entero(self):
+        app = FastAPI()
+        app.include_router(router)
+        client = TestClient(app)
+        payload = {
+            "problem_type": "maximization",
+            "C": [5, 4],
+            "LI": [[6, 4], [1, 2]],
+            "LD": [24, 6],
+            "O": ["<=", "<="],
+            "enteras": [True, True]
+        }
+        response = client.post("/simplex/solve-tabular", json=payload)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["status"], "optimo")
+        self.assertAlmostEqual(data["solucion"]["valor_optimo"], 20, places=3)
+        self.assertIn("branch_and_bound", data)
+
+
+if __name__ == "__main__":
+    unittest.main()
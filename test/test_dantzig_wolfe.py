@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from main import app
+from services import resolver_dantzig_wolfe, resolver_simplex_tabular
+from services.dantzig_wolfe import detectar_bloques
+
+
+def _bloque_angular(bloques=4, por_bloque=5, filas_bloque=3, filas_enlace=2, semilla=0):
+    """Bloques independientes unidos por `filas_enlace` restricciones densas (ajustadas)."""
+    rng = np.random.default_rng(semilla)
+    n = bloques * por_bloque
+    LI, LD = [], []
+    for _ in range(filas_enlace):
+        LI.append(rng.uniform(0, 1, n).tolist())
+        LD.append(float(bloques))
+    for k in range(bloques):
+        for _ in range(filas_bloque):
+            fila = [0.0] * n
+            fila[k * por_bloque:(k + 1) * por_bloque] = rng.uniform(0.5, 3, por_bloque).tolist()
+            LI.append(fila)
+            LD.append(float(rng.uniform(5, 15)))
+    return rng.uniform(1, 5, n).tolist(), LI, LD, ["<="] * len(LI)
+
+
+def test_detecta_bloques_y_filas_de_enlace():
+    _, LI, _, _ = _bloque_angular(bloques=3, filas_enlace=2)
+    bloques, enlace = detectar_bloques(LI)
+    assert enlace == [0, 1]
+    assert len(set(bloques)) == 3
+    assert detectar_bloques([[1, 1], [1, 2]]) is None
+
+
+@pytest.mark.parametrize("semilla", range(3))
+def test_coincide_con_simplex_tabular(semilla):
+    C, LI, LD, O = _bloque_angular(semilla=semilla)
+    resultado = resolver_dantzig_wolfe("maximization", C, LI, LD, O)
+    esperado = resolver_simplex_tabular("maximization", C, LI, LD, O)
+    assert resultado["status"] == "optimo"
+    assert resultado["dantzig_wolfe"]["iteraciones"] > 1
+    assert resultado["solucion"]["valor_optimo"] == pytest.approx(esperado["solucion"]["valor_optimo"], abs=1e-6)
+    # Las holguras siguen la nomenclatura del Simplex tabular
+    for nombre, valor in esperado["solucion"]["variables"].items():
+        if nombre.startswith("s"):
+            assert resultado["solucion"]["variables"][nombre] == pytest.approx(valor, abs=1e-5)
+
+
+def test_minimizacion_con_bloques_explicitos_y_pool():
+    C, LI, LD, O = _bloque_angular(bloques=3, semilla=4)
+    O[0], LD[0] = ">=", 2.0
+    etiquetas = [j // 5 for j in range(len(C))]
+    resultado = resolver_dantzig_wolfe("minimization", C, LI, LD, O, bloques=etiquetas, max_workers=2)
+    esperado = resolver_simplex_tabular("minimization", C, LI, LD, O)
+    assert resultado["solucion"]["valor_optimo"] == pytest.approx(esperado["solucion"]["valor_optimo"], abs=1e-6)
+
+
+def test_limite_de_iteraciones_sin_solucion():
+    C, LI, LD, O = _bloque_angular(semilla=0)
+    # Con una iteración el maestro todavía usa artificiales: no hay punto parcial
+    resultado = resolver_dantzig_wolfe("maximization", C, LI, LD, O, max_iteraciones=1)
+    assert resultado["status"] == "max_iterations_reached"
+    assert resultado["solucion"] is None and resultado["solucion_parcial"] is None
+
+    resultado = resolver_dantzig_wolfe("maximization", C, LI, LD, O, max_iteraciones=2)
+    esperado = resolver_simplex_tabular("maximization", C, LI, LD, O)
+    assert resultado["status"] == "max_iterations_reached"
+    assert resultado["solucion"] is None
+    # El punto parcial es factible: no supera al óptimo
+    assert resultado["solucion_parcial"]["valor_optimo"] <= esperado["solucion"]["valor_optimo"] + 1e-6
+
+
+def test_enlace_infactible():
+    C, LI, LD, O = _bloque_angular(bloques=2)
+    O[0], LD[0] = ">=", 1e6
+    assert resolver_dantzig_wolfe("maximization", C, LI, LD, O)["status"] == "infactible"
+
+
+def test_sin_estructura_resuelve_directo():
+    resultado = resolver_dantzig_wolfe(
+        "maximization", [3, 5], [[1, 1], [1, 2], [2, 1]], [4, 6, 6], ["<=", "<=", "<="]
+    )
+    assert resultado["dantzig_wolfe"] is None
+    assert resultado["solucion"]["valor_optimo"] == pytest.approx(16)
+
+
+def test_endpoint_dantzig_wolfe():
+    C, LI, LD, O = _bloque_angular(bloques=2)
+    r = TestClient(app).post("/simplex/solve-tabular", json={
+        "problem_type": "maximization", "C": C, "LI": LI, "LD": LD, "O": O, "metodo": "dantzig_wolfe",
+    })
+    assert r.status_code == 200
+    assert len(r.json()["dantzig_wolfe"]["bloques"]) == 2
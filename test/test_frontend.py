@@ -0,0 +1,58 @@
+import subprocess
+import sys
+from pathlib import Path
+from fastapi.testclient import TestClient
+from main import app
+from routers.frontend import brotli
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+# Presupuesto de tiempo para importar el router de la API (arranque en frío)
+PRESUPUESTO_IMPORTACION_S = 2.0
+
+
+def test_importar_api_no_carga_matplotlib_y_respeta_presupuesto():
+    codigo = (
+        "import sys, time\n"
+        "t = time.perf_counter()\n"
+        "import routers.simplex\n"
+        "print(time.perf_counter() - t)\n"
+        "print('matplotlib' in sys.modules)\n"
+    )
+    salida = subprocess.run(
+        [sys.executable, "-c", codigo], cwd=RAIZ, capture_output=True, text=True, check=True
+    ).stdout.split()
+    assert salida[1] == "False"
+    assert float(salida[0]) < PRESUPUESTO_IMPORTACION_S
+
+
+def test_paginas_desde_memoria_con_gzip_y_etag():
+    client = TestClient(app)
+    resp = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert resp.status_code == 200
+    assert resp.headers["content-encoding"] == "gzip"
+    assert resp.headers["vary"] == "Accept-Encoding"
+    assert resp.content == (RAIZ / "frontend/templates/index.html").read_bytes()
+
+    etag = resp.headers["etag"]
+    resp = client.get("/", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+
+    resp = client.get("/tablas", headers={"Accept-Encoding": "identity"})
+    assert resp.status_code == 200
+    assert "content-encoding" not in resp.headers
+    assert resp.headers["content-type"].startswith("text/html")
+
+
+def test_estaticos_precomprimidos():
+    client = TestClient(app)
+    resp = client.get("/static/css/style.css", headers={"Accept-Encoding": "gzip"})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/css")
+    assert resp.content == (RAIZ / "frontend/static/css/style.css").read_bytes()
+
+    if brotli is not None:
+        resp = client.get("/static/js/app.js", headers={"Accept-Encoding": "gzip, br"})
+        assert resp.headers["content-encoding"] == "br"
+
+    assert client.get("/static/no-existe.js").status_code == 404
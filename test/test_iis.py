@@ -0,0 +1,101 @@
+import io
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from main import app
+from services import resolver_simplex_tabular, leer_lp, resolver_modelo
+from services.iis import buscar_iis, soporte_farkas
+from services.simplex_service import _resolver_tableau
+
+# x1 + x2 <= 4, x1 >= 3 y x2 >= 2 están en conflicto; las demás sobran
+LI = [[1, 1], [1, 0], [1, 0], [0, 1], [2, 1]]
+LD = [4, 10, 3, 2, 20]
+O = ["<=", "<=", ">=", ">=", "<="]
+
+
+def _factible(filas, LI, LD, O):
+    return resolver_simplex_tabular(
+        "maximization", [0] * len(LI[0]), [LI[i] for i in filas], [LD[i] for i in filas],
+        [O[i] for i in filas], incluir_tablas=False
+    )["status"] == "optimo"
+
+
+def test_iis_conocido():
+    resultado = resolver_simplex_tabular("maximization", [1, 1], LI, LD, O, buscar_iis=True)
+    assert resultado["status"] == "infactible"
+    assert resultado["iis"] == [1, 3, 4]
+    assert resultado["iis_irreducible"] is True
+    assert "iis" not in resolver_simplex_tabular("maximization", [1, 1], LI, LD, O)
+
+
+def test_soporte_farkas_es_infactible():
+    diagnostico = {}
+    _resolver_tableau("maximization", [1, 1], LI, LD, O, diagnostico=diagnostico)
+    soporte = soporte_farkas(diagnostico, len(LI))
+    assert set(soporte) >= {0, 2, 3}
+    assert not _factible(soporte, LI, LD, O)
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_iis_minimo_en_problema_aleatorio(max_workers):
+    rng = np.random.default_rng(1)
+    A = rng.uniform(0, 1, (30, 6)).tolist() + [[1.0] * 6]
+    b = rng.uniform(1, 5, 30).tolist() + [100.0]
+    ops = ["<="] * 30 + [">="]
+    iis, irreducible = buscar_iis(6, A, b, ops, max_workers=max_workers)
+    assert irreducible
+    assert not _factible(iis, A, b, ops)
+    for i in iis:
+        assert _factible([j for j in iis if j != i], A, b, ops)
+
+
+def test_endpoint_devuelve_iis():
+    r = TestClient(app).post("/simplex/solve-tabular", json={
+        "problem_type": "maximization", "C": [1, 1], "LI": LI, "LD": LD, "O": O,
+        "buscar_iis": True,
+    })
+    assert r.json()["iis"] == [1, 3, 4]
+
+
+def test_iis_es_opcional_en_el_endpoint():
+    r = TestClient(app).post("/simplex/solve-tabular", json={
+        "problem_type": "maximization", "C": [1, 1], "LI": LI, "LD": LD, "O": O,
+    })
+    assert r.json()["status"] == "infactible"
+    assert "iis" not in r.json()
+
+
+def test_iis_de_una_sola_fila_contradictoria():
+    # x1 + x2 <= -1 es infactible por sí sola: al quitarla no queda ninguna fila
+    resultado = resolver_simplex_tabular(
+        "maximization", [1, 1], [[1, 1], [1, 0]], [-1, 5], ["<=", "<="], buscar_iis=True
+    )
+    assert resultado["iis"] == [1]
+    assert resultado["iis_irreducible"] is True
+
+
+def test_prueba_indecidible_no_certifica(monkeypatch):
+    import services.iis as iis
+
+    probar = iis._probar_filas
+
+    def _probar_con_limite(num_vars, LI, LD, O, signos):
+        if len(LI) < 3:
+            return "max_iterations_reached", None
+        return probar(num_vars, LI, LD, O, signos)
+
+    monkeypatch.setattr(iis, "_probar_filas", _probar_con_limite)
+    filas, irreducible = iis.buscar_iis(2, LI, LD, O)
+    assert sorted(filas) == [0, 2, 3]
+    assert irreducible is False
+
+
+def test_modelo_lp_con_nombres():
+    modelo = leer_lp(io.StringIO(
+        "Maximize\n obj: x + y\nSubject To\n techo: x + y <= 4\n"
+        " libre: x - y <= 100\n minx: x >= 3\n miny: y >= 2\nEnd\n"
+    ))
+    assert "iis" not in resolver_modelo(modelo)
+    resultado = resolver_modelo(modelo, buscar_iis=True)
+    assert resultado["status"] == "infactible"
+    assert sorted(resultado["iis"]) == ["minx", "miny", "techo"]
@@ -0,0 +1,193 @@
+import io
+import unittest
+from unittest import mock
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from services import leer_mps, leer_lp, resolver_modelo
+from routers.simplex import router
+import routers.simplex as simplex_router
+
+MPS = """NAME          EJEMPLO
+* Max Z = 3x + 5y (caso básico)
+OBJSENSE
+    MAX
+ROWS
+ N  obj
+ L  c1
+ L  c2
+ L  c3
+COLUMNS
+    x         obj       3.0        c1        1.0
+    x         c3        3.0
+    y         obj       5.0        c2        2.0
+    y         c3        2.0
+RHS
+    RHS       c1        4.0        c2        12.0
+    RHS       c3        18.0
+BOUNDS
+ UP BND       x         10
+ENDATA
+"""
+
+LP = """\\ Max Z = 3x + 5y (caso básico)
+Maximize
+ obj: 3 x + 5 y
+Subject To
+ c1: x <= 4
+ c2: 2 y
+     <= 12
+ c3: 3 x + 2 y <= 18
+Bounds
+ 0 <= x <= 10
+End
+"""
+
+
+class TestLectorModelos(unittest.TestCase):
+
+    def test_mps(self):
+        modelo = leer_mps(io.StringIO(MPS))
+        self.assertEqual(modelo["nombre"], "EJEMPLO")
+        self.assertEqual(modelo["problem_type"], "maximization")
+        self.assertEqual(modelo["nombres_restricciones"], ["c1", "c2", "c3", "x.up"])
+        self.assertIsInstance(modelo["LI"], np.ndarray)
+        np.testing.assert_array_equal(modelo["LI"], [[1, 0], [0, 2], [3, 2], [1, 0]])
+
+        res = resolver_modelo(modelo)
+        self.assertEqual(res["status"], "optimo")
+        self.assertAlmostEqual(res["solucion"]["valor_optimo"], 36, places=6)
+        self.assertAlmostEqual(res["solucion"]["variables"]["x"], 2, places=6)
+        self.assertAlmostEqual(res["solucion"]["variables"]["y"], 6, places=6)
+        self.assertAlmostEqual(res["solucion"]["restricciones"]["x.up"], 8, places=6)
+
+    def test_lp_equivale_a_mps(self):
+        modelo_lp = leer_lp(io.BytesIO(LP.encode("utf-8")))
+        modelo_mps = leer_mps(io.StringIO(MPS))
+        for clave in ("C", "LI", "LD"):
+            np.testing.assert_array_equal(modelo_lp[clave], modelo_mps[clave])
+        self.assertEqual(modelo_lp["O"], modelo_mps["O"])
+
+    def test_cotas_enteras_y_rangos(self):
+        mps = """NAME TEST
+ROWS
+ N  costo
+ G  demanda
+ E  balance
+COLUMNS
+    MARKER    'MARKER'    'INTORG'
+    a         costo     1.0        demanda   2.0
+    MARKER    'MARKER'    'INTEND'
+    b         costo     1.0        demanda   1.0
+    b         balance   1.0
+RHS
+    RHS       demanda   3.0        balance   1.0
+    RHS       costo     -10.0
+RANGES
+    RNG       balance   4.0
+BOUNDS
+ FR BND       b
+ENDATA
+"""
+        modelo = leer_mps(io.StringIO(mps))
+        self.assertEqual(modelo["problem_type"], "minimization")
+        self.assertEqual(modelo["enteras"], [True, False])
+        self.assertEqual(modelo["signos"], [">=0", "libre"])
+        # balance con rango 4 -> 1 <= b <= 5
+        self.assertEqual(modelo["O"], [">=", ">=", "<="])
+        self.assertEqual(list(modelo["LD"]), [3.0, 1.0, 5.0])
+        self.assertEqual(modelo["constante_objetivo"], 10.0)
+
+        res = resolver_modelo(modelo)
+        self.assertEqual(res["status"], "optimo")
+        # a entera: a=1, b=1 -> costo 2 + 10
+        self.assertAlmostEqual(res["solucion"]["valor_optimo"], 12, places=6)
+
+    def test_lp_generales_binarias_y_libres(self):
+        lp = """Minimize
+ costo: 2 x + 3 y - z
+Subject To
+ r1: x + y + z >= 2.5
+ r2: z <= 1
+Bounds
+ y free
+ -5 <= z <= 1
+Generals
+ x
+Binary
+ y
+End
+"""
+        modelo = leer_lp(io.StringIO(lp))
+        self.assertEqual(modelo["nombres_variables"], ["x", "y", "z"])
+        self.assertEqual(modelo["enteras"], [True, True, False])
+        res = resolver_modelo(modelo)
+        self.assertEqual(res["status"], "optimo")
+        # z = 1, x + y >= 1.5 con x entera y y binaria -> x=1, y=1 (costo 5) o x=2, y=0 (4)
+        self.assertAlmostEqual(res["solucion"]["valor_optimo"], 3, places=6)
+
+    def test_formato_invalido(self):
+        with self.assertRaises(ValueError):
+            leer_lp(io.StringIO("Maximize\n obj: 3 x +\nSubject To\n c1: x <=\nEnd\n"))
+
+
+class TestLectorModelosRoutes(unittest.TestCase):
+
+    def test_upload_model(self):
+        app = FastAPI()
+        app.include_router(router)
+        client = TestClient(app)
+        response = client.post(
+            "/simplex/upload-model",
+            files={"archivo": ("ejemplo.mps", MPS.encode("utf-8"), "text/plain")},
+        )
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["status"], "optimo")
+        self.assertEqual(data["modelo"], "EJEMPLO")
+        self.assertAlmostEqual(data["solucion"]["variables"]["y"], 6, places=3)
+        self.assertNotIn("tablas", data)
+
+        response = client.post(
+            "/simplex/upload-model",
+            files={"archivo": ("modelo.txt", LP.encode("utf-8"), "text/plain")},
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_upload_model_entero(self):
+        app = FastAPI()
+        app.include_router(router)
+        client = TestClient(app)
+        lp = """Maximize
+ obj: 5 x + 4 y
+Subject To
+ c1: 6 x + 4 y <= 24
+ c2: x + 2 y <= 6
+Generals
+ x y
+End
+"""
+        for parametros in ("", "?buscar_iis=true"):
+            response = client.post(
+                f"/simplex/upload-model{parametros}",
+                files={"archivo": ("entero.lp", lp.encode("utf-8"), "text/plain")},
+            )
+            self.assertEqual(response.status_code, 200)
+            data = response.json()
+            self.assertEqual(data["status"], "optimo")
+            self.assertAlmostEqual(data["solucion"]["valor_optimo"], 20, places=6)
+
+    def test_upload_model_demasiado_grande(self):
+        app = FastAPI()
+        app.include_router(router)
+        client = TestClient(app)
+        with mock.patch.object(simplex_router, "MAX_UPLOAD_BYTES", 16):
+            response = client.post(
+                "/simplex/upload-model",
+                files={"archivo": ("ejemplo.mps", MPS.encode("utf-8"), "text/plain")},
+            )
+        self.assertEqual(response.status_code, 413)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import asyncio
+import time
+import httpx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import routers.perfilado as perfilado
+import routers.simplex as rs
+from routers import router, perfilado_router, MiddlewarePerfilado
+
+PROBLEMA = {
+    "problem_type": "maximization",
+    "C": [3, 5],
+    "LI": [[1, 0], [0, 2], [3, 2]],
+    "LD": [4, 12, 18],
+    "O": ["<=", "<=", "<="],
+}
+
+
+def _app():
+    app = FastAPI()
+    app.include_router(router)
+    app.include_router(perfilado_router)
+    app.add_middleware(MiddlewarePerfilado)
+    return TestClient(app)
+
+
+def _resolucion_lenta(**kwargs):
+    fin = time.perf_counter() + 0.1
+    while time.perf_counter() < fin:
+        pass
+    return {"status": "optimo", "tablas": [], "solucion": None}
+
+
+def test_perfil_de_una_solicitud(monkeypatch):
+    monkeypatch.setattr(perfilado, "TOKENS_PERFIL", {"secreto"})
+    monkeypatch.setattr(rs, "resolver_simplex_tabular", _resolucion_lenta)
+    client = _app()
+
+    r = client.post("/simplex/solve-tabular", json=PROBLEMA, headers={"X-Simplex-Perfil": "secreto"})
+    id_perfil = r.headers["x-simplex-perfil-id"]
+
+    resumen = client.get(f"/simplex/perfiles/{id_perfil}?perfilar=secreto").json()
+    assert resumen["muestras"] > 0
+    assert resumen["solicitudes_solapadas"] == 0
+    assert "_resolucion_lenta" in [f["funcion"] for f in resumen["funciones"][:3]]
+
+    plegado = client.get(f"/simplex/perfiles/{id_perfil}?formato=folded", headers={"X-Simplex-Perfil": "secreto"}).text
+    linea = plegado.splitlines()[0]
+    pila, cuenta = linea.rsplit(" ", 1)
+    assert int(cuenta) > 0 and ";" in pila
+
+
+def test_perfil_compartido_entre_workers(monkeypatch, tmp_path):
+    monkeypatch.setattr(perfilado, "TOKENS_PERFIL", {"secreto"})
+    monkeypatch.setattr(perfilado, "DIR_PERFILES", str(tmp_path / "perfiles"))
+    monkeypatch.setattr(rs, "resolver_simplex_tabular", _resolucion_lenta)
+    client = _app()
+
+    r = client.post("/simplex/solve-tabular", json=PROBLEMA, headers={"X-Simplex-Perfil": "secreto"})
+    id_perfil = r.headers["x-simplex-perfil-id"]
+    # Otro worker no tiene el perfil en memoria: lo lee del directorio compartido
+    monkeypatch.setattr(perfilado, "PERFILES", perfilado.OrderedDict())
+
+    resumen = client.get(f"/simplex/perfiles/{id_perfil}?perfilar=secreto").json()
+    assert resumen["muestras"] > 0
+    assert "_resolucion_lenta" in [f["funcion"] for f in resumen["funciones"][:3]]
+    assert client.get("/simplex/perfiles/..%2Fperfiles?perfilar=secreto").status_code == 404
+
+
+def test_perfil_registra_solicitudes_solapadas(monkeypatch):
+    # El event loop es compartido: el perfil indica cuántas otras solicitudes
+    # se atendieron mientras se tomaba
+    monkeypatch.setattr(perfilado, "TOKENS_PERFIL", {"secreto"})
+    app = FastAPI()
+    app.include_router(perfilado_router)
+    app.add_middleware(MiddlewarePerfilado)
+    liberar = asyncio.Event()
+
+    @app.get("/lenta")
+    async def lenta():
+        await liberar.wait()
+        return {}
+
+    @app.get("/rapida")
+    async def rapida():
+        return {}
+
+    async def escenario():
+        transporte = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transporte, base_url="http://test") as client:
+            perfilada = asyncio.create_task(client.get("/lenta", headers={"X-Simplex-Perfil": "secreto"}))
+            await asyncio.sleep(0.05)
+            await client.get("/rapida")
+            await client.get("/rapida")
+            liberar.set()
+            r = await perfilada
+            id_perfil = r.headers["x-simplex-perfil-id"]
+            return (await client.get(f"/simplex/perfiles/{id_perfil}?perfilar=secreto")).json()
+
+    resumen = asyncio.run(escenario())
+    assert resumen["solicitudes_solapadas"] == 2
+    assert perfilado._EN_CURSO == 0 and not perfilado._SOLAPADAS
+
+
+def test_sin_token_valido_no_se_perfila(monkeypatch):
+    monkeypatch.setattr(perfilado, "TOKENS_PERFIL", {"secreto"})
+    client = _app()
+    r = client.post("/simplex/solve-tabular", json=PROBLEMA, headers={"X-Simplex-Perfil": "otro"})
+    assert r.status_code == 200
+    assert "x-simplex-perfil-id" not in r.headers
+    assert client.get("/simplex/perfiles/cualquiera?perfilar=otro").status_code == 403
+
+
+def test_deshabilitado_sin_tokens():
+    # Con la configuración por defecto la app principal no registra el middleware
+    from main import app
+    assert not perfilado.perfilado_habilitado()
+    assert all(m.cls is not MiddlewarePerfilado for m in app.user_middleware)
@@ -0,0 +1,136 @@
+import numpy as np
+import pytest
+from services import LinearProgram, resolver_simplex_tabular
+
+
+def _comparar(programa, resultado):
+    """El resultado reoptimizado coincide con resolver el modelo actual desde cero."""
+    esperado = resolver_simplex_tabular(
+        programa.problem_type, programa.C, programa._LI, programa._LD, list(programa._O), programa.signos
+    )
+    assert resultado["status"] == esperado["status"]
+    if esperado["status"] == "optimo":
+        assert resultado["solucion"]["valor_optimo"] == pytest.approx(esperado["solucion"]["valor_optimo"], abs=1e-6)
+
+
+def _wyndor():
+    return LinearProgram.desde_listas(
+        "maximization", [3, 5], [[1, 0], [0, 2], [3, 2]], [4, 12, 18], ["<=", "<=", "<="]
+    )
+
+
+def test_no_modifica_operadores_del_llamador():
+    O = ["<=", ">="]
+    resolver_simplex_tabular("maximization", [1, 1], [[1, 1], [1, 0]], [-1, -5], O)
+    assert O == ["<=", ">="]
+
+
+def test_primera_resolucion_y_reoptimizacion():
+    programa = _wyndor()
+    primera = programa.solve()
+    assert primera["reoptimizado"] is False
+    assert primera["solucion"]["valor_optimo"] == pytest.approx(36)
+    assert primera["tablas"] == []
+
+    programa.set_objective([5, 1])
+    r = programa.solve()
+    assert r["reoptimizado"] is True
+    assert r["solucion"]["variables"]["x1"] == pytest.approx(4)
+    _comparar(programa, r)
+
+
+def test_set_rhs_usa_simplex_dual():
+    programa = _wyndor()
+    ids = programa.restricciones
+    programa.solve()
+    programa.set_rhs(ids[2], 12)
+    r = programa.solve()
+    assert r["reoptimizado"] is True
+    _comparar(programa, r)
+
+
+def test_agregar_y_quitar_restricciones():
+    programa = _wyndor()
+    programa.solve()
+    nueva = programa.add_constraint([1, 1], "<=", 5)
+    r = programa.solve()
+    assert r["reoptimizado"] is True
+    assert "s4" in r["solucion"]["variables"]
+    _comparar(programa, r)
+
+    programa.remove_constraint(programa.restricciones[0])
+    r = programa.solve()
+    assert "s4" not in r["solucion"]["variables"]
+    _comparar(programa, r)
+
+    programa.remove_constraint(nueva)
+    _comparar(programa, programa.solve())
+
+
+def test_restriccion_que_vuelve_infactible():
+    programa = _wyndor()
+    programa.solve()
+    programa.add_constraint([1, 1], ">=", 100)
+    assert programa.solve()["status"] == "infactible"
+
+
+def test_igualdad_nueva_resuelve_desde_cero():
+    programa = _wyndor()
+    programa.solve()
+    programa.add_constraint([1, -1], "=", 0)
+    r = programa.solve()
+    assert r["reoptimizado"] is False
+    _comparar(programa, r)
+
+
+def test_secuencia_aleatoria_coincide_con_resolver_desde_cero():
+    rng = np.random.default_rng(3)
+    n = 5
+    programa = LinearProgram("maximization", rng.uniform(1, 5, n).tolist(), signos=[">=0", ">=0", "libre", ">=0", "<=0"])
+    programa.add_constraint([1.0] * n, "<=", 50)
+    programa.add_constraint([1.0, 0, -1.0, 0, 0], "<=", 10)
+    programa.add_constraint([0, 0, 1.0, 0, 0], "<=", 10)
+    programa.add_constraint([0, 0, 0, 0, -1.0], "<=", 10)
+    for _ in range(8):
+        programa.add_constraint(rng.uniform(0, 3, n).tolist(), "<=", float(rng.uniform(10, 30)))
+
+    reoptimizadas = 0
+    for paso in range(60):
+        accion = paso % 4
+        ids = programa.restricciones
+        if accion == 0:
+            programa.set_objective(rng.uniform(-1, 5, n).tolist())
+        elif accion == 1:
+            programa.set_rhs(ids[int(rng.integers(4, len(ids)))], float(rng.uniform(5, 30)))
+        elif accion == 2:
+            programa.add_constraint(rng.uniform(0, 3, n).tolist(), "<=", float(rng.uniform(10, 30)))
+        elif len(ids) > 8:
+            programa.remove_constraint(ids[int(rng.integers(4, len(ids)))])
+        r = programa.solve()
+        reoptimizadas += r["reoptimizado"]
+        _comparar(programa, r)
+    assert reoptimizadas > 40
+
+
+def test_modificaciones_actualizan_el_tableau_sin_refactorizar(monkeypatch):
+    programa = _wyndor()
+    programa.solve()
+    programa.solve()  # primera reoptimización: el tableau queda vigente
+
+    def _sin_refactorizar():
+        raise AssertionError("se refactorizó la base")
+
+    monkeypatch.setattr(programa, "_tableau_desde_base", _sin_refactorizar)
+    ids = programa.restricciones
+    for cambio in (
+        lambda: programa.set_objective([5, 1]),
+        lambda: programa.set_rhs(ids[2], 12),
+        lambda: programa.add_constraint([1, 1], "<=", 5),
+        lambda: programa.add_constraint([1, 0], ">=", 1),
+        lambda: programa.set_rhs(ids[0], 3),
+        lambda: programa.set_objective([1, 4], "minimization"),
+    ):
+        cambio()
+        r = programa.solve()
+        assert r["reoptimizado"] is True
+        _comparar(programa, r)
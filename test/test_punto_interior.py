@@ -0,0 +1,123 @@
+import unittest
+from unittest import mock
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from services import resolver_simplex_tabular, resolver_punto_interior
+from routers.simplex import router
+import services.punto_interior as punto_interior
+
+
+class TestPuntoInterior(unittest.TestCase):
+
+    def test_basico_con_crossover(self):
+        """
+        Max Z = 3x1 + 5x2 (mismo caso básico del Simplex)
+            Solución: x1=2, x2=6, Z=36
+        """
+        res = resolver_punto_interior(
+            "maximization",
+            [3, 5],
+            [[1, 0], [0, 2], [3, 2]],
+            [4, 12, 18],
+            ["<=", "<=", "<="]
+        )
+        self.assertEqual(res["status"], "optimo")
+        self.assertAlmostEqual(res["solucion"]["valor_optimo"], 36, places=6)
+        self.assertAlmostEqual(res["solucion"]["variables"]["x1"], 2, places=6)
+        self.assertAlmostEqual(res["solucion"]["variables"]["x2"], 6, places=6)
+        self.assertEqual(set(res["solucion"]["variables"]), {"x1", "x2", "s1", "s2", "s3"})
+        self.assertTrue(res["crossover"])
+
+    def test_crossover_fallido_retorna_punto_interior(self):
+        with mock.patch.object(punto_interior, "_crossover", return_value=None):
+            res = resolver_punto_interior(
+                "maximization", [3, 5], [[1, 0], [0, 2], [3, 2]], [4, 12, 18], ["<=", "<=", "<="]
+            )
+        self.assertEqual(res["status"], "optimo")
+        self.assertFalse(res["crossover"])
+        self.assertEqual(res["tablas"], [])
+        self.assertAlmostEqual(res["solucion"]["valor_optimo"], 36, places=5)
+
+    def test_crossover_sin_tablas(self):
+        with mock.patch.object(
+            punto_interior, "_ejecutar_iteraciones_simplex",
+            wraps=punto_interior._ejecutar_iteraciones_simplex
+        ) as iteraciones:
+            res = resolver_punto_interior(
+                "maximization", [3, 5], [[1, 0], [0, 2], [3, 2]], [4, 12, 18], ["<=", "<=", "<="],
+                incluir_tablas=False
+            )
+        self.assertTrue(res["crossover"])
+        self.assertEqual(res["tablas"], [])
+        self.assertFalse(iteraciones.call_args.kwargs["registrar_tablas"])
+        self.assertAlmostEqual(res["solucion"]["valor_optimo"], 36, places=6)
+
+    def test_minimizacion_sin_crossover(self):
+        res = resolver_punto_interior(
+            "minimization",
+            [4, 1],
+            [[3, 1], [4, 3], [1, 2]],
+            [3, 6, 4],
+            ["=", ">=", "<="],
+            crossover=False
+        )
+        self.assertEqual(res["status"], "optimo")
+        self.assertEqual(res["tablas"], [])
+        self.assertFalse(res["crossover"])
+        self.assertAlmostEqual(res["solucion"]["valor_optimo"], 3.4, places=5)
+        self.assertAlmostEqual(res["solucion"]["variables"]["x1"], 0.4, places=5)
+
+    def test_variable_libre(self):
+        res = resolver_punto_interior(
+            "minimization",
+            [1, 1],
+            [[1, 1], [1, -1]],
+            [-4, 2],
+            [">=", "<="],
+            signos=[">=0", "libre"]
+        )
+        self.assertEqual(res["status"], "optimo")
+        self.assertAlmostEqual(res["solucion"]["variables"]["x2"], -2, places=6)
+
+    def test_infactible_y_no_acotado(self):
+        res = resolver_punto_interior("maximization", [2, 3], [[1, 1], [1, 1]], [2, 5], ["<=", ">="])
+        self.assertEqual(res["status"], "infactible")
+        res = resolver_punto_interior("maximization", [2, 3], [[1, -1]], [2], ["<="])
+        self.assertEqual(res["status"], "no acotado")
+
+    def test_coincide_con_tableau_en_problema_aleatorio(self):
+        rng = np.random.default_rng(1)
+        A = rng.uniform(0.1, 1.0, (30, 40))
+        b = rng.uniform(1.0, 10.0, 30)
+        c = rng.uniform(1.0, 5.0, 40)
+        args = ("maximization", c.tolist(), A.tolist(), b.tolist())
+        ref = resolver_simplex_tabular(*args, ["<="] * 30)
+        res = resolver_punto_interior(*args, ["<="] * 30)
+        self.assertEqual(res["status"], "optimo")
+        self.assertAlmostEqual(res["solucion"]["valor_optimo"], ref["solucion"]["valor_optimo"], places=6)
+
+
+class TestPuntoInteriorRoutes(unittest.TestCase):
+
+    def test_solve_tabular_punto_interior(self):
+        app = FastAPI()
+        app.include_router(router)
+        client = TestClient(app)
+        payload = {
+            "problem_type": "maximization",
+            "C": [3, 5],
+            "LI": [[1, 0], [0, 2], [3, 2]],
+            "LD": [4, 12, 18],
+            "O": ["<=", "<=", "<="],
+            "metodo": "punto_interior"
+        }
+        response = client.post("/simplex/solve-tabular", json=payload)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["status"], "optimo")
+        self.assertAlmostEqual(data["solucion"]["valor_optimo"], 36, places=3)
+
+
+if __name__ == "__main__":
+    unittest.main()
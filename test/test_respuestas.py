@@ -0,0 +1,69 @@
+import gzip
+import json
+import numpy as np
+from fastapi.testclient import TestClient
+from main import app
+import routers.respuestas as respuestas
+from services.simplex_service import _formatear_tableau
+
+PROBLEMA_GRANDE = {
+    "problem_type": "maximization",
+    "C": [3, 5, 4, 2, 6, 1],
+    "LI": [[1, 2, 1, 0, 3, 1], [2, 1, 0, 3, 1, 2], [1, 1, 2, 1, 1, 1], [3, 0, 1, 2, 2, 1]],
+    "LD": [10, 12, 8, 15],
+    "O": ["<=", "<=", "<=", "<="],
+}
+
+
+def test_formatear_tableau_redondea_a_floats_de_python():
+    tabla = _formatear_tableau(
+        np.array([[1 / 3, 2.0], [0.1234567891, -5.0]], dtype=np.float32), ["x1"], ["x1"], "T"
+    )
+    assert tabla["filas"] == [["x1", 0.333333, 2.0]]
+    assert tabla["fila_obj"] == ["Z", 0.123457, -5.0]
+    assert all(type(v) is float for v in tabla["fila_obj"][1:])
+
+
+def test_serializar_numpy_con_y_sin_orjson(monkeypatch):
+    contenido = {"a": np.arange(3, dtype=np.float64), "b": np.float32(1.5), "c": [1, "x"]}
+    esperado = {"a": [0.0, 1.0, 2.0], "b": 1.5, "c": [1, "x"]}
+    assert json.loads(respuestas.serializar_json(contenido)) == esperado
+    monkeypatch.setattr(respuestas, "orjson", None)
+    assert json.loads(respuestas.serializar_json(contenido)) == esperado
+
+
+def test_solve_tabular_comprime_segun_accept_encoding():
+    client = TestClient(app)
+    sin = client.post("/simplex/solve-tabular", json=PROBLEMA_GRANDE, headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in sin.headers
+
+    con = client.post("/simplex/solve-tabular", json=PROBLEMA_GRANDE, headers={"Accept-Encoding": "gzip"})
+    assert con.headers["content-encoding"] == "gzip"
+    assert con.json() == sin.json()
+    assert int(con.headers["content-length"]) < len(sin.content)
+
+
+def test_respuesta_pequena_sin_comprimir():
+    client = TestClient(app)
+    r = client.post(
+        "/simplex/solve-tabular",
+        json={"problem_type": "maximization", "C": [1], "LI": [[1]], "LD": [1], "O": ["<="]},
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert len(r.content) < respuestas.UMBRAL_COMPRESION
+    assert "content-encoding" not in r.headers
+
+
+def test_zstd_preferido_si_disponible(monkeypatch):
+    class _Zstd:
+        class ZstdCompressor:
+            def __init__(self, level):
+                pass
+
+            def compress(self, datos):
+                return b"zstd:" + gzip.compress(datos)
+
+    monkeypatch.setattr(respuestas, "zstandard", _Zstd)
+    client = TestClient(app)
+    r = client.post("/simplex/solve-tabular", json=PROBLEMA_GRANDE, headers={"Accept-Encoding": "gzip, zstd"})
+    assert r.headers["content-encoding"] == "zstd"
@@ -196,6 +196,110 @@ class TestSimplexTabular(unittest.TestCase):
         self.assertAlmostEqual(res["solucion"]["variables"]["x1"], 2, places=3)
         self.assertAlmostEqual(res["solucion"]["variables"]["x2"], 0, places=3)
 
+    def test_variable_libre(self):
+        """
+        Variable libre (sin restricción de signo)
+            Min Z = x1 + x2
+            x1 + x2 >= -4
+            x1 - x2 <= 2
+            x1 >= 0, x2 libre
+            Solución: x1=0, x2=-2, Z=-2
+        """
+        res = resolver_simplex_tabular(
+            "minimization",
+            [1, 1],
+            [[1, 1], [1, -1]],
+            [-4, 2],
+            [">=", "<="],
+            signos=[">=0", "libre"]
+        )
+        self.assertEqual(res["status"], "optimo")
+        self.assertAlmostEqual(res["solucion"]["valor_optimo"], -2, places=3)
+        self.assertAlmostEqual(res["solucion"]["variables"]["x1"], 0, places=3)
+        self.assertAlmostEqual(res["solucion"]["variables"]["x2"], -2, places=3)
+        # El tableau no se ensancha con columnas x+ / x-
+        self.assertEqual(res["tablas"][0]["headers"].count("x2"), 1)
+
+    def test_variables_libres_no_acotado(self):
+        """
+        Max Z = x1 con x1 libre y sin cota superior
+            x1 >= -3
+        """
+        res = resolver_simplex_tabular(
+            "maximization",
+            [1],
+            [[1]],
+            [-3],
+            [">="],
+            signos=["libre"]
+        )
+        self.assertEqual(res["status"], "no acotado")
+
+    def test_variable_no_positiva(self):
+        """
+        Variable no positiva
+            Max Z = 2x1 + x2
+            x1 + x2 <= 5
+            x1 - x2 <= 8
+            x1 >= 0, x2 <= 0
+            Solución: x1=6.5, x2=-1.5, Z=11.5
+        """
+        res = resolver_simplex_tabular(
+            "maximization",
+            [2, 1],
+            [[1, 1], [1, -1]],
+            [5, 8],
+            ["<=", "<="],
+            signos=[">=0", "<=0"]
+        )
+        self.assertEqual(res["status"], "optimo")
+        self.assertAlmostEqual(res["solucion"]["valor_optimo"], 11.5, places=3)
+        self.assertAlmostEqual(res["solucion"]["variables"]["x1"], 6.5, places=3)
+        self.assertAlmostEqual(res["solucion"]["variables"]["x2"], -1.5, places=3)
+
+    def test_signos_longitud_invalida(self):
+        with self.assertRaises(ValueError):
+            resolver_simplex_tabular(
+                "maximization", [1, 1], [[1, 1]], [1], ["<="], signos=["libre"]
+            )
+
+    def test_ld_negativo_invierte_desigualdad(self):
+        """
+            Max Z = x1 + 2x2
+            x1 + x2 <= 4
+            -x1 >= -3   (equivale a x1 <= 3, holgura s2)
+            x2 <= 1     (holgura s3)
+            Solución: x1=3, x2=1, Z=5
+        """
+        res = resolver_simplex_tabular(
+            "maximization",
+            [1, 2],
+            [[1, 1], [-1, 0], [0, 1]],
+            [4, -3, 1],
+            ["<=", ">=", "<="]
+        )
+        self.assertEqual(res["status"], "optimo")
+        self.assertAlmostEqual(res["solucion"]["valor_optimo"], 5, places=6)
+        self.assertEqual(set(res["solucion"]["variables"]), {"x1", "x2", "s1", "s2", "s3"})
+
+    def test_precision_float32(self):
+        """El tableau en float32 llega a la misma solución (dos fases)."""
+        args = ("minimization", [4, 1], [[3, 1], [4, 3], [1, 2]], [3, 6, 4])
+        res = resolver_simplex_tabular(*args, ["=", ">=", "<="], dtype="float32")
+        self.assertEqual(res["status"], "optimo")
+        self.assertAlmostEqual(res["solucion"]["valor_optimo"], 3.4, places=4)
+        self.assertIsInstance(res["tablas"][-1]["fila_obj"][-1], float)
+
+    def test_fase_2_es_vista_del_espacio_de_trabajo(self):
+        from services.simplex_service import _resolver_tableau
+        _, estado = _resolver_tableau(
+            "minimization", [4, 1], [[3, 1], [4, 3], [1, 2]], [3, 6, 4], ["=", ">=", "<="]
+        )
+        # La Fase 2 no copia: el tableau final es una vista sin artificiales
+        self.assertIsNotNone(estado["tableau"].base)
+        self.assertEqual(estado["tableau"].shape, (4, 5))
+        self.assertNotIn("a1", estado["var_names"])
+
 class TestSimplexRoutes(unittest.TestCase):
 
     def setUp(self):
@@ -221,6 +325,22 @@ class TestSimplexRoutes(unittest.TestCase):
         self.assertAlmostEqual(data["solucion"]["variables"]["x1"], 2, places=3)
         self.assertAlmostEqual(data["solucion"]["variables"]["x2"], 6, places=3)
 
+    def test_solve_tabular_con_signos(self):
+        payload = {
+            "problem_type": "minimization",
+            "C": [1, 1],
+            "LI": [[1, 1], [1, -1]],
+            "LD": [-4, 2],
+            "O": [">=", "<="],
+            "signos": [">=0", "libre"]
+        }
+
+        response = self.client.post("/simplex/solve-tabular", json=payload)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["status"], "optimo")
+        self.assertAlmostEqual(data["solucion"]["variables"]["x2"], -2, places=3)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file